@@ -0,0 +1,178 @@
+"""List implemented using a growable ArrayR"""
+from __future__ import annotations
+__docformat__ = 'reStructuredText'
+
+from typing import Generic, Iterable, Iterator
+from referential_array import ArrayR, T
+
+
+class ArrayList(Generic[T]):
+    """
+    Sequence of elements in positions 0 to length - 1 of an ArrayR.
+    A full list doubles its capacity, so append is amortised O(1). insert and delete_at_index
+    shift the elements after the position in one bulk copy_into instead of one at a time.
+    """
+    MIN_CAPACITY = 1
+
+    def __init__(self, max_capacity: int = 1, shrinkable: bool = True) -> None:
+        """
+        :param max_capacity: initial number of elements the list can hold before growing
+        :param shrinkable: if True, the capacity is halved once the list is a quarter full
+        :complexity: O(max_capacity)
+        """
+        self.length = 0
+        self.shrinkable = shrinkable
+        self.array = ArrayR(max(self.MIN_CAPACITY, max_capacity))
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[T], shrinkable: bool = True) -> ArrayList[T]:
+        """ Creates a list holding the given values, without spare capacity.
+            :complexity: O(n) for n values
+        """
+        values = list(values)
+        array_list = cls(len(values), shrinkable)
+        array_list.extend(values)
+        return array_list
+
+    def __len__(self) -> int:
+        return self.length
+
+    def is_empty(self) -> bool:
+        return self.length == 0
+
+    def capacity(self) -> int:
+        """ Returns the number of elements the list can hold before it grows. """
+        return len(self.array)
+
+    def resize(self, new_capacity: int) -> None:
+        """
+        Moves the elements into a new array able to hold new_capacity elements.
+        :pre: new_capacity >= self.length
+        :complexity: O(new_capacity)
+        """
+        new_array = ArrayR(max(self.MIN_CAPACITY, new_capacity))
+        self.array.copy_into(new_array, 0, 0, self.length)
+        self.array = new_array
+
+    def ensure_capacity(self, n: int) -> None:
+        """
+        Makes sure n elements fit in the list, doubling the capacity as many times as needed.
+        :complexity: O(n) when resizing, O(1) otherwise
+        """
+        if n <= self.capacity():
+            return
+        new_capacity = self.capacity()
+        while new_capacity < n:
+            new_capacity *= 2
+        self.resize(new_capacity)
+
+    def _maybe_shrink(self) -> None:
+        """ Halves the capacity when a shrinkable list is at most a quarter full. """
+        if self.shrinkable and self.capacity() > self.MIN_CAPACITY and 4 * self.length <= self.capacity():
+            self.resize(self.capacity() // 2)
+
+    def _index(self, index: int) -> int:
+        """ Returns index as a position between 0 and length - 1, counting from the end if negative.
+            :raises IndexError: if index is out of range
+        """
+        if not -self.length <= index < self.length:
+            raise IndexError("Index {0} out of range.".format(index))
+        return index % self.length
+
+    def __getitem__(self, index: int) -> T:
+        """ :raises IndexError: if index is out of range """
+        return self.array[self._index(index)]
+
+    def __setitem__(self, index: int, value: T) -> None:
+        """ :raises IndexError: if index is out of range """
+        self.array[self._index(index)] = value
+
+    def __iter__(self) -> Iterator[T]:
+        if self.length > 0:
+            yield from self.array.window(0, self.length)
+
+    def __contains__(self, item: T) -> bool:
+        return any(element == item for element in self)
+
+    def index(self, item: T) -> int:
+        """ Returns the position of the first element equal to item.
+            :raises ValueError: if item is not in the list
+            :complexity: O(n)
+        """
+        for i, element in enumerate(self):
+            if element == item:
+                return i
+        raise ValueError("Item not in list")
+
+    def append(self, item: T) -> None:
+        """ Adds item at the end of the list.
+            :complexity: amortised O(1)
+        """
+        if self.length == self.capacity():
+            self.ensure_capacity(self.length + 1)
+        self.array[self.length] = item
+        self.length += 1
+
+    def extend(self, items: Iterable[T]) -> None:
+        """ Adds the items at the end of the list, growing at most once if the number of items is known.
+            :complexity: O(k) for k items
+        """
+        if not hasattr(items, '__len__'):
+            items = list(items)
+        if len(items) == 0:
+            return
+        self.ensure_capacity(self.length + len(items))
+        self.array[self.length:self.length + len(items)] = items
+        self.length += len(items)
+
+    def insert(self, index: int, item: T) -> None:
+        """ Adds item at position index, shifting the following elements one position to the right.
+            An index past the end appends, as with Python lists.
+            :complexity: O(n - index), amortised when the list grows
+        """
+        if index < 0:
+            index = max(0, index + self.length)
+        index = min(index, self.length)
+        if self.length == self.capacity():
+            self.ensure_capacity(self.length + 1)
+        self.array.copy_into(self.array, index, index + 1, self.length - index)
+        self.array[index] = item
+        self.length += 1
+
+    def delete_at_index(self, index: int) -> T:
+        """ Removes and returns the element at position index, shifting the following ones to the left.
+            :raises IndexError: if index is out of range
+            :complexity: O(n - index)
+        """
+        index = self._index(index)
+        item = self.array[index]
+        self.array.copy_into(self.array, index + 1, index, self.length - index - 1)
+        self.length -= 1
+        self.array[self.length] = None
+        self._maybe_shrink()
+        return item
+
+    def pop(self, index: int = -1) -> T:
+        """ Removes and returns the element at position index, the last one by default.
+            :raises IndexError: if the list is empty or index is out of range
+            :complexity: amortised O(1) for the last element, O(n - index) otherwise
+        """
+        return self.delete_at_index(index)
+
+    def remove(self, item: T) -> None:
+        """ Removes the first element equal to item.
+            :raises ValueError: if item is not in the list
+            :complexity: O(n)
+        """
+        self.delete_at_index(self.index(item))
+
+    def clear(self) -> None:
+        """ Removes all elements, shrinking back to the minimum capacity if shrinkable. """
+        if self.length > 0:
+            self.array[0:self.length] = [None] * self.length
+        self.length = 0
+        if self.shrinkable:
+            self.resize(self.MIN_CAPACITY)
+
+    def __str__(self) -> str:
+        return '[' + ', '.join(map(str, self)) + ']'
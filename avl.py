@@ -0,0 +1,202 @@
+""" AVL Tree ADT.
+    Defines a self-balancing Binary Search Tree, so that the depth stays O(log n) whatever the order
+    of the insertions (e.g. sorted keys), while subtree_size is kept up to date through every rotation.
+"""
+
+from __future__ import annotations
+
+__docformat__ = 'reStructuredText'
+
+from typing import TypeVar
+from bst import BinarySearchTree
+from node import AVLKeyTreeNode, AVLTreeNode
+
+K = TypeVar('K')
+I = TypeVar('I')
+
+
+class AVLTree(BinarySearchTree[K, I]):
+    """ Binary search tree in which the heights of the two subtrees of every node differ by at most one. """
+    item_node_class = AVLTreeNode
+    key_node_class = AVLKeyTreeNode
+
+    def get_height(self, current: AVLTreeNode | None) -> int:
+        """ Returns the height of the subtree rooted at current, 0 for an empty one. """
+        return 0 if current is None else current.height
+
+    def get_size(self, current: AVLTreeNode | None) -> int:
+        """ Returns the number of nodes in the subtree rooted at current. """
+        return 0 if current is None else current.subtree_size
+
+    def update(self, current: AVLTreeNode) -> None:
+        """ Recomputes the height and subtree_size of current from its children.
+            :complexity: O(1)
+        """
+        current.height = 1 + max(self.get_height(current.left), self.get_height(current.right))
+        current.set_subtree_size(1 + self.get_size(current.left) + self.get_size(current.right))
+
+    def get_balance(self, current: AVLTreeNode) -> int:
+        """ Returns the height of the left subtree of current minus that of the right one. """
+        return self.get_height(current.left) - self.get_height(current.right)
+
+    def left_rotate(self, current: AVLTreeNode) -> AVLTreeNode:
+        """
+            Makes the right child of current the root of the subtree and returns it.
+            :complexity: O(1)
+        """
+        child = current.right
+        current.right = child.left
+        child.left = current
+        self.update(current)
+        self.update(child)
+        return child
+
+    def right_rotate(self, current: AVLTreeNode) -> AVLTreeNode:
+        """
+            Makes the left child of current the root of the subtree and returns it.
+            :complexity: O(1)
+        """
+        child = current.left
+        current.left = child.right
+        child.right = current
+        self.update(current)
+        self.update(child)
+        return child
+
+    def rebalance(self, current: AVLTreeNode) -> AVLTreeNode:
+        """
+            Updates current and rotates it if its subtrees differ in height by two, returning the new subtree root.
+            :pre: the subtrees of current are AVL trees whose heights differ by at most two
+            :complexity: O(1)
+        """
+        self.update(current)
+        balance = self.get_balance(current)
+        if balance > 1:
+            if self.get_balance(current.left) < 0:
+                current.left = self.left_rotate(current.left)
+            return self.right_rotate(current)
+        if balance < -1:
+            if self.get_balance(current.right) > 0:
+                current.right = self.right_rotate(current.right)
+            return self.left_rotate(current)
+        return current
+
+    def rebalance_path(self, path: list[AVLTreeNode]) -> AVLTreeNode:
+        """
+            Rebalances the nodes of path, a list of nodes from a subtree root downwards each being the
+            child of the previous one, from the bottom up, and returns the root of the subtree afterwards.
+            :complexity: O(len(path))
+        """
+        for i in range(len(path) - 1, 0, -1):
+            node, parent = path[i], path[i - 1]
+            if parent.left is node:
+                parent.left = self.rebalance(node)
+            else:
+                parent.right = self.rebalance(node)
+        return self.rebalance(path[0])
+
+    def join_with(self, left: AVLTreeNode | None, middle: AVLTreeNode, right: AVLTreeNode | None) -> AVLTreeNode:
+        """
+            Returns the root of a balanced subtree holding middle with the subtrees left and right on each side.
+            If one of them is more than one level taller, middle is hung on its inner spine at the height of the other
+            one, and the nodes above it are rebalanced.
+            :pre: the keys under left are smaller than middle.key, and those under right larger
+            :complexity: O(|height(left) - height(right)| + 1)
+        """
+        left_height, right_height = self.get_height(left), self.get_height(right)
+        if abs(left_height - right_height) <= 1:
+            return BinarySearchTree.join_with(self, left, middle, right)
+        path = []
+        if left_height > right_height:
+            current = left
+            while self.get_height(current) > right_height + 1:
+                path.append(current)
+                current = current.right
+            path[-1].right = BinarySearchTree.join_with(self, current, middle, right)
+        else:
+            current = right
+            while self.get_height(current) > left_height + 1:
+                path.append(current)
+                current = current.left
+            path[-1].left = BinarySearchTree.join_with(self, left, middle, current)
+        return self.rebalance_path(path)
+
+    def detach_min(self, current: AVLTreeNode) -> tuple[AVLTreeNode, AVLTreeNode | None]:
+        """
+            Same as BinarySearchTree.detach_min(), then rebalances the left spine the node was unlinked from.
+            :complexity: O(log n)
+        """
+        path = []
+        node = current
+        while node.left is not None:
+            path.append(node)
+            node = node.left
+        rest = node.right
+        node.right = None
+        if not path:
+            return node, rest
+        path[-1].left = rest
+        return node, self.rebalance_path(path)
+
+    def insert_aux(self, current: AVLTreeNode, key: K, item: I) -> AVLTreeNode:
+        """
+            Inserts an item into the subtree rooted at current as a new leaf, then rebalances its ancestors.
+            :raises ValueError: if key is already in the tree
+            :complexity: O(CompK * log n)
+        """
+        path = []
+        node = current
+        while node is not None:
+            path.append(node)
+            if key < node.key:
+                node = node.left
+            elif key > node.key:
+                node = node.right
+            else:  # key == node.key
+                raise ValueError('Inserting duplicate item')
+
+        new_node = self.node_class(key, item=item)
+        self.length += 1
+        if not path:
+            return new_node
+        if key < path[-1].key:
+            path[-1].left = new_node
+        else:
+            path[-1].right = new_node
+        return self.rebalance_path(path)
+
+    def delete_aux(self, current: AVLTreeNode, key: K) -> AVLTreeNode:
+        """
+            Deletes the item with the given key from the subtree rooted at current, then rebalances the ancestors
+            of the node unlinked, which is the node itself or, if it has two children, its successor.
+            :raises ValueError: if key is not in the tree
+            :complexity: O(CompK * log n)
+        """
+        path = []
+        node = current
+        while node is not None and key != node.key:
+            path.append(node)
+            node = node.left if key < node.key else node.right
+        if node is None:
+            raise ValueError('Deleting non-existent item')
+        self.length -= 1
+
+        if node.left is not None and node.right is not None:
+            path.append(node)
+            succ = node.right
+            while succ.left is not None:
+                path.append(succ)
+                succ = succ.left
+            node.key = succ.key
+            node.item = succ.item
+            node, replacement = succ, succ.right
+        else:
+            replacement = node.left if node.left is not None else node.right
+
+        if not path:
+            return replacement
+        if path[-1].left is node:
+            path[-1].left = replacement
+        else:
+            path[-1].right = replacement
+        return self.rebalance_path(path)
@@ -162,20 +162,17 @@ def percentile_xyz(my_coordinate_list: list[Point]) -> tuple[list[Point], list[P
         At here, we assume the time complexity of comparing as O(1)
 
     Explanation:
-        First 3 variables x1,y1,z1 is initialised with Percentiles()
-        Then a for loop is used to iterate all points in my_coordinate_list ( Time Complexity : O(n) )
-        add_point() function to add points into x1,y1,z1 (Time Complexity : O(log(n)) )
+        First 3 variables x1,y1,z1 is initialised with Percentiles.from_points(), which sorts the points (or their y, z coordinates)
+        and builds a balanced tree from them in one go ( Time Complexity : O(nlog(n)) )
         After that, 3 variables x,y,z is initialised with the reult of calling ratio ()
         ratio() has a complexity of O(logN + O), but since we called ratio(12.5,12.5) each time,
         O can be converted into (3/4)*N as removing the front 12.5% and back 12.5% removes 25% of my_coordinate_list in total.
         Hence the complexity here O(logN + (3/4)*N),
         since we are considering dominant term the complexity here will be O(N) (Best Case = Worst Case )
     """
-    x1, y1, z1 = Percentiles(), Percentiles(), Percentiles()
-    for i in my_coordinate_list:
-        x1.add_point(i)
-        y1.add_point(i[1])
-        z1.add_point(i[2])
+    x1 = Percentiles.from_points(my_coordinate_list)
+    y1 = Percentiles.from_points(i[1] for i in my_coordinate_list)
+    z1 = Percentiles.from_points(i[2] for i in my_coordinate_list)
     x = x1.ratio(12.5, 12.5)
     y = y1.ratio(12.5, 12.5)
     z = z1.ratio(12.5, 12.5)
@@ -1,5 +1,14 @@
+from __future__ import annotations
+import mmap
+import struct
+import sys
+from array import array
 from dataclasses import dataclass, field
-from heap import MaxHeap
+from itertools import repeat
+from operator import mul, sub
+from typing import Callable, Iterable
+from heap import KeyedMaxHeap, RowMaxHeap
+from pairing_heap import PairingHeap
 
 
 @dataclass
@@ -67,39 +76,114 @@ class Beehive:
         return self.money() <= other.money()
 
 
+SNAPSHOT_MAGIC = b'BEEHIVE1'
+SNAPSHOT_HEADER = struct.Struct('<8sqq')
+
+
+def write_snapshot(path: str, columns: list[array], arity: int) -> None:
+    """
+    Writes a selector snapshot: a header (magic, number of beehives, arity or 0) followed by one column of
+    little-endian 64-bit integers per Beehive field, each listing the beehives in heap array order.
+    arity is 0 when that order is not known to satisfy the heap property.
+    """
+    length = len(columns[0]) if columns else 0
+    with open(path, 'wb') as f:
+        f.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, length, arity))
+        for column in columns:
+            if sys.byteorder == 'big':
+                column = array('q', column)
+                column.byteswap()
+            column.tofile(f)
+
+
+def read_snapshot(path: str) -> tuple[int, int, list[array]]:
+    """
+    Reads a snapshot written by write_snapshot() through a memory map, returning (number of beehives, arity, columns).
+
+    Raises:
+        ValueError : when the file is not a snapshot
+    """
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+        if len(view) < SNAPSHOT_HEADER.size:
+            raise ValueError('Not a beehive snapshot: {0}'.format(path))
+        magic, length, arity = SNAPSHOT_HEADER.unpack_from(view)
+        if magic != SNAPSHOT_MAGIC or len(view) != SNAPSHOT_HEADER.size + 8 * length * len(BeehiveStore.FIELDS):
+            raise ValueError('Not a beehive snapshot: {0}'.format(path))
+        columns = []
+        offset = SNAPSHOT_HEADER.size
+        for _ in BeehiveStore.FIELDS:
+            column = array('q')
+            column.frombytes(view[offset:offset + 8 * length])
+            if sys.byteorder == 'big':
+                column.byteswap()
+            columns.append(column)
+            offset += 8 * length
+    return length, arity, columns
+
+
+def make_honey_store(max_beehives: int, key: Callable, growable: bool, arity: int, backend: str,
+                     rows: bool = False) -> KeyedMaxHeap | PairingHeap:
+    """
+    Creates the heap used by a BeehiveSelector.
+
+    Args:
+        backend : 'array' for a KeyedMaxHeap, 'pairing' for a PairingHeap, which ignores max_beehives, growable and arity
+                  but can merge with another PairingHeap in O(1)
+        rows : True when the elements are row indices whose key is always an integer, kept by an 'array' backend in a
+               RowMaxHeap, which stores rows, keys and positions as raw 64-bit integers
+
+    Raises:
+        ValueError : when backend is not one of the above
+    """
+    if backend == 'array' and rows:
+        return RowMaxHeap(max_beehives, key, growable=growable, shrinkable=growable, arity=arity)
+    elif backend == 'array':
+        return KeyedMaxHeap(max_beehives, key, growable=growable, shrinkable=growable, arity=arity)
+    elif backend == 'pairing':
+        return PairingHeap(key, identity=int if rows else id)
+    raise ValueError('Unknown heap backend: {0}'.format(backend))
+
+
 class BeehiveSelector:
 
-    def __init__(self, max_beehives: int):
+    def __init__(self, max_beehives: int, growable: bool = False, arity: int = 2, backend: str = 'array'):
         """
         Args:
             max_beehives : An integer which indicated the maximum amount of beehives that can be placd in BeehiveSelector
-            self.honey_store : A MaxHeap object used to store all behives according to their value of emerald which is the result from money() function
+            growable : If True, max_beehives is only the initial capacity and the selector grows (and shrinks) with the number of beehives
+            arity : The number of children of each node in self.honey_store, larger values make the heap shallower
+            backend : 'array' (default) or 'pairing', see make_honey_store(). Selectors with the pairing backend merge in O(1)
+            self.honey_store : A KeyedMaxHeap ( or PairingHeap ) object used to store all behives according to their value of emerald which is the result from money() function.
+                               money() of each Beehive is computed once when it enters the heap and kept alongside it, so the heap only compares numbers
 
         Complexity:
             Best Case = Worst Case : O(n), n as the number of max beehives
 
         Explanation:
-            At here, we just initialise variable honey_store with a MaxHeap object which includes max_beehives as its parameter
+            At here, we just initialise variable honey_store with a KeyedMaxHeap object keyed by money() which includes max_beehives as its parameter
             ( Time Complexity : O(n) )
         """
 
-        self.honey_store = MaxHeap(max_beehives)
+        self.honey_store = make_honey_store(max_beehives, Beehive.money, growable, arity, backend)
 
-    def set_all_beehives(self, hive_list: list[Beehive]) -> None:
+    def set_all_beehives(self, hive_list: Iterable[Beehive]) -> None:
         """
         Args:
-            hive_list: A list which is used to store Beehive objects
+            hive_list: Any iterable of Beehive objects, such as a list or a generator reading them from a file
             self.honey_store : A MaxHeap object used to store all behives according to their value of emerald which is the result from money() function
 
+        Raises:
+            IndexError : when the beehives do not fit in a selector which is not growable
+
         Complexity:
-            Best Case = Worst Case : O(k), k is the length of hive_list
+            Best Case = Worst Case : O(k + log(n)^2), k is the number of Beehive in hive_list, n is the number of Beehive already in self.honey_store
 
         Explanation:
-            First self.honey_store.length will be added the length of hive_list ( Time Complexity : O(1) )
-            Then self.honey_store call heapify() method from MaxHeap with hive_list as input ( Time Complexity : O(k) )
+            self.honey_store call extend() method from MaxHeap with hive_list as input, which appends every Beehive after the ones already
+            in the selector and then only sinks the parents of the appended Beehives level by level ( Time Complexity : O(k + log(n)^2) )
+            So the Beehives already in the selector are kept and the selector can be reloaded without creating a new one.
         """
-        self.honey_store.length += len(hive_list)
-        self.honey_store.heapify(hive_list)
+        self.honey_store.extend(hive_list)
 
     def add_beehive(self, hive: Beehive):
         """
@@ -119,6 +203,120 @@ class BeehiveSelector:
         """
         self.honey_store.add(hive)
 
+    def update_beehive(self, hive: Beehive) -> None:
+        """
+        Args:
+            hive : A Beehive already in self.honey_store whose capacity, nutrient_factor or volume has been changed
+
+        Raises:
+            KeyError : when hive is not in self.honey_store
+
+        Complexity:
+            Best Case : O(1), when hive is still in the correct position
+            Worst Case : O(log(n)), n as the number of Beehive currently in self.honey_store
+
+        Explanation:
+            Call the update() method from KeyedMaxHeap, which finds the position of hive in O(1), recomputes its money() and then rises or sinks it
+            to its new position ( Time Complexity : Best Case : O(1), Worst Case : O(log(n)) )
+        """
+        self.honey_store.update(hive)
+
+    def remove_beehive(self, hive: Beehive) -> None:
+        """
+        Args:
+            hive : The Beehive to be removed from self.honey_store
+
+        Raises:
+            KeyError : when hive is not in self.honey_store
+
+        Complexity:
+            Best Case : O(1), when the Beehive moved into the position of hive does not need to rise or sink
+            Worst Case : O(log(n)), n as the number of Beehive currently in self.honey_store
+
+        Explanation:
+            Call the remove() method from KeyedMaxHeap, which moves the last Beehive into the position of hive and then rises
+            or sinks it ( Time Complexity : Best Case : O(1), Worst Case : O(log(n)) )
+        """
+        self.honey_store.remove(hive)
+
+    def save(self, path: str) -> None:
+        """
+        Args:
+            path : The file the snapshot is written to, see write_snapshot()
+
+        Complexity:
+            Best Case = Worst Case : O(n), n as the number of Beehive currently in self.honey_store
+
+        Explanation:
+            Every field of the Beehives is written as one column in the order of the heap array ( Time Complexity : O(n) ),
+            so load() can rebuild the heap without comparing any Beehive.
+        """
+        hives = list(self.honey_store)
+        columns = [array('q', (getattr(hive, name) for hive in hives)) for name in BeehiveStore.FIELDS]
+        write_snapshot(path, columns, getattr(self.honey_store, 'arity', 0))
+
+    @classmethod
+    def load(cls, path: str, growable: bool = False, backend: str = 'array') -> BeehiveSelector:
+        """
+        Args:
+            path : A file written by save()
+            growable, backend : As in __init__(); the arity is the one of the saved selector
+
+        Returns:
+            A new selector holding new Beehive objects equal to the saved ones
+
+        Raises:
+            ValueError : when the file is not a snapshot
+
+        Complexity:
+            Best Case = Worst Case : O(n), n as the number of Beehive saved
+
+        Explanation:
+            The file is memory mapped and read column by column ( Time Complexity : O(n) ). When it was saved from an array backend,
+            its order already satisfies the heap property, so the Beehives are placed with extend_ordered() without any comparison
+            ( Time Complexity : O(n) ), otherwise they are added with extend() ( Time Complexity : O(n) )
+        """
+        length, arity, columns = read_snapshot(path)
+        selector = cls(length, growable=growable, arity=arity or 2, backend=backend)
+        hives = [Beehive(*fields) for fields in zip(*columns)]
+        if arity and backend == 'array':
+            selector.honey_store.extend_ordered(hives)
+        else:
+            selector.honey_store.extend(hives)
+        return selector
+
+    def merge(self, other: BeehiveSelector) -> None:
+        """
+        Args:
+            other : A BeehiveSelector with the same backend, whose Beehives are all moved into this one, leaving other empty
+
+        Complexity:
+            Best Case = Worst Case : O(1) for the pairing backend ( plus merging the position maps, O(min(n, m)) ),
+                                     O(m + log(n)^2) for the array backend, n and m as the number of Beehive in self and other
+
+        Explanation:
+            Call the merge() method of self.honey_store, which links the two roots for a PairingHeap, or appends the elements of other for a MaxHeap
+        """
+        self.honey_store.merge(other.honey_store)
+
+    def peek_top_k(self, k: int) -> list[Beehive]:
+        """
+        Args:
+            k : The number of best Beehive wanted
+
+        Returns:
+            A list of the k Beehive with the most emerald in a single sitting, in descending order of emerald ( fewer if there are
+            less than k Beehive ). self.honey_store is not changed.
+
+        Complexity:
+            Best Case = Worst Case : O(k*log(k)), at here we assume the complexity of comparing as O(1)
+
+        Explanation:
+            Call the peek_top_k() method from MaxHeap, which walks down from the root of self.honey_store, keeping the children of every
+            Beehive returned so far in a small heap of size O(k) ( Time Complexity : O(k*log(k)) )
+        """
+        return self.honey_store.peek_top_k(k)
+
     def harvest_best_beehive(self) -> float:
         """
         Args:
@@ -126,32 +324,444 @@ class BeehiveSelector:
             large: The amount of emerald of the best Beehive
 
         Complexity:
-            Best Case = Worst Case : O(log(n)), n is the number of Beehive currently in self.honey_store
+            Best Case : O(1), when the harvested Beehive is still the best one and no sinking is required
+            Worst Case : O(log(n)), n is the number of Beehive currently in self.honey_store
             At here, we assume the complexity of comparing as O(1)
 
         Returns:
             A float that represents the amount of emerald of Beehive in the BeehiveSelector
 
         Explanation:
-            First, variable temp is initialised with the Beehive which can extract the most emerald by calling get_max() function from MaxHeap
-            ( Time Complexity : O(log(n) )
+            First, variable temp is initialised with the Beehive which can extract the most emerald by calling peek_max() function from MaxHeap
+            ( Time Complexity : O(1) )
             Then , variable large is initialised with the amount of emerald extracted from temp by calling money() method
             ( Time Complexity :  O(1) )
             Subtraction occurs by subtracting temp capacity from temp volum ( Time Complexity : O(1) )
             After that, if statement is used to check whether temp.volume is smaller than 0 ( Time Complexity : O(1) )
             If yes, set the temp.volume to 0 which means no more emerald can be obtained from this Beehive anymore ( Time Complexity : O(1) )
-            Then, use add_beehive() method to add back temp which is a Beehive into self.honey_store
-            ( Time Complexity : Best Case : O(1), Worst Case : O(n) )
+            Then, since temp is still at the root of self.honey_store, replace_max() only needs to sink it once to its new position
+            instead of removing it and adding it back ( Time Complexity : Best Case : O(1), Worst Case : O(log(n)) )
             Finally, return the amount of emerald obtained from this sitting ( Time Complexity : O(1) )
-
-            Hence, the overall complexity is O(log(n)) for best case and O(log(n) + log(n) ) for worst case
-            which is then simplified to O(log(n). Therefore, the overall complexity of best case and worst case is the same
-            which is O(log(n)).
         """
-        temp = self.honey_store.get_max()
+        temp = self.honey_store.peek_max()
         large = temp.money()
         temp.volume -= temp.capacity
         if temp.volume < 0:
             temp.volume = 0
-        self.add_beehive(temp)
+        self.honey_store.replace_max(temp)
+        return large
+
+    def harvest_many(self, k: int) -> list[float]:
+        """
+        Args:
+            k : The number of harvests to perform
+            result : A list which stores the amount of emerald obtained from each harvest
+
+        Returns:
+            A list of length k, where position i stores the amount of emerald obtained from the (i+1)th harvest
+
+        Complexity:
+            Best Case : O(k), when the harvested Beehive stays at the root every time
+            Worst Case : O(k*log(n)), n is the number of Beehive currently in self.honey_store
+            At here, we assume the complexity of comparing as O(1)
+
+        Explanation:
+            Same as calling harvest_best_beehive() k times, but the heap and its methods are looked up only once,
+            and each harvest costs a single sink of the root ( Time Complexity : Best Case : O(1), Worst Case : O(log(n)) )
+        """
+        heap = self.honey_store
+        peek_max = heap.peek_max
+        replace_max = heap.replace_max
+        result = []
+        for _ in range(k):
+            temp = peek_max()
+            result.append(temp.money())
+            temp.volume -= temp.capacity
+            if temp.volume < 0:
+                temp.volume = 0
+            replace_max(temp)
+        return result
+
+    def harvest_groups(self) -> list[tuple]:
+        """
+        Returns:
+            A list of (emerald, count, hive, volume) tuples sorted by emerald in descending order, each saying that hive can be
+            harvested count more times for emerald each, taking volume honey each time. Harvests worth no emerald are left out.
+
+        Complexity:
+            Best Case = Worst Case : O(n*log(n)), n is the number of Beehive currently in self.honey_store
+
+        Explanation:
+            Every Beehive yields capacity * nutrient_factor emerald for volume // capacity harvests, then (volume % capacity) * nutrient_factor
+            emerald once, then nothing. So we build at most 2 groups per Beehive ( Time Complexity : O(n) ) and sort them by emerald in
+            descending order ( Time Complexity : O(n*log(n)) ).
+        """
+        groups = []
+        for hive in self.honey_store:
+            if hive.capacity <= 0 or hive.volume <= 0 or hive.nutrient_factor <= 0:
+                continue
+            full, rest = divmod(hive.volume, hive.capacity)
+            if full > 0:
+                groups.append((hive.capacity * hive.nutrient_factor, full, hive, hive.capacity))
+            if rest > 0:
+                groups.append((rest * hive.nutrient_factor, 1, hive, rest))
+        groups.sort(key=lambda group: group[0], reverse=True)
+        return groups
+
+    def take_honey(self, hive: Beehive, volume: int) -> None:
+        """ Lowers the volume of hive, without restoring the heap property. """
+        hive.volume -= volume
+
+    def take_harvests(self, hive: Beehive, times: int) -> None:
+        """ Lowers the volume of hive as harvesting it times times would, without restoring the heap property. """
+        hive.volume = max(0, hive.volume - times * hive.capacity)
+
+    def next_harvests(self, k: int) -> list[float]:
+        """
+        Args:
+            k : The number of harvests to look ahead
+
+        Returns:
+            The list of emerald that the next k calls of harvest_best_beehive() would return, without changing any Beehive
+
+        Complexity:
+            Best Case = Worst Case : O(n*log(n) + k), n is the number of Beehive currently in self.honey_store
+
+        Explanation:
+            Since the emerald of each Beehive never increases, the next k harvests are the k most valuable ones in harvest_groups()
+            ( Time Complexity : O(n*log(n)) ), padded with harvests worth no emerald ( Time Complexity : O(k) )
+        """
+        result = []
+        for emerald, count, hive, volume in self.harvest_groups():
+            if len(result) >= k:
+                break
+            result.extend([emerald] * min(count, k - len(result)))
+        result.extend([0] * (k - len(result)))
+        return result
+
+    def harvest_total(self, days: int) -> float:
+        """
+        Args:
+            days : The number of harvests to perform, one per day, none if days is not positive ( as with harvest_many() )
+            groups : The result of harvest_groups()
+
+        Returns:
+            A float that represents the total amount of emerald obtained, the same as the sum of calling harvest_best_beehive() days times
+
+        Complexity:
+            Best Case = Worst Case : O(n*log(n)), n is the number of Beehive currently in self.honey_store
+            This does not depend on days.
+
+        Explanation:
+            Since the emerald of each Beehive never increases, always harvesting the best Beehive takes the days most valuable harvests
+            among all Beehives. So we take whole groups from harvest_groups() ( Time Complexity : O(n*log(n)) ) until days harvests are
+            used up, lowering the volume of each Beehive accordingly ( Time Complexity : O(n) ).
+            Then the heap is rebuilt with rebuild() ( Time Complexity : O(n) ).
+            If harvests are left once no Beehive is worth any emerald, harvest_best_beehive() would keep harvesting the root, which
+            never sinks below Beehives as worthless as itself, so they are all applied to the root at once ( Time Complexity : O(log(n)) ).
+
+            Every Beehive ends up with the same volume as harvesting day by day, except when several Beehives tie on the emerald of
+            the last harvest: the tied harvests then go to them in the order of harvest_groups() ( or to the root of the rebuilt heap
+            for harvests worth no emerald ), which is one of the orders harvest_best_beehive() may pick, but not always the one it picks.
+        """
+        if days <= 0:
+            return 0
+        total = 0
+        remaining = days
+        for emerald, count, hive, volume in self.harvest_groups():
+            if remaining == 0:
+                break
+            taken = min(count, remaining)
+            total += taken * emerald
+            self.take_honey(hive, taken * volume)
+            remaining -= taken
+
+        self.honey_store.rebuild()
+        if remaining > 0 and len(self.honey_store) > 0:
+            root = self.honey_store.peek_max()
+            self.take_harvests(root, remaining)
+            self.honey_store.replace_max(root)
+        return total
+
+
+class BeehiveStore:
+    """
+    Column-wise storage of many beehives: every field of Beehive is kept in its own array('q'),
+    so a beehive is just a row index and takes 6 machine integers instead of a full Beehive object.
+
+    Args :
+        x, y, z, capacity, nutrient_factor, volume : One array('q') per field of Beehive, position row is the beehive in that row
+    """
+
+    FIELDS = ('x', 'y', 'z', 'capacity', 'nutrient_factor', 'volume')
+
+    def __init__(self) -> None:
+        """
+        Complexity :
+            Best Case = Worst Case : O(1)
+        """
+        for name in self.FIELDS:
+            setattr(self, name, array('q'))
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def append(self, hive: Beehive) -> int:
+        """
+        Copies the fields of hive into a new row and returns the row index.
+
+        Complexity :
+            Best Case = Worst Case : O(1) amortised
+        """
+        for name in self.FIELDS:
+            getattr(self, name).append(getattr(hive, name))
+        return len(self) - 1
+
+    def extend(self, hives: Iterable[Beehive]) -> range:
+        """
+        Copies every hive into a new row and returns the range of the new rows.
+
+        Complexity :
+            Best Case = Worst Case : O(k), k is the number of Beehive in hives
+        """
+        start = len(self)
+        for hive in hives:
+            self.append(hive)
+        return range(start, len(self))
+
+    def __getitem__(self, row: int) -> Beehive:
+        """
+        Returns a Beehive holding a copy of the fields in row; changing it does not change the store.
+
+        Complexity :
+            Best Case = Worst Case : O(1)
+        """
+        return Beehive(*(getattr(self, name)[row] for name in self.FIELDS))
+
+    def money(self, row: int) -> int:
+        """
+        Same as Beehive.money() for the beehive in row.
+
+        Complexity :
+            Best Case = Worst Case : O(1)
+        """
+        return min(self.capacity[row], self.volume[row]) * self.nutrient_factor[row]
+
+    def money_all(self) -> array:
+        """
+        Returns an array('q') holding money() of every row, computed with map() so the loop runs in C.
+
+        Complexity :
+            Best Case = Worst Case : O(n), n is the number of rows
+        """
+        return array('q', map(mul, map(min, self.capacity, self.volume), self.nutrient_factor))
+
+    def harvest(self, row: int) -> int:
+        """
+        Harvests the beehive in row once, returning the emerald obtained and lowering its volume by its capacity (down to 0).
+
+        Complexity :
+            Best Case = Worst Case : O(1)
+        """
+        capacity, volume = self.capacity[row], self.volume[row]
+        self.volume[row] = volume - capacity if volume > capacity else 0
+        return min(capacity, volume) * self.nutrient_factor[row]
+
+    def harvest_all(self) -> array:
+        """
+        Harvests every beehive once, returning an array('q') with the emerald obtained from each row.
+        This replaces self.volume without telling any selector, so use ColumnarBeehiveSelector.harvest_all() on a store in use.
+
+        Complexity :
+            Best Case = Worst Case : O(n), n is the number of rows
+        """
+        result = self.money_all()
+        self.volume = array('q', map(max, map(sub, self.volume, self.capacity), repeat(0, len(self))))
+        return result
+
+
+class ColumnarBeehiveSelector(BeehiveSelector):
+    """
+    A BeehiveSelector whose beehives live in a BeehiveStore. The heap only holds row indices, keyed by BeehiveStore.money,
+    so update_beehive() and remove_beehive() take the row of the beehive instead of a Beehive, and merge() only works between
+    selectors sharing the same store.
+
+    Args :
+        self.store : The BeehiveStore holding the beehives
+        self.honey_store : A RowMaxHeap ( or PairingHeap ) of row indices of self.store
+    """
+
+    def __init__(self, max_beehives: int, growable: bool = False, arity: int = 2, backend: str = 'array',
+                 store: BeehiveStore | None = None):
+        """
+        Args:
+            max_beehives : An integer which indicated the maximum amount of beehives that can be placd in BeehiveSelector
+            growable : If True, max_beehives is only the initial capacity and the selector grows (and shrinks) with the number of beehives
+            arity : The number of children of each node in self.honey_store
+            backend : 'array' (default) or 'pairing', see make_honey_store()
+            store : The BeehiveStore used to store beehives, a new empty one if not given. Rows already in it are not added to the selector.
+
+        Complexity:
+            Best Case = Worst Case : O(n), n as the number of max beehives
+        """
+        self.store = BeehiveStore() if store is None else store
+        self.honey_store = make_honey_store(max_beehives, self.store.money, growable, arity, backend, rows=True)
+
+    def save(self, path: str) -> None:
+        """
+        Same as BeehiveSelector.save(), gathering the rows in the selector from the columns of self.store.
+
+        Complexity:
+            Best Case = Worst Case : O(n), n as the number of rows currently in the selector
+        """
+        rows = list(self.honey_store)
+        columns = [array('q', map(getattr(self.store, name).__getitem__, rows)) for name in BeehiveStore.FIELDS]
+        write_snapshot(path, columns, getattr(self.honey_store, 'arity', 0))
+
+    @classmethod
+    def load(cls, path: str, growable: bool = False, backend: str = 'array') -> ColumnarBeehiveSelector:
+        """
+        Same as BeehiveSelector.load(), with the columns of the file becoming the columns of a new BeehiveStore, so no Beehive
+        object is created. Row i of the store is the ith Beehive of the saved heap array.
+
+        Complexity:
+            Best Case = Worst Case : O(n), n as the number of Beehive saved
+        """
+        length, arity, columns = read_snapshot(path)
+        store = BeehiveStore()
+        for name, column in zip(BeehiveStore.FIELDS, columns):
+            setattr(store, name, column)
+        selector = cls(length, growable=growable, arity=arity or 2, backend=backend, store=store)
+        if arity and backend == 'array':
+            selector.honey_store.extend_ordered(range(length))
+        else:
+            selector.honey_store.extend(range(length))
+        return selector
+
+    def set_all_beehives(self, hive_list: Iterable[Beehive]) -> None:
+        """
+        Args:
+            hive_list: Any iterable of Beehive objects, copied into new rows of self.store
+
+        Complexity:
+            Best Case = Worst Case : O(k + log(n)^2), k is the number of Beehive in hive_list, n is the number of rows already in the selector
+        """
+        self.honey_store.extend(self.store.extend(hive_list))
+
+    def set_all_rows(self, rows: Iterable[int]) -> None:
+        """
+        Args:
+            rows: Rows of self.store to be added to the selector
+
+        Complexity:
+            Best Case = Worst Case : O(k + log(n)^2), k is the number of rows given, n is the number of rows already in the selector
+        """
+        self.honey_store.extend(rows)
+
+    def add_beehive(self, hive: Beehive) -> int:
+        """
+        Args:
+            hive : The beehive copied into a new row of self.store and added to the selector
+
+        Returns:
+            The row of hive in self.store
+
+        Complexity:
+            Best Case : O(1), when no rising is required
+            Worst Case : O(log(n)), n as the number of rows currently in the selector
+        """
+        row = self.store.append(hive)
+        self.honey_store.add(row)
+        return row
+
+    def merge(self, other: ColumnarBeehiveSelector) -> None:
+        """
+        Same as BeehiveSelector.merge(), the rows of other become rows of self.
+
+        Raises:
+            ValueError : if other does not keep its beehives in self.store, since its rows would mean other beehives here
+        """
+        if getattr(other, 'store', None) is not self.store:
+            raise ValueError('Merging selectors with different stores')
+        BeehiveSelector.merge(self, other)
+
+    def harvest_all(self) -> array:
+        """
+        Same as BeehiveStore.harvest_all() on self.store, then rebuilds self.honey_store since every key changed.
+        Other selectors sharing self.store have to rebuild their own honey_store.
+
+        Complexity:
+            Best Case = Worst Case : O(m + n), m as the number of rows in self.store, n as the number of rows currently in the selector
+        """
+        result = self.store.harvest_all()
+        self.honey_store.rebuild()
+        return result
+
+    def peek_top_k(self, k: int) -> list[Beehive]:
+        """
+        Same as BeehiveSelector.peek_top_k(), returning copies of the best rows of self.store as Beehive.
+
+        Complexity:
+            Best Case = Worst Case : O(k*log(k))
+        """
+        return [self.store[row] for row in self.honey_store.peek_top_k(k)]
+
+    def harvest_best_beehive(self) -> float:
+        """
+        Same as BeehiveSelector.harvest_best_beehive(), harvesting the best row of self.store.
+
+        Complexity:
+            Best Case : O(1), when the harvested row stays at the root
+            Worst Case : O(log(n)), n is the number of rows currently in the selector
+        """
+        row = self.honey_store.peek_max()
+        large = self.store.harvest(row)
+        self.honey_store.replace_max(row)
         return large
+
+    def harvest_many(self, k: int) -> list[float]:
+        """
+        Same as BeehiveSelector.harvest_many(), harvesting rows of self.store.
+
+        Complexity:
+            Best Case : O(k), when the harvested row stays at the root every time
+            Worst Case : O(k*log(n)), n is the number of rows currently in the selector
+        """
+        heap = self.honey_store
+        peek_max = heap.peek_max
+        replace_max = heap.replace_max
+        harvest = self.store.harvest
+        result = []
+        for _ in range(k):
+            row = peek_max()
+            result.append(harvest(row))
+            replace_max(row)
+        return result
+
+    def harvest_groups(self) -> list[tuple]:
+        """
+        Same as BeehiveSelector.harvest_groups(), with rows of self.store in place of Beehive.
+
+        Complexity:
+            Best Case = Worst Case : O(n*log(n)), n is the number of rows currently in the selector
+        """
+        capacity, nutrient_factor, volume = self.store.capacity, self.store.nutrient_factor, self.store.volume
+        groups = []
+        for row in self.honey_store:
+            if capacity[row] <= 0 or volume[row] <= 0 or nutrient_factor[row] <= 0:
+                continue
+            full, rest = divmod(volume[row], capacity[row])
+            if full > 0:
+                groups.append((capacity[row] * nutrient_factor[row], full, row, capacity[row]))
+            if rest > 0:
+                groups.append((rest * nutrient_factor[row], 1, row, rest))
+        groups.sort(key=lambda group: group[0], reverse=True)
+        return groups
+
+    def take_honey(self, row: int, volume: int) -> None:
+        """ Lowers the volume of row in self.store, without restoring the heap property. """
+        self.store.volume[row] -= volume
+
+    def take_harvests(self, row: int, times: int) -> None:
+        """ Lowers the volume of row in self.store as harvesting it times times would, without restoring the heap property. """
+        self.store.volume[row] = max(0, self.store.volume[row] - times * self.store.capacity[row])
@@ -0,0 +1,67 @@
+""" Benchmark of MaxHeap arities under add-heavy and pop-heavy workloads.
+
+Each workload starts from a heap of the given size and then performs a fixed
+number of operations, where every operation is an add() with probability
+add_ratio and a get_max() otherwise. The heap size stays roughly constant
+around the starting size.
+
+Run from the repository root with
+    python -m benchmarks.heap_arity [-n SIZE] [-o OPERATIONS]
+"""
+__docformat__ = 'reStructuredText'
+
+import argparse
+import random
+import time
+
+from heap import MaxHeap, KeyedMaxHeap
+
+ARITIES = [2, 3, 4, 8]
+ADD_RATIOS = [0.9, 0.75, 0.5, 0.25, 0.1]
+
+
+def make_heap(kind: str, size: int, arity: int) -> MaxHeap:
+    if kind == 'keyed':
+        return KeyedMaxHeap(size, key=lambda item: item, growable=True, arity=arity)
+    return MaxHeap(size, growable=True, arity=arity)
+
+
+def run_workload(kind: str, size: int, operations: int, add_ratio: float, arity: int, seed: int = 1008) -> float:
+    """
+    Returns the number of operations per second for one workload.
+    The operation sequence only depends on seed, so all arities see the same workload.
+    """
+    rng = random.Random(seed)
+    heap = make_heap(kind, size, arity)
+    heap.length = size
+    heap.heapify([rng.random() for _ in range(size)])
+    ops = [rng.random() < add_ratio for _ in range(operations)]
+    values = [rng.random() for _ in range(operations)]
+
+    start = time.perf_counter()
+    for is_add, value in zip(ops, values):
+        if is_add or len(heap) == 0:
+            heap.add(value)
+        else:
+            heap.get_max()
+    return operations / (time.perf_counter() - start)
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description="Compare MaxHeap arities for add-heavy and pop-heavy mixes.")
+    p.add_argument("-n", "--size", type=int, default=100000, help="Starting number of elements in the heap.")
+    p.add_argument("-o", "--operations", type=int, default=200000, help="Number of operations per workload.")
+    p.add_argument("-k", "--kind", choices=["plain", "keyed"], default="plain", help="Heap class to benchmark.")
+    args = p.parse_args()
+
+    print("{0:>9} | {1} | best".format("add ratio", " | ".join("d={0:<8}".format(d) for d in ARITIES)))
+    for add_ratio in ADD_RATIOS:
+        results = {d: run_workload(args.kind, args.size, args.operations, add_ratio, d) for d in ARITIES}
+        best = max(results, key=results.get)
+        print("{0:>9} | {1} | d={2}".format(
+            add_ratio, " | ".join("{0:>10.0f}".format(results[d]) for d in ARITIES), best))
+    print("ops/sec; the crossover is the add ratio at which the best arity changes.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+""" Benchmark suite for heap.py, pairing_heap.py and beehive.py.
+
+Every case is run for every combination of input size, input distribution and
+heap backend, and reported as JSON with the elapsed time, operations per second
+and (unless --no-memory is given) the peak memory allocated during the run, as
+measured by tracemalloc in a second, separate run.
+
+Distributions:
+    random  -- priorities drawn uniformly at random
+    sorted  -- priorities in increasing order, the worst case for add()
+    equal   -- every priority the same
+
+Run from the repository root with e.g.
+    python -m benchmarks.suite --sizes 1000 100000 --backends array pairing -o bench_output.txt
+Sizes up to 10**7 are supported but take minutes per case in pure Python.
+"""
+__docformat__ = 'reStructuredText'
+
+import argparse
+import json
+import platform
+import random
+import time
+import tracemalloc
+from typing import Callable
+
+from beehive import Beehive, BeehiveSelector
+from heap import MaxHeap
+from pairing_heap import PairingHeap
+
+SIZES = [10 ** 3, 10 ** 4, 10 ** 5]
+DISTRIBUTIONS = ['random', 'sorted', 'equal']
+BACKENDS = ['array', 'pairing']
+
+
+def make_values(size: int, distribution: str, rng: random.Random) -> list[float]:
+    """ Every value is a distinct float object, as PairingHeap tracks its elements by identity. """
+    if distribution == 'random':
+        return [rng.random() for _ in range(size)]
+    elif distribution == 'sorted':
+        return [float(i) for i in range(size)]
+    return [float(1) for _ in range(size)]
+
+
+def make_hives(size: int, distribution: str, rng: random.Random) -> list[Beehive]:
+    """ Beehives whose money() follows distribution, each with enough volume for several harvests. """
+    if distribution == 'random':
+        return [Beehive(i, i, i, capacity=rng.randint(1, 100), nutrient_factor=rng.randint(1, 100),
+                        volume=rng.randint(100, 10000)) for i in range(size)]
+    elif distribution == 'sorted':
+        return [Beehive(i, i, i, capacity=10, nutrient_factor=i + 1, volume=10000) for i in range(size)]
+    return [Beehive(i, i, i, capacity=10, nutrient_factor=5, volume=10000) for i in range(size)]
+
+
+def make_heap(size: int, backend: str, arity: int):
+    return PairingHeap() if backend == 'pairing' else MaxHeap(size, arity=arity)
+
+
+def heap_add(size, distribution, backend, arity, rng) -> Callable[[], int]:
+    values = make_values(size, distribution, rng)
+
+    def run() -> int:
+        heap = make_heap(size, backend, arity)
+        for value in values:
+            heap.add(value)
+        return size
+    return run
+
+
+def heap_get_max(size, distribution, backend, arity, rng) -> Callable[[], int]:
+    heap = make_heap(size, backend, arity)
+    heap.extend(make_values(size, distribution, rng))
+
+    def run() -> int:
+        for _ in range(size):
+            heap.get_max()
+        return size
+    return run
+
+
+def heap_extend(size, distribution, backend, arity, rng) -> Callable[[], int]:
+    values = make_values(size, distribution, rng)
+
+    def run() -> int:
+        make_heap(size, backend, arity).extend(values)
+        return size
+    return run
+
+
+def selector_set_all_beehives(size, distribution, backend, arity, rng) -> Callable[[], int]:
+    hives = make_hives(size, distribution, rng)
+
+    def run() -> int:
+        BeehiveSelector(size, arity=arity, backend=backend).set_all_beehives(hives)
+        return size
+    return run
+
+
+def selector_harvest_best_beehive(size, distribution, backend, arity, rng) -> Callable[[], int]:
+    selector = BeehiveSelector(size, arity=arity, backend=backend)
+    selector.set_all_beehives(make_hives(size, distribution, rng))
+
+    def run() -> int:
+        for _ in range(size):
+            selector.harvest_best_beehive()
+        return size
+    return run
+
+
+CASES = {
+    'MaxHeap.add': heap_add,
+    'MaxHeap.get_max': heap_get_max,
+    'MaxHeap.extend': heap_extend,
+    'BeehiveSelector.set_all_beehives': selector_set_all_beehives,
+    'BeehiveSelector.harvest_best_beehive': selector_harvest_best_beehive,
+}
+
+
+def measure(case: str, size: int, distribution: str, backend: str, arity: int, memory: bool, seed: int) -> dict:
+    """ Runs one case, returning its result record. Setup is excluded from both time and memory. """
+    run = CASES[case](size, distribution, backend, arity, random.Random(seed))
+    start = time.perf_counter()
+    ops = run()
+    seconds = time.perf_counter() - start
+    result = {
+        'case': case, 'backend': backend, 'arity': arity if backend == 'array' else None, 'size': size,
+        'distribution': distribution, 'ops': ops, 'seconds': seconds, 'ops_per_sec': ops / seconds if seconds else None,
+    }
+    if memory:
+        run = CASES[case](size, distribution, backend, arity, random.Random(seed))
+        tracemalloc.start()
+        run()
+        result['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description="Benchmark heaps and beehive selectors, printing JSON results.")
+    p.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="Input sizes.")
+    p.add_argument("--distributions", nargs="+", choices=DISTRIBUTIONS, default=DISTRIBUTIONS)
+    p.add_argument("--backends", nargs="+", choices=BACKENDS, default=BACKENDS)
+    p.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES))
+    p.add_argument("--arity", type=int, default=2, help="Arity of the array backend.")
+    p.add_argument("--seed", type=int, default=1008)
+    p.add_argument("--no-memory", action="store_true", help="Skip the peak memory runs.")
+    p.add_argument("-o", "--output", help="File to write the JSON to, stdout if not given.")
+    args = p.parse_args()
+
+    results = []
+    for case in args.cases:
+        for backend in args.backends:
+            for distribution in args.distributions:
+                for size in args.sizes:
+                    results.append(measure(case, size, distribution, backend, args.arity, not args.no_memory, args.seed))
+    report = {'python': platform.python_version(), 'platform': platform.platform(), 'results': results}
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -8,8 +8,9 @@ from __future__ import annotations
 __author__ = 'Brendon Taylor, modified by Alexey Ignatiev, further modified by Jackson Goerner'
 __docformat__ = 'reStructuredText'
 
-from typing import TypeVar, Generic
-from node import TreeNode
+from typing import TypeVar, Generic, Iterable, Iterator
+from operator import itemgetter
+from node import KeyTreeNode, TreeNode
 import sys
 
 # generic types
@@ -20,15 +21,73 @@ T = TypeVar('T')
 
 class BinarySearchTree(Generic[K, I]):
     """ Basic binary search tree. """
+    item_node_class = TreeNode
+    key_node_class = KeyTreeNode
 
-    def __init__(self) -> None:
+    def __init__(self, set_mode: bool = False) -> None:
         """
             Initialises an empty Binary Search Tree
+            :param set_mode: if True, the nodes store no item and the item of every key is the key itself,
+            which saves memory when the tree is used as a sorted set
             :complexity: O(1)
         """
 
         self.root = None
         self.length = 0
+        self.set_mode = set_mode
+        self.node_class = self.key_node_class if set_mode else self.item_node_class
+
+    @classmethod
+    def from_sorted(cls, items: Iterable[tuple[K, I]], set_mode: bool = False) -> BinarySearchTree[K, I]:
+        """
+            Builds a tree of minimal height holding the (key, item) pairs given in increasing order of key,
+            without any comparison-driven descent: the middle pair becomes the root, recursively.
+            :raises ValueError: if the keys are not strictly increasing
+            :complexity: O(n * CompK) for n pairs
+        """
+        items = list(items)
+        for i in range(1, len(items)):
+            if not items[i - 1][0] < items[i][0]:
+                raise ValueError('Keys are not in strictly increasing order')
+        tree = cls(set_mode)
+        tree.root = tree.build_balanced(items, 0, len(items))
+        tree.length = len(items)
+        return tree
+
+    @classmethod
+    def from_iterable(cls, items: Iterable[tuple[K, I]], set_mode: bool = False) -> BinarySearchTree[K, I]:
+        """
+            Builds a balanced tree holding the (key, item) pairs given in any order.
+            :raises ValueError: if a key is repeated
+            :complexity: O(n * log(n) * CompK) for n pairs, to sort them
+        """
+        return cls.from_sorted(sorted(items, key=itemgetter(0)), set_mode)
+
+    def build_balanced(self, items: list[tuple[K, I]], lo: int, hi: int) -> TreeNode | None:
+        """
+            Returns the root of a balanced subtree holding the pairs items[lo:hi].
+            The recursion depth is only log(hi - lo).
+            :complexity: O(hi - lo)
+        """
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        current = self.node_class(*items[mid])
+        current.left = self.build_balanced(items, lo, mid)
+        current.right = self.build_balanced(items, mid + 1, hi)
+        self.update(current)
+        return current
+
+    def update(self, current: TreeNode) -> None:
+        """ Recomputes the subtree_size of current from its children.
+            :complexity: O(1)
+        """
+        size = 1
+        if current.left is not None:
+            size += current.left.subtree_size
+        if current.right is not None:
+            size += current.right.subtree_size
+        current.set_subtree_size(size)
 
     def is_empty(self) -> bool:
         """
@@ -47,12 +106,29 @@ class BinarySearchTree(Generic[K, I]):
             Checks to see if the key is in the BST
             :complexity: see __getitem__(self, key: K) -> (K, I)
         """
-        try:
-            _ = self[key]
-        except KeyError:
-            return False
-        else:
-            return True
+        return self.contains(key)
+
+    def contains(self, key: K) -> bool:
+        """ Same as key in self. """
+        return self.find_node(key) is not None
+
+    def get(self, key: K, default: I | None = None) -> I | None:
+        """
+            Returns the item of key, or default if key is not in the tree, without raising KeyError.
+            :complexity: see __getitem__(self, key: K) -> (K, I)
+        """
+        current = self.find_node(key)
+        return default if current is None else current.item
+
+    def find_node(self, key: K, current: TreeNode | None = None) -> TreeNode | None:
+        """ Returns the node with the given key under current (the root by default), or None if there is none. """
+        if current is None:
+            current = self.root
+        while current is not None:
+            if key == current.key:
+                return current
+            current = current.left if key < current.key else current.right
+        return None
 
     def __getitem__(self, key: K) -> I:
         """
@@ -67,37 +143,50 @@ class BinarySearchTree(Generic[K, I]):
         return self.get_tree_node_by_key_aux(self.root, key)
 
     def get_tree_node_by_key_aux(self, current: TreeNode, key: K) -> TreeNode:
-        if current is None:
+        node = None if current is None else self.find_node(key, current)
+        if node is None:
             raise KeyError('Key not found: {0}'.format(key))
-        elif key == current.key:
-            return current
-        elif key < current.key:
-            return self.get_tree_node_by_key_aux(current.left, key)
-        else:  # key > current.key
-            return self.get_tree_node_by_key_aux(current.right, key)
+        return node
 
     def __setitem__(self, key: K, item: I) -> None:
         self.root = self.insert_aux(self.root, key, item)
 
     def insert_aux(self, current: TreeNode, key: K, item: I) -> TreeNode:
         """
-            Attempts to insert an item into the tree, it uses the Key to insert it
+            Attempts to insert an item into the subtree rooted at current, it uses the Key to insert it,
+            and returns the root of the subtree afterwards.
+            The path is walked down once to find the leaf position (so a duplicate is rejected before any
+            subtree_size changes), then walked again to grow the subtree sizes, without recursion.
             :complexity best: O(CompK) inserts the item at the root.
             :complexity worst: O(CompK * D) inserting at the bottom of the tree
             where D is the depth of the tree
             CompK is the complexity of comparing the keys
         """
-        if current is None:  # base case: at the leaf
-            current = TreeNode(key, item=item)
+        new_node = self.node_class(key, item=item)
+        if current is None:
             self.length += 1
-        elif key < current.key:
-            current.set_subtree_size(current.subtree_size + 1)
-            current.left = self.insert_aux(current.left, key, item)
-        elif key > current.key:
-            current.set_subtree_size(current.subtree_size + 1)
-            current.right = self.insert_aux(current.right, key, item)
-        else:  # key == current.key
-            raise ValueError('Inserting duplicate item')
+            return new_node
+
+        parent, node = None, current
+        while node is not None:
+            parent = node
+            if key < node.key:
+                node = node.left
+            elif key > node.key:
+                node = node.right
+            else:  # key == node.key
+                raise ValueError('Inserting duplicate item')
+
+        node = current
+        while node is not parent:
+            node.set_subtree_size(node.subtree_size + 1)
+            node = node.left if key < node.key else node.right
+        parent.set_subtree_size(parent.subtree_size + 1)
+        if key < parent.key:
+            parent.left = new_node
+        else:
+            parent.right = new_node
+        self.length += 1
         return current
 
     def __delitem__(self, key: K) -> None:
@@ -105,32 +194,45 @@ class BinarySearchTree(Generic[K, I]):
 
     def delete_aux(self, current: TreeNode, key: K) -> TreeNode:
         """
-            Attempts to delete an item from the tree, it uses the Key to
-            determine the node to delete.
+            Attempts to delete an item from the subtree rooted at current, it uses the Key to
+            determine the node to delete, and returns the root of the subtree afterwards.
+            As before, a node with two children takes the key and item of its successor, which is then
+            unlinked from the right subtree in the same descent, without searching for its key again.
+            The subtree sizes of the path are only decreased once the key is known to be in the tree.
+            :complexity: O(CompK * D) where D is the depth of the tree
         """
-        if current is None:  # key not found
+        path = []
+        node, parent = current, None
+        while node is not None and key != node.key:
+            path.append(node)
+            parent = node
+            node = node.left if key < node.key else node.right
+        if node is None:  # key not found
             raise ValueError('Deleting non-existent item')
-        elif key < current.key:
-            current.left = self.delete_aux(current.left, key)
-        elif key > current.key:
-            current.right = self.delete_aux(current.right, key)
-        else:  # we found our key => do actual deletion
-            if self.is_leaf(current):
-                self.length -= 1
-                return None
-            elif current.left is None:
-                self.length -= 1
-                return current.right
-            elif current.right is None:
-                self.length -= 1
-                return current.left
-
-            # general case => find a successor
-            succ = self.get_successor(current)
-            current.key = succ.key
-            current.item = succ.item
-            current.right = self.delete_aux(current.right, succ.key)
-        current.set_subtree_size(current.subtree_size - 1)
+
+        for ancestor in path:
+            ancestor.set_subtree_size(ancestor.subtree_size - 1)
+        self.length -= 1
+
+        if node.left is not None and node.right is not None:
+            # general case => move the successor up and unlink it from the right subtree
+            node.set_subtree_size(node.subtree_size - 1)
+            parent, succ = node, node.right
+            while succ.left is not None:
+                succ.set_subtree_size(succ.subtree_size - 1)
+                parent, succ = succ, succ.left
+            node.key = succ.key
+            node.item = succ.item
+            node, replacement = succ, succ.right
+        else:
+            replacement = node.left if node.left is not None else node.right
+
+        if parent is None:
+            return replacement
+        if parent.left is node:
+            parent.left = replacement
+        else:
+            parent.right = replacement
         return current
 
     def get_successor(self, current: TreeNode) -> TreeNode | None:
@@ -195,7 +297,7 @@ class BinarySearchTree(Generic[K, I]):
                 Current is the leaf node of tree, so it does not have any child nodes. Thus, it will return current,
                 hence the complexity of best case is O(1)
 
-            Else, it wil call itself with current.left as parameter until the smallest key is found
+            Else, it keeps moving to current.left until the smallest key is found
 
             Worst case scenario:
                 When current is at the root of the tree, we will need to traverse to the edge of the tree in order to obtain the
@@ -209,16 +311,251 @@ class BinarySearchTree(Generic[K, I]):
                 Second one is the tree is balanced. Depth of the tree will be log(n), n as the number of elements of the tree,
                 hence the complexity will be O(log(n)), n as the number of elements of the tree.
         """
-        if current.left is None:
-            return current
-        else:
-            return self.get_minimal(current.left)
+        while current.left is not None:
+            current = current.left
+        return current
 
     def is_leaf(self, current: TreeNode) -> bool:
         """ Simple check whether or not the node is a leaf. """
 
         return current.left is None and current.right is None
 
+    def __iter__(self) -> Iterator[K]:
+        """ Iterates over the keys in increasing order. """
+        return self.keys()
+
+    def __reversed__(self) -> Iterator[K]:
+        """ Iterates over the keys in decreasing order. """
+        return self.keys(reverse=True)
+
+    def keys(self, lo: K | None = None, hi: K | None = None, reverse: bool = False) -> Iterator[K]:
+        """ Iterates over the keys k with lo <= k <= hi (unbounded if None) in order, see nodes(). """
+        return (current.key for current in self.nodes(lo, hi, reverse))
+
+    def items(self, lo: K | None = None, hi: K | None = None, reverse: bool = False) -> Iterator[tuple[K, I]]:
+        """ Iterates over the (key, item) pairs with lo <= key <= hi (unbounded if None) in order, see nodes(). """
+        return ((current.key, current.item) for current in self.nodes(lo, hi, reverse))
+
+    def nodes(self, lo: K | None = None, hi: K | None = None, reverse: bool = False) -> Iterator[TreeNode]:
+        """
+            Lazily iterates over the nodes whose key k has lo <= k <= hi (unbounded if None), in increasing
+            order of key, or decreasing if reverse. An explicit stack holds the nodes still to be visited on the
+            way back up, and subtrees entirely out of range are never entered.
+            The tree should not be modified while iterating.
+            :complexity: O(D) memory, O(D + O) time to iterate over O nodes, where D is the depth of the tree
+        """
+        if reverse:
+            lo, hi = hi, lo
+        stack = []
+        current = self.root
+        while True:
+            while current is not None:
+                if lo is not None and (lo < current.key if reverse else current.key < lo):
+                    current = current.left if reverse else current.right
+                else:
+                    stack.append(current)
+                    current = current.right if reverse else current.left
+            if not stack:
+                return
+            current = stack.pop()
+            if hi is not None and (current.key < hi if reverse else hi < current.key):
+                return
+            yield current
+            current = current.left if reverse else current.right
+
+    def rank(self, key: K, inclusive: bool = False) -> int:
+        """
+            Returns the number of keys in the tree smaller than key (or smaller than or equal to it if inclusive),
+            adding up the subtree sizes left behind on the way down. key does not have to be in the tree.
+            :complexity: O(CompK * D) where D is the depth of the tree
+        """
+        count = 0
+        current = self.root
+        while current is not None:
+            if key < current.key or (key == current.key and not inclusive):
+                current = current.left
+            else:
+                count += 1
+                if current.left is not None:
+                    count += current.left.subtree_size
+                if key == current.key:
+                    break
+                current = current.right
+        return count
+
+    def count_in_range(self, lo: K, hi: K) -> int:
+        """
+            Returns the number of keys k in the tree with lo <= k <= hi, without visiting them.
+            :complexity: O(CompK * D) where D is the depth of the tree
+        """
+        if hi < lo:
+            return 0
+        return self.rank(hi, inclusive=True) - self.rank(lo)
+
+    def select(self, i: int) -> TreeNode:
+        """
+            Returns the node with the i-th smallest key, counting from 0 (kth_smallest counts from 1).
+            :raises IndexError: if i is not between 0 and len(self) - 1
+            :complexity: O(D) where D is the depth of the tree
+        """
+        if not 0 <= i < self.length:
+            raise IndexError('Index {0} out of range'.format(i))
+        return self.kth_smallest_aux(self.root, i + 1)
+
+    def floor(self, key: K) -> TreeNode | None:
+        """ Returns the node with the largest key smaller than or equal to key, None if there is none.
+            :complexity: O(CompK * D) where D is the depth of the tree
+        """
+        return self.closest_below(key, inclusive=True)
+
+    def ceiling(self, key: K) -> TreeNode | None:
+        """ Returns the node with the smallest key larger than or equal to key, None if there is none.
+            :complexity: O(CompK * D) where D is the depth of the tree
+        """
+        return self.closest_above(key, inclusive=True)
+
+    def predecessor(self, key: K) -> TreeNode | None:
+        """ Returns the node with the largest key smaller than key, None if there is none.
+            :complexity: O(CompK * D) where D is the depth of the tree
+        """
+        return self.closest_below(key, inclusive=False)
+
+    def successor(self, key: K) -> TreeNode | None:
+        """ Returns the node with the smallest key larger than key, None if there is none.
+            key does not have to be in the tree, unlike for get_successor().
+            :complexity: O(CompK * D) where D is the depth of the tree
+        """
+        return self.closest_above(key, inclusive=False)
+
+    def closest_below(self, key: K, inclusive: bool) -> TreeNode | None:
+        best = None
+        current = self.root
+        while current is not None:
+            if current.key < key or (inclusive and current.key == key):
+                best = current
+                current = current.right
+            else:
+                current = current.left
+        return best
+
+    def closest_above(self, key: K, inclusive: bool) -> TreeNode | None:
+        best = None
+        current = self.root
+        while current is not None:
+            if key < current.key or (inclusive and current.key == key):
+                best = current
+                current = current.left
+            else:
+                current = current.right
+        return best
+
+    def split(self, key: K, inclusive: bool = False) -> tuple[BinarySearchTree[K, I], BinarySearchTree[K, I]]:
+        """
+            Splits the tree into one holding the keys smaller than key (or smaller than or equal to it if inclusive)
+            and one holding the rest, reusing the nodes, and returns both. This tree is left empty.
+            :complexity: O(CompK * D) where D is the depth of the tree, O(log n) for an AVLTree
+        """
+        left, right = self.split_aux(self.root, key, inclusive)
+        self.root, self.length = None, 0
+        return self.tree_of(left), self.tree_of(right)
+
+    @classmethod
+    def join(cls, left: BinarySearchTree[K, I], right: BinarySearchTree[K, I]) -> BinarySearchTree[K, I]:
+        """
+            Returns a tree holding the keys of left and right, reusing their nodes. Both are left empty.
+            :pre: every key in left is smaller than every key in right
+            :complexity: O(D) where D is the depth of the trees, O(log n) for AVLTrees
+        """
+        tree = left.tree_of(None)
+        tree.root = tree.join_aux(left.root, right.root)
+        tree.length = tree.size_of(tree.root)
+        left.root, left.length = None, 0
+        right.root, right.length = None, 0
+        return tree
+
+    def delete_range(self, lo: K, hi: K) -> int:
+        """
+            Deletes every key k with lo <= k <= hi, by splitting the tree around the range and joining the rest
+            back, and returns how many keys were deleted.
+            :complexity: O(CompK * D) where D is the depth of the tree, O(log n) for an AVLTree
+        """
+        if hi < lo:
+            return 0
+        left, rest = self.split_aux(self.root, lo, False)
+        removed, right = self.split_aux(rest, hi, True)
+        self.root = self.join_aux(left, right)
+        self.length = self.size_of(self.root)
+        return self.size_of(removed)
+
+    def tree_of(self, root: TreeNode | None) -> BinarySearchTree[K, I]:
+        """ Returns a new tree of the same kind as this one, with the given root. """
+        tree = type(self)(self.set_mode)
+        tree.root = root
+        tree.length = self.size_of(root)
+        return tree
+
+    def size_of(self, current: TreeNode | None) -> int:
+        return 0 if current is None else current.subtree_size
+
+    def split_aux(self, current: TreeNode | None, key: K, inclusive: bool) -> tuple[TreeNode | None, TreeNode | None]:
+        """
+            Splits the subtree rooted at current into the roots of two subtrees, the first holding the keys smaller than
+            key (or smaller than or equal to it if inclusive). Walks down to where key would be, then back up joining
+            each node of the path, with the side of it not walked into, onto the left or right result.
+            :complexity: O(CompK * D) where D is the depth of the subtree
+        """
+        path = []
+        while current is not None:
+            path.append(current)
+            current = current.right if current.key < key or (inclusive and current.key == key) else current.left
+        left = right = None
+        for node in reversed(path):
+            if node.key < key or (inclusive and node.key == key):
+                left = self.join_with(node.left, node, left)
+            else:
+                right = self.join_with(right, node, node.right)
+        return left, right
+
+    def join_aux(self, left: TreeNode | None, right: TreeNode | None) -> TreeNode | None:
+        """
+            Joins the subtrees rooted at left and right into one, using the minimum of right as the new node in between.
+            :pre: every key under left is smaller than every key under right
+        """
+        if left is None:
+            return right
+        if right is None:
+            return left
+        middle, right = self.detach_min(right)
+        return self.join_with(left, middle, right)
+
+    def detach_min(self, current: TreeNode) -> tuple[TreeNode, TreeNode | None]:
+        """
+            Unlinks the node with the smallest key from the subtree rooted at current, without changing the length
+            of the tree, and returns it together with the root of the rest of the subtree.
+            :pre: current is not None
+            :complexity: O(D) where D is the depth of the subtree
+        """
+        parent, node = None, current
+        while node.left is not None:
+            node.set_subtree_size(node.subtree_size - 1)
+            parent, node = node, node.left
+        rest = node.right
+        node.right = None
+        if parent is None:
+            return node, rest
+        parent.left = rest
+        return node, current
+
+    def join_with(self, left: TreeNode | None, middle: TreeNode, right: TreeNode | None) -> TreeNode:
+        """
+            Returns the root of a subtree holding middle with the subtrees left and right on each side.
+            :pre: the keys under left are smaller than middle.key, and those under right larger
+            :complexity: O(1)
+        """
+        middle.left, middle.right = left, right
+        self.update(middle)
+        return middle
+
     def draw(self, to=sys.stdout):
         """ Draw the tree in the terminal. """
 
@@ -275,25 +612,30 @@ class BinarySearchTree(Generic[K, I]):
                Explanation:
                    There are several conditions to check before we find the kth smallest value by key in the subtree rooted at current:
                        (i) If k value is smaller than (nodes_travelled + left_subtree_elem) and current node has a left child, means that the kth smallest element will surely be in the current left-subtree
-                           Recursively calls the kth_smallest_aux and pass the current left child as argument
+                           Moves to the current left child
                        (ii) If nodes_travelled + left_subtree_elem + 1 equals to k, the reason we +1 is we have to count the current node itself, means we found the kth smallest element
                        (iii) If k value is bigger than (nodes_travelled + left_subtree_elem) and current node has a right child, means that the kth smallest element will surely be in the current right-subtree
-                           Recursively calls the kth_smallest_aux and pass the current right child as argument
+                           Moves to the current right child, counting the left subtree and current node as travelled
+                   This is repeated in a loop until the node is found, or None is returned if there is no such node.
                """
-        if current.left is None:  # O(1)
-            left_subtree_elem = 0  # O(1)
-        else:
-            left_subtree_elem = current.left.subtree_size  # O(1)
-
-        # If k value is smaller than (nodes_travelled + left_subtree_elem) and current node has a left child, means that the kth smallest element will surely be in the current left-subtree
-        if nodes_travelled + left_subtree_elem >= k and current.left is not None:  # O(1)
-            return self.kth_smallest_aux(current.left, k, nodes_travelled)
-
-        # In this condition, the reason we +1 is we have to count the current node itself
-        elif nodes_travelled + left_subtree_elem + 1 == k:  # O(1)
-            return current  # O(1)
-
-        # If k value is bigger than (nodes_travelled + left_subtree_elem) and current node has a right child, means that the kth smallest element will surely be in the current right-subtree
-        elif nodes_travelled + left_subtree_elem + 1 < k and current.right is not None:
-            return self.kth_smallest_aux(current.right, k, nodes_travelled + left_subtree_elem + 1)
-
+        while current is not None:
+            if current.left is None:  # O(1)
+                left_subtree_elem = 0  # O(1)
+            else:
+                left_subtree_elem = current.left.subtree_size  # O(1)
+
+            # If k value is smaller than (nodes_travelled + left_subtree_elem) and current node has a left child, means that the kth smallest element will surely be in the current left-subtree
+            if nodes_travelled + left_subtree_elem >= k and current.left is not None:  # O(1)
+                current = current.left
+
+            # In this condition, the reason we +1 is we have to count the current node itself
+            elif nodes_travelled + left_subtree_elem + 1 == k:  # O(1)
+                return current  # O(1)
+
+            # If k value is bigger than (nodes_travelled + left_subtree_elem) and current node has a right child, means that the kth smallest element will surely be in the current right-subtree
+            elif nodes_travelled + left_subtree_elem + 1 < k and current.right is not None:
+                nodes_travelled += left_subtree_elem + 1
+                current = current.right
+
+            else:
+                return None
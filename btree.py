@@ -0,0 +1,476 @@
+""" B-Tree ADT.
+    Defines an ordered map with the same interface as BinarySearchTree, stored in a B-tree: every node
+    holds between t - 1 and 2t - 1 sorted keys (t being the minimum degree), and all leaves are at the
+    same depth. With wide nodes the tree is about log(t) times shallower than a binary one, and the keys
+    of a node are searched with bisect over a Python list instead of following one pointer per key.
+    Every node records the number of keys in its subtree, for kth_smallest and rank.
+"""
+
+from __future__ import annotations
+
+__docformat__ = 'reStructuredText'
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Generic, Iterable, Iterator, TypeVar
+
+K = TypeVar('K')
+I = TypeVar('I')
+
+
+@dataclass(slots=True, frozen=True)
+class BTreeEntry(Generic[K, I]):
+    """ A key of a BTree with its item, as returned by kth_smallest. """
+
+    key: K
+    item: I
+
+
+class BTreeNode(Generic[K, I]):
+    """ Node of a BTree: sorted keys, their items (None in set mode) and, unless a leaf, one more child than keys. """
+    __slots__ = ('keys', 'items', 'children', 'subtree_size')
+
+    def __init__(self, keys: list[K], items: list[I] | None, children: list[BTreeNode] | None = None) -> None:
+        self.keys = keys
+        self.items = items
+        self.children = children if children is not None else []
+        self.subtree_size = len(keys) + sum(child.subtree_size for child in self.children)
+
+    def is_leaf(self) -> bool:
+        return not self.children
+
+    def item_at(self, i: int) -> I:
+        return self.keys[i] if self.items is None else self.items[i]
+
+    def __str__(self):
+        return '({0}, [{1}])'.format(self.keys, self.subtree_size)
+
+
+class BTree(Generic[K, I]):
+    """ Ordered map stored in a B-tree of minimum degree t. """
+    DEFAULT_DEGREE = 32
+
+    def __init__(self, set_mode: bool = False, t: int = DEFAULT_DEGREE) -> None:
+        """
+            Initialises an empty B-tree
+            :param set_mode: if True, no items are stored and the item of every key is the key itself
+            :param t: minimum degree, so that nodes other than the root hold t - 1 to 2t - 1 keys
+            :complexity: O(1)
+        """
+        if t < 2:
+            raise ValueError('B-tree minimum degree should be at least 2.')
+        self.t = t
+        self.set_mode = set_mode
+        self.root = None
+        self.length = 0
+
+    @classmethod
+    def from_sorted(cls, items: Iterable[tuple[K, I]], set_mode: bool = False,
+                    t: int = DEFAULT_DEGREE) -> BTree[K, I]:
+        """
+            Builds a B-tree holding the (key, item) pairs given in increasing order of key, level by level
+            from the leaves up, with the keys spread as evenly as possible over the fewest nodes.
+            :raises ValueError: if the keys are not strictly increasing
+            :complexity: O(n * CompK) for n pairs
+        """
+        items = list(items)
+        for i in range(1, len(items)):
+            if not items[i - 1][0] < items[i][0]:
+                raise ValueError('Keys are not in strictly increasing order')
+        tree = cls(set_mode, t)
+        tree.length = len(items)
+        if not items:
+            return tree
+
+        nodes, separators = [], []
+        sizes = tree.spread(len(items), 2 * t)
+        start = 0
+        for size in sizes:
+            nodes.append(tree.make_node(items[start:start + size]))
+            if start + size < len(items):
+                separators.append(items[start + size])
+            start += size + 1
+
+        while len(nodes) > 1:
+            parents, parent_separators = [], []
+            start = 0
+            for size in tree.spread(len(nodes) - 1, 2 * t):  # size separators per parent, size + 1 children
+                parents.append(tree.make_node(separators[start:start + size], nodes[start:start + size + 1]))
+                if start + size < len(separators):
+                    parent_separators.append(separators[start + size])
+                start += size + 1
+            nodes, separators = parents, parent_separators
+        tree.root = nodes[0]
+        return tree
+
+    @classmethod
+    def from_iterable(cls, items: Iterable[tuple[K, I]], set_mode: bool = False,
+                      t: int = DEFAULT_DEGREE) -> BTree[K, I]:
+        """
+            Builds a B-tree holding the (key, item) pairs given in any order.
+            :raises ValueError: if a key is repeated
+            :complexity: O(n * log(n) * CompK) for n pairs, to sort them
+        """
+        return cls.from_sorted(sorted(items, key=itemgetter(0)), set_mode, t)
+
+    @staticmethod
+    def spread(total: int, width: int) -> list[int]:
+        """
+            Splits a level of total keys into the fewest nodes holding less than width keys each,
+            taking one separator key out between consecutive nodes, and returns the size of each node.
+            With two nodes or more every node gets at least width // 2 - 1 keys.
+        """
+        count = (total + width) // width  # ceil((total + 1) / width)
+        keys = total - (count - 1)
+        return [keys // count + (1 if i < keys % count else 0) for i in range(count)]
+
+    def make_node(self, items: list[tuple[K, I]], children: list[BTreeNode] | None = None) -> BTreeNode:
+        keys = [key for key, _ in items]
+        return BTreeNode(keys, None if self.set_mode else [item for _, item in items], children)
+
+    def is_empty(self) -> bool:
+        return self.root is None
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __contains__(self, key: K) -> bool:
+        return self.contains(key)
+
+    def contains(self, key: K) -> bool:
+        """ Same as key in self. """
+        return self.find(key)[0] is not None
+
+    def get(self, key: K, default: I | None = None) -> I | None:
+        """
+            Returns the item of key, or default if key is not in the tree, without raising KeyError.
+            :complexity: O(log(t) * log_t(n) * CompK)
+        """
+        current, i = self.find(key)
+        return default if current is None else current.item_at(i)
+
+    def __getitem__(self, key: K) -> I:
+        """
+            :raises KeyError: if key is not in the tree
+            :complexity: O(log(t) * log_t(n) * CompK)
+        """
+        current, i = self.find(key)
+        if current is None:
+            raise KeyError('Key not found: {0}'.format(key))
+        return current.item_at(i)
+
+    def find(self, key: K) -> tuple[BTreeNode | None, int]:
+        """ Returns the node holding key and its index in the node, or (None, -1) if key is not in the tree. """
+        current = self.root
+        while current is not None:
+            i = bisect_left(current.keys, key)
+            if i < len(current.keys) and current.keys[i] == key:
+                return current, i
+            current = current.children[i] if current.children else None
+        return None, -1
+
+    def __setitem__(self, key: K, item: I) -> None:
+        """
+            Inserts key in one pass down the tree, splitting every full node on the way so that the
+            leaf reached has room for it. The subtree sizes of the path are only increased once the key is
+            known not to be in the tree.
+            :raises ValueError: if key is already in the tree
+            :complexity: O(t * log_t(n) + log(t) * log_t(n) * CompK)
+        """
+        if self.set_mode and item is not None and item is not key and item != key:
+            raise ValueError('The item of a key in set mode is the key itself')
+        if self.root is None:
+            self.root = BTreeNode([key], None if self.set_mode else [item])
+            self.length += 1
+            return
+        if len(self.root.keys) == 2 * self.t - 1:
+            self.root = BTreeNode([], None if self.set_mode else [], [self.root])
+            self.split_child(self.root, 0)
+
+        path = []
+        current = self.root
+        while True:
+            i = bisect_left(current.keys, key)
+            if i < len(current.keys) and current.keys[i] == key:
+                raise ValueError('Inserting duplicate item')
+            if current.is_leaf():
+                break
+            path.append(current)
+            if len(current.children[i].keys) == 2 * self.t - 1:
+                self.split_child(current, i)
+                if current.keys[i] == key:
+                    raise ValueError('Inserting duplicate item')
+                if current.keys[i] < key:
+                    i += 1
+            current = current.children[i]
+
+        current.keys.insert(i, key)
+        if current.items is not None:
+            current.items.insert(i, item)
+        current.subtree_size += 1
+        for node in path:
+            node.subtree_size += 1
+        self.length += 1
+
+    def split_child(self, parent: BTreeNode, i: int) -> None:
+        """
+            Splits the full child i of parent around its median key, which moves up into parent.
+            :pre: parent is not full and its child i holds 2t - 1 keys
+            :complexity: O(t)
+        """
+        t = self.t
+        child = parent.children[i]
+        right = BTreeNode(child.keys[t:], None if child.items is None else child.items[t:], child.children[t:])
+        parent.keys.insert(i, child.keys[t - 1])
+        if parent.items is not None:
+            parent.items.insert(i, child.items[t - 1])
+        parent.children.insert(i + 1, right)
+        del child.keys[t - 1:]
+        if child.items is not None:
+            del child.items[t - 1:]
+        del child.children[t:]
+        child.subtree_size -= right.subtree_size + 1
+
+    def __delitem__(self, key: K) -> None:
+        """
+            Deletes key in one pass down the tree. Before moving into a child holding only t - 1 keys, that child
+            borrows a key from a sibling or is merged with one, so the key can always be removed from a leaf
+            (a key in an internal node is first replaced by its predecessor or successor).
+            :raises ValueError: if key is not in the tree
+            :complexity: O(t * log_t(n) + log(t) * log_t(n) * CompK)
+        """
+        if key not in self:
+            raise ValueError('Deleting non-existent item')
+        t = self.t
+        current = self.root
+        while True:
+            current.subtree_size -= 1
+            i = bisect_left(current.keys, key)
+            found = i < len(current.keys) and current.keys[i] == key
+            if current.is_leaf():
+                del current.keys[i]
+                if current.items is not None:
+                    del current.items[i]
+                break
+            if found:
+                left, right = current.children[i], current.children[i + 1]
+                if len(left.keys) >= t:
+                    key = self.replace_key(current, i, left, -1)
+                    current = left
+                elif len(right.keys) >= t:
+                    key = self.replace_key(current, i, right, 0)
+                    current = right
+                else:
+                    self.merge_children(current, i)
+                    current = left
+            else:
+                if len(current.children[i].keys) == t - 1:
+                    i = self.fill_child(current, i)
+                current = current.children[i]
+
+        self.length -= 1
+        if not self.root.keys:
+            self.root = self.root.children[0] if self.root.children else None
+
+    def replace_key(self, parent: BTreeNode, i: int, child: BTreeNode, end: int) -> K:
+        """
+            Replaces key i of parent by the largest key in the subtree of child (end = -1) or the smallest one
+            (end = 0), and returns that key, which is then deleted from the subtree of child.
+            :complexity: O(log_t(n))
+        """
+        node = child
+        while node.children:
+            node = node.children[end]
+        replacement = node.keys[end]
+        parent.keys[i] = replacement
+        if parent.items is not None:
+            parent.items[i] = node.items[end]
+        return replacement
+
+    def merge_children(self, parent: BTreeNode, i: int) -> None:
+        """
+            Merges child i + 1 of parent and key i of parent into child i.
+            :pre: both children hold t - 1 keys
+            :complexity: O(t)
+        """
+        left, right = parent.children[i], parent.children.pop(i + 1)
+        left.keys.append(parent.keys.pop(i))
+        left.keys.extend(right.keys)
+        if parent.items is not None:
+            left.items.append(parent.items.pop(i))
+            left.items.extend(right.items)
+        left.children.extend(right.children)
+        left.subtree_size += right.subtree_size + 1
+
+    def fill_child(self, parent: BTreeNode, i: int) -> int:
+        """
+            Gives child i of parent, which holds t - 1 keys, at least t keys by rotating one through parent from
+            a sibling with t keys or more, or else by merging it with a sibling. Returns the new index of the child.
+            :complexity: O(t)
+        """
+        t = self.t
+        child = parent.children[i]
+        if i > 0 and len(parent.children[i - 1].keys) >= t:
+            sibling = parent.children[i - 1]
+            child.keys.insert(0, parent.keys[i - 1])
+            parent.keys[i - 1] = sibling.keys.pop()
+            if parent.items is not None:
+                child.items.insert(0, parent.items[i - 1])
+                parent.items[i - 1] = sibling.items.pop()
+            moved = 1
+            if sibling.children:
+                grandchild = sibling.children.pop()
+                child.children.insert(0, grandchild)
+                moved += grandchild.subtree_size
+            child.subtree_size += moved
+            sibling.subtree_size -= moved
+            return i
+        if i < len(parent.keys) and len(parent.children[i + 1].keys) >= t:
+            sibling = parent.children[i + 1]
+            child.keys.append(parent.keys[i])
+            parent.keys[i] = sibling.keys.pop(0)
+            if parent.items is not None:
+                child.items.append(parent.items[i])
+                parent.items[i] = sibling.items.pop(0)
+            moved = 1
+            if sibling.children:
+                grandchild = sibling.children.pop(0)
+                child.children.append(grandchild)
+                moved += grandchild.subtree_size
+            child.subtree_size += moved
+            sibling.subtree_size -= moved
+            return i
+        if i < len(parent.keys):
+            self.merge_children(parent, i)
+            return i
+        self.merge_children(parent, i - 1)
+        return i - 1
+
+    def kth_smallest(self, k: int, current: BTreeNode | None = None) -> BTreeEntry[K, I] | None:
+        """
+            Finds the kth smallest key (counting from 1) in the subtree rooted at current, the whole tree by default,
+            using the subtree sizes of the children to skip them. Returns None if there is no such key.
+            :complexity: O(t * log_t(n))
+        """
+        if current is None:
+            current = self.root
+        while current is not None and 1 <= k <= current.subtree_size:
+            if current.is_leaf():
+                return BTreeEntry(current.keys[k - 1], current.item_at(k - 1))
+            for i, child in enumerate(current.children):
+                if k <= child.subtree_size:
+                    current = child
+                    break
+                k -= child.subtree_size
+                if k == 1:
+                    return BTreeEntry(current.keys[i], current.item_at(i))
+                k -= 1
+        return None
+
+    def select(self, i: int) -> BTreeEntry[K, I]:
+        """
+            Returns the i-th smallest key with its item, counting from 0.
+            :raises IndexError: if i is not between 0 and len(self) - 1
+        """
+        if not 0 <= i < self.length:
+            raise IndexError('Index {0} out of range'.format(i))
+        return self.kth_smallest(i + 1)
+
+    def rank(self, key: K, inclusive: bool = False) -> int:
+        """
+            Returns the number of keys smaller than key (or smaller than or equal to it if inclusive).
+            :complexity: O(t * log_t(n))
+        """
+        count = 0
+        current = self.root
+        while current is not None:
+            i = (bisect_right if inclusive else bisect_left)(current.keys, key)
+            count += i + sum(child.subtree_size for child in current.children[:i])
+            if inclusive and i > 0 and current.keys[i - 1] == key:
+                break
+            if not inclusive and i < len(current.keys) and current.keys[i] == key:
+                if current.children:
+                    count += current.children[i].subtree_size
+                break
+            current = current.children[i] if current.children else None
+        return count
+
+    def count_in_range(self, lo: K, hi: K) -> int:
+        """
+            Returns the number of keys k with lo <= k <= hi, without visiting them.
+            :complexity: O(t * log_t(n))
+        """
+        if hi < lo:
+            return 0
+        return self.rank(hi, inclusive=True) - self.rank(lo)
+
+    def delete_range(self, lo: K, hi: K) -> int:
+        """
+            Deletes every key k with lo <= k <= hi and returns how many keys were deleted.
+            The keys are deleted one at a time; B-trees have no cheap split and join like binary trees.
+            :complexity: O(m * t * log_t(n)) for m keys deleted
+        """
+        if hi < lo:
+            return 0
+        removed = list(self.keys(lo, hi))
+        for key in removed:
+            del self[key]
+        return len(removed)
+
+    def __iter__(self) -> Iterator[K]:
+        return self.keys()
+
+    def __reversed__(self) -> Iterator[K]:
+        return self.keys(reverse=True)
+
+    def keys(self, lo: K | None = None, hi: K | None = None, reverse: bool = False) -> Iterator[K]:
+        """ Iterates over the keys k with lo <= k <= hi (unbounded if None) in order, see items(). """
+        return map(itemgetter(0), self.items(lo, hi, reverse))
+
+    def items(self, lo: K | None = None, hi: K | None = None, reverse: bool = False) -> Iterator[tuple[K, I]]:
+        """
+            Lazily iterates over the (key, item) pairs with lo <= key <= hi (unbounded if None), in increasing
+            order of key, or decreasing if reverse. The stack holds one (node, index) pair per level.
+            The tree should not be modified while iterating.
+            :complexity: O(log_t(n)) memory, O(1) amortised time per pair after O(log(t) * log_t(n)) to find the start
+        """
+        if reverse:
+            lo, hi = hi, lo
+        stack = []
+        current = self.root
+        while current is not None:
+            if lo is None:
+                i = len(current.keys) - 1 if reverse else 0
+            else:
+                i = bisect_right(current.keys, lo) - 1 if reverse else bisect_left(current.keys, lo)
+            stack.append([current, i])
+            if not current.children:
+                break
+            current = current.children[i + 1 if reverse else i]
+
+        step = -1 if reverse else 1
+        while stack:
+            current, i = stack[-1]
+            if not 0 <= i < len(current.keys):
+                stack.pop()
+                continue
+            key = current.keys[i]
+            if hi is not None and (key < hi if reverse else hi < key):
+                return
+            yield key, current.item_at(i)
+            stack[-1][1] = i + step
+            if current.children:
+                child = current.children[i if reverse else i + 1]
+                while child is not None:
+                    stack.append([child, len(child.keys) - 1 if reverse else 0])
+                    child = (child.children[-1 if reverse else 0]) if child.children else None
+
+    def height(self) -> int:
+        """ Returns the number of levels of the tree, 0 if empty. """
+        levels = 0
+        current = self.root
+        while current is not None:
+            levels += 1
+            current = current.children[0] if current.children else None
+        return levels
@@ -3,40 +3,110 @@ from __future__ import annotations
 __author__ = "Brendon Taylor, modified by Jackson Goerner"
 __docformat__ = 'reStructuredText'
 
-from typing import Generic
-from referential_array import ArrayR, T
+from ctypes import c_int64, py_object
+from typing import Callable, Generic, Hashable, Iterable, Iterator
+from referential_array import ArrayR, T, TypedArrayR
 
 
 class MaxHeap(Generic[T]):
     MIN_CAPACITY = 1
+    no_element = None  # what the free slots of the_array hold
 
-    def __init__(self, max_size: int) -> None:
+    def __init__(self, max_size: int, growable: bool = False, shrinkable: bool = False, arity: int = 2) -> None:
+        """
+        :param max_size: initial number of elements the heap can hold
+        :param growable: if True, a full heap doubles its capacity on add() instead of raising IndexError
+        :param shrinkable: if True (only with growable), the capacity is halved once the heap is a quarter full
+        :param arity: number of children of each node; the children of k are arity*(k-1)+2 to arity*k+1
+        :complexity: O(max_size)
+        """
+        if arity < 2:
+            raise ValueError("Heap arity should be at least 2.")
         self.length = 0
-        self.the_array = ArrayR(max(self.MIN_CAPACITY, max_size) + 1)
+        self.arity = arity
+        self.growable = growable
+        self.shrinkable = growable and shrinkable
+        self.the_array = self.new_array(max(self.MIN_CAPACITY, max_size) + 1)
+
+    def new_array(self, length: int) -> ArrayR[T]:
+        """ Returns an empty array of elements of the given length. """
+        return ArrayR(length)
 
     def __len__(self) -> int:
         return self.length
 
+    def __iter__(self) -> Iterator[T]:
+        """ Iterates over all elements in array order, which is not sorted. """
+        if self.length > 0:
+            yield from self.the_array.window(1, self.length + 1)
+
     def is_full(self) -> bool:
         return self.length + 1 == len(self.the_array)
 
+    def capacity(self) -> int:
+        """ Returns the number of elements the heap can hold before it is full. """
+        return len(self.the_array) - 1
+
+    def resize(self, new_capacity: int) -> None:
+        """
+        Moves the elements into a new array able to hold new_capacity elements.
+        :pre: new_capacity >= self.length
+        :complexity: O(new_capacity)
+        """
+        new_array = self.new_array(max(self.MIN_CAPACITY, new_capacity) + 1)
+        self.the_array.copy_into(new_array, 1, 1, self.length)
+        self.the_array = new_array
+
+    def ensure_capacity(self, n: int) -> None:
+        """
+        Makes sure n elements fit in the heap, doubling the capacity as many times as needed.
+        :raises IndexError: if n elements do not fit and the heap is not growable
+        :complexity: O(n) when resizing, O(1) otherwise
+        """
+        if n <= self.capacity():
+            return
+        if not self.growable:
+            raise IndexError
+        new_capacity = self.capacity()
+        while new_capacity < n:
+            new_capacity *= 2
+        self.resize(new_capacity)
+
+    def _maybe_shrink(self) -> None:
+        """ Halves the capacity when a shrinkable heap is at most a quarter full. """
+        if self.shrinkable and self.capacity() > self.MIN_CAPACITY and 4 * self.length <= self.capacity():
+            self.resize(self.capacity() // 2)
+
+    def parent_index(self, k: int) -> int:
+        """ Returns the index of k's parent, 0 for the root. """
+        return (k - 2) // self.arity + 1
+
+    def first_child_index(self, k: int) -> int:
+        """ Returns the index of k's first child, which may be past self.length. """
+        return self.arity * (k - 1) + 2
+
     def rise(self, k: int) -> None:
         """
         Rise element at index k to its correct position
         :pre: 1 <= k <= self.length
         """
+        arity = self.arity
         item = self.the_array[k]
-        while k > 1 and item > self.the_array[k // 2]:
-            self.the_array[k] = self.the_array[k // 2]
-            k = k // 2
+        while k > 1:
+            parent = (k - 2) // arity + 1
+            if not item > self.the_array[parent]:
+                break
+            self.the_array[k] = self.the_array[parent]
+            k = parent
         self.the_array[k] = item
 
     def add(self, element: T) -> bool:
         """
         Swaps elements while rising
+        :complexity: O(log n), amortised O(log n) when the heap has to grow
         """
         if self.is_full():
-            raise IndexError
+            self.ensure_capacity(self.length + 1)
 
         self.length += 1
         self.the_array[self.length] = element
@@ -44,24 +114,29 @@ class MaxHeap(Generic[T]):
 
     def largest_child(self, k: int) -> int:
         """
-        Returns the index of k's child with greatest value.
-        :pre: 1 <= k <= self.length // 2
+        Returns the index of k's child with greatest value (the last one on ties).
+        :pre: 1 <= k <= self.parent_index(self.length)
         """
-        
-        if 2 * k == self.length or \
-                self.the_array[2 * k] > self.the_array[2 * k + 1]:
-            return 2 * k
-        else:
+        if self.arity == 2:
+            if 2 * k == self.length or self.the_array[2 * k] > self.the_array[2 * k + 1]:
+                return 2 * k
             return 2 * k + 1
+        first = self.arity * (k - 1) + 2
+        largest = first
+        for child in range(first + 1, min(first + self.arity, self.length + 1)):
+            if not self.the_array[largest] > self.the_array[child]:
+                largest = child
+        return largest
 
     def sink(self, k: int) -> None:
         """ Make the element at index k sink to the correct position.
             :pre: 1 <= k <= self.length
-            :complexity: ???
+            :complexity: O(arity * log_arity(n))
         """
+        arity = self.arity
         item = self.the_array[k]
 
-        while 2 * k <= self.length:
+        while arity * (k - 1) + 2 <= self.length:
             max_child = self.largest_child(k)
             if self.the_array[max_child] <= item:
                 break
@@ -80,8 +155,128 @@ class MaxHeap(Generic[T]):
         if self.length > 0:
             self.the_array[1] = self.the_array[self.length+1]
             self.sink(1)
+        self.the_array[self.length+1] = self.no_element
+        self._maybe_shrink()
         return max_elt
 
+    def peek_max(self) -> T:
+        """ Return the maximum element without removing it. """
+        if self.length == 0:
+            raise IndexError
+        return self.the_array[1]
+
+    def replace_max(self, element: T) -> T:
+        """ Remove and return the maximum element, then add element, using a single sink.
+            :complexity: O(log n)
+        """
+        if self.length == 0:
+            raise IndexError
+
+        max_elt = self.the_array[1]
+        self.the_array[1] = element
+        self.sink(1)
+        return max_elt
+
+    def priority_at(self) -> Callable[[int], T]:
+        """ Returns a function giving the value the heap orders index k by. """
+        return self.the_array.__getitem__
+
+    def peek_top_k(self, k: int) -> list[T]:
+        """ Returns the k largest elements in descending order (fewer if the heap is smaller) without changing the heap.
+            Indices are explored from the root with a small frontier heap of candidate indices, ordered by their elements.
+            :complexity: O(k * arity * log(k * arity))
+        """
+        result = []
+        if k <= 0 or self.length == 0:
+            return result
+        arity, length = self.arity, self.length
+        frontier = KeyedMaxHeap(min(k * arity, length), self.priority_at(), growable=True, arity=arity, identity=int)
+        frontier.add(1)
+        while len(result) < k and len(frontier) > 0:
+            index = frontier.get_max()
+            result.append(self.the_array[index])
+            first = arity * (index - 1) + 2
+            for child in range(first, min(first + arity, length + 1)):
+                frontier.add(child)
+        return result
+
+    def push_pop(self, element: T) -> T:
+        """ Add element, then remove and return the maximum element, using at most a single sink.
+            :complexity: O(1) if element is at least the maximum, O(log n) otherwise
+        """
+        if self.length == 0 or not self.the_array[1] > element:
+            return element
+        return self.replace_max(element)
+
+    def store(self, k: int, element: T) -> None:
+        """ Puts a new element at index k without restoring the heap property. """
+        self.the_array[k] = element
+
+    def extend(self, elements: Iterable[T]) -> None:
+        """
+        Adds all elements (any iterable, e.g. a generator) to the heap, keeping the elements already in it.
+        The new elements are appended and then only the parents of the appended range are sunk, level by level.
+        If an element cannot be added, the ones appended before it are still sunk before the error is raised.
+        :raises IndexError: if the elements do not fit and the heap is not growable
+        :complexity: O(m + log(n)^2) for m new elements in a heap of n elements
+        """
+        start = self.length + 1
+        try:
+            self.extend_ordered(elements)
+        finally:
+            if start <= self.length:
+                self.heapify_range(start, self.length)
+
+    def extend_ordered(self, elements: Iterable[T]) -> None:
+        """
+        Appends elements without comparing them, for elements known to already be in heap order,
+        e.g. the array order of a heap with the same arity that was saved earlier.
+        :pre: the elements in the heap followed by elements satisfy the heap property
+        :raises IndexError: if the elements do not fit and the heap is not growable
+        :complexity: O(m) for m new elements
+        """
+        if hasattr(elements, '__len__'):
+            self.ensure_capacity(self.length + len(elements))
+        for element in elements:
+            if self.is_full():
+                self.ensure_capacity(self.length + 1)
+            self.store(self.length + 1, element)
+            self.length += 1
+
+    def heapify_range(self, lo: int, hi: int) -> None:
+        """
+        Restores the heap property after the elements at indices lo to hi were changed, by sinking
+        their ancestors bottom-up, one level at a time.
+        :pre: lo <= hi <= self.length
+        :complexity: O((hi - lo) + log(n)^2)
+        """
+        lo, hi = self.parent_index(lo), self.parent_index(hi)
+        while hi >= 1:
+            for k in range(hi, max(lo, 1) - 1, -1):
+                self.sink(k)
+            if lo <= 1:
+                break
+            lo, hi = self.parent_index(lo), self.parent_index(hi)
+
+    def rebuild(self) -> None:
+        """ Restores the heap property after the priorities of any elements were changed in place.
+            :complexity: O(n)
+        """
+        if self.length > 0:
+            self.heapify_range(1, self.length)
+
+    def clear(self) -> None:
+        """ Removes all elements, keeping the capacity. """
+        self.the_array[1:self.length + 1] = [self.no_element] * self.length
+        self.length = 0
+
+    def merge(self, other: MaxHeap[T]) -> None:
+        """ Moves all elements of other into this heap, leaving other empty.
+            :complexity: O(m + log(n)^2) for m elements in other
+        """
+        self.extend(list(other))
+        other.clear()
+
     def heapify(self, an_array: list) -> None:
         """
         To construct a heap using bottom-up heap construction and Apply bottom-up heap construction in O(n) time.
@@ -93,15 +288,429 @@ class MaxHeap(Generic[T]):
             Best Case = Worst Case : O(n), n as the number of elements in an_array
 
         Explanation :
-            First, we copy the original list into a new list with n+1 capacity by using a for loop ( Time Complexity : O(n), n as the number of elements in an_array )
+            First, we copy the original list into a new list with n+1 capacity by using a single slice assignment ( Time Complexity : O(n), n as the number of elements in an_array )
             Then, we sink all parents starting from the height-1 level by using a for loop and sink() method to ensure the heap is accurate
             Thus, the overall complexity will be O(n), where n is the number of elements in an_arrayt
         """
-        for i in range(self.length):
-            self.the_array[i+1] = an_array[i]
+        self.ensure_capacity(self.length)
+        self.the_array[1:self.length + 1] = an_array[:self.length]
+
+        for i in range(self.parent_index(self.length), 0, -1):
+            self.sink(i)
+
+
+class IndexedMaxHeap(MaxHeap[T]):
+    """
+    Max heap which also keeps track of the index of every element, so that an element
+    already in the heap can be updated or removed in O(log n).
+    Elements are tracked by identity(element), which is id by default so elements do not
+    need to be hashable, but the same object cannot be added twice.
+    """
+
+    def __init__(self, max_size: int, growable: bool = False, shrinkable: bool = False, arity: int = 2,
+                 identity: Callable[[T], Hashable] = id) -> None:
+        MaxHeap.__init__(self, max_size, growable, shrinkable, arity)
+        self.identity = identity
+        self.position = self.new_position()
+
+    def new_position(self) -> dict:
+        """ Returns an empty map from identity(element) to the index of element. """
+        return {}
+
+    def __contains__(self, element: T) -> bool:
+        return self.contains(element)
+
+    def contains(self, element: T) -> bool:
+        """ Checks whether element is in the heap, comparing by identity(element).
+            :complexity: O(1)
+        """
+        return self.identity(element) in self.position
+
+    def index_of(self, element: T) -> int:
+        """ Returns the index of element in the_array.
+            :raises KeyError: if element is not in the heap
+        """
+        if self.identity(element) not in self.position:
+            raise KeyError(element)
+        return self.position[self.identity(element)]
+
+    def rise(self, k: int) -> None:
+        """
+        Rise element at index k to its correct position, updating the positions of all moved elements
+        :pre: 1 <= k <= self.length
+        """
+        the_array, position, arity, identity = self.the_array, self.position, self.arity, self.identity
+        item = the_array[k]
+        while k > 1:
+            parent_k = (k - 2) // arity + 1
+            parent = the_array[parent_k]
+            if not item > parent:
+                break
+            the_array[k] = parent
+            position[identity(parent)] = k
+            k = parent_k
+        the_array[k] = item
+        position[identity(item)] = k
+
+    def sink(self, k: int) -> None:
+        """
+        Make the element at index k sink to the correct position, updating the positions of all moved elements
+        :pre: 1 <= k <= self.length
+        """
+        the_array, position, arity, identity = self.the_array, self.position, self.arity, self.identity
+        item = the_array[k]
+
+        while arity * (k - 1) + 2 <= self.length:
+            max_child = self.largest_child(k)
+            child = the_array[max_child]
+            if child <= item:
+                break
+            the_array[k] = child
+            position[identity(child)] = k
+            k = max_child
+
+        the_array[k] = item
+        position[identity(item)] = k
+
+    def add(self, element: T) -> None:
+        """
+        :raises ValueError: if element is already in the heap
+        :complexity: O(log n)
+        """
+        if self.identity(element) in self.position:
+            raise ValueError('Adding an element already in the heap')
+        MaxHeap.add(self, element)
+
+    def store(self, k: int, element: T) -> None:
+        """ Puts a new element at index k and records its position, without restoring the heap property.
+            :raises ValueError: if element is already in the heap
+        """
+        if self.identity(element) in self.position:
+            raise ValueError('Adding an element already in the heap')
+        self.the_array[k] = element
+        self.position[self.identity(element)] = k
+
+    def get_max(self) -> T:
+        max_elt = MaxHeap.get_max(self)
+        del self.position[self.identity(max_elt)]
+        return max_elt
+
+    def replace_max(self, element: T) -> T:
+        max_elt = MaxHeap.replace_max(self, element)
+        if self.identity(max_elt) != self.identity(element):
+            del self.position[self.identity(max_elt)]
+        return max_elt
+
+    def update(self, element: T) -> None:
+        """ Restores the heap property after the priority of element changed.
+            :raises KeyError: if element is not in the heap
+            :complexity: O(log n)
+        """
+        self.rise(self.index_of(element))
+        self.sink(self.position[self.identity(element)])
+
+    def remove(self, element: T) -> None:
+        """ Removes element from the heap.
+            :raises KeyError: if element is not in the heap
+            :complexity: O(log n)
+        """
+        k = self.index_of(element)
+        del self.position[self.identity(element)]
+        last = self.the_array[self.length]
+        self.the_array[self.length] = self.no_element
+        self.length -= 1
+        if k <= self.length:
+            self.the_array[k] = last
+            self.rise(k)
+            self.sink(self.position[self.identity(last)])
+        self._maybe_shrink()
+
+    def clear(self) -> None:
+        MaxHeap.clear(self)
+        self.position = self.new_position()
+
+    def heapify(self, an_array: list) -> None:
+        """ Bottom-up heap construction which also records the position of every element.
+            :complexity: O(n)
+        """
+        MaxHeap.heapify(self, an_array)
+        self.position = self.new_position()
+        self.position.update((self.identity(self.the_array[i]), i) for i in range(1, self.length + 1))
+
+class KeyedMaxHeap(IndexedMaxHeap[T]):
+    """
+    Indexed max heap ordered by key(element) instead of comparing the elements themselves.
+    The key of every element is computed once when it is added or updated and stored in
+    a parallel array, so rise and sink only compare plain numbers.
+    With key_ctype=c_int64 or c_double the keys are kept as raw numbers in a typed array
+    (see ArrayR.of_int64), which the caller can read through self.keys.memoryview().
+    """
+
+    def __init__(self, max_size: int, key: Callable[[T], float], growable: bool = False, shrinkable: bool = False,
+                 arity: int = 2, identity: Callable[[T], Hashable] = id, key_ctype: type = py_object) -> None:
+        IndexedMaxHeap.__init__(self, max_size, growable, shrinkable, arity, identity)
+        self.key = key
+        self.key_ctype = key_ctype
+        self.no_key = None if key_ctype is py_object else 0
+        self.keys = self.new_keys(len(self.the_array))
+
+    def new_keys(self, length: int) -> ArrayR[float]:
+        """ Returns an empty array of keys of the given length. """
+        if self.key_ctype is py_object:
+            return ArrayR(length)
+        return TypedArrayR(length, self.key_ctype)
+
+    def resize(self, new_capacity: int) -> None:
+        """
+        Moves the elements and their keys into new arrays able to hold new_capacity elements.
+        :pre: new_capacity >= self.length
+        :complexity: O(new_capacity)
+        """
+        IndexedMaxHeap.resize(self, new_capacity)
+        new_keys = self.new_keys(len(self.the_array))
+        self.keys.copy_into(new_keys, 1, 1, self.length)
+        self.keys = new_keys
+
+    def priority_at(self) -> Callable[[int], float]:
+        """ Returns a function giving the stored key of index k. """
+        return self.keys.__getitem__
+
+    def rise(self, k: int) -> None:
+        """
+        Rise element at index k to its correct position according to its stored key
+        :pre: 1 <= k <= self.length
+        """
+        the_array, keys, position, arity, identity = self.the_array, self.keys, self.position, self.arity, self.identity
+        item = the_array[k]
+        item_key = keys[k]
+        while k > 1:
+            parent = (k - 2) // arity + 1
+            if item_key <= keys[parent]:
+                break
+            the_array[k] = the_array[parent]
+            keys[k] = keys[parent]
+            position[identity(the_array[k])] = k
+            k = parent
+        the_array[k] = item
+        keys[k] = item_key
+        position[identity(item)] = k
+
+    def largest_child(self, k: int) -> int:
+        """
+        Returns the index of k's child with greatest key (the first one on ties).
+        :pre: 1 <= k <= self.parent_index(self.length)
+        """
+        keys = self.keys
+        first = self.arity * (k - 1) + 2
+        largest = first
+        for child in range(first + 1, min(first + self.arity, self.length + 1)):
+            if keys[child] > keys[largest]:
+                largest = child
+        return largest
+
+    def sink(self, k: int) -> None:
+        """
+        Make the element at index k sink to the correct position according to its stored key
+        :pre: 1 <= k <= self.length
+        """
+        the_array, keys, position, arity, identity = self.the_array, self.keys, self.position, self.arity, self.identity
+        length = self.length
+        item = the_array[k]
+        item_key = keys[k]
+
+        while arity * (k - 1) + 2 <= length:
+            max_child = arity * (k - 1) + 2
+            if arity == 2:
+                if max_child < length and keys[max_child + 1] > keys[max_child]:
+                    max_child += 1
+            else:
+                for child in range(max_child + 1, min(max_child + arity, length + 1)):
+                    if keys[child] > keys[max_child]:
+                        max_child = child
+            if keys[max_child] <= item_key:
+                break
+            the_array[k] = the_array[max_child]
+            keys[k] = keys[max_child]
+            position[identity(the_array[k])] = k
+            k = max_child
+
+        the_array[k] = item
+        keys[k] = item_key
+        position[identity(item)] = k
+
+    def add(self, element: T) -> None:
+        """
+        :raises ValueError: if element is already in the heap
+        :complexity: O(log n)
+        """
+        if self.identity(element) in self.position:
+            raise ValueError('Adding an element already in the heap')
+        key = self.key(element)
+        if self.is_full():
+            self.ensure_capacity(self.length + 1)
+
+        self.length += 1
+        self.the_array[self.length] = element
+        self.keys[self.length] = key
+        self.rise(self.length)
+
+    def store(self, k: int, element: T) -> None:
+        """ Puts a new element and its key at index k, without restoring the heap property.
+            :raises ValueError: if element is already in the heap
+        """
+        self.keys[k] = self.key(element)  # slot k is not in the heap yet, so a key that fails leaves nothing behind
+        IndexedMaxHeap.store(self, k, element)
+
+    def get_max(self) -> T:
+        """ Remove (and return) the element with the maximum key from the heap. """
+        if self.length == 0:
+            raise IndexError
+
+        max_elt = self.the_array[1]
+        self.length -= 1
+        if self.length > 0:
+            self.the_array[1] = self.the_array[self.length+1]
+            self.keys[1] = self.keys[self.length+1]
+            self.sink(1)
+        self.the_array[self.length+1] = self.no_element
+        self.keys[self.length+1] = self.no_key
+        del self.position[self.identity(max_elt)]
+        self._maybe_shrink()
+        return max_elt
+
+    def replace_max(self, element: T) -> T:
+        """ Remove and return the maximum element, then add element, using a single sink.
+            :complexity: O(log n)
+        """
+        if self.length == 0:
+            raise IndexError
+
+        max_elt = self.the_array[1]
+        self.the_array[1] = element
+        self.keys[1] = self.key(element)
+        if self.identity(max_elt) != self.identity(element):
+            del self.position[self.identity(max_elt)]
+        self.sink(1)
+        return max_elt
 
-        for i in range(self.length // 2, 0, -1):
+    def push_pop(self, element: T) -> T:
+        """ Add element, then remove and return the maximum element, using at most a single sink.
+            :complexity: O(1) if element has at least the maximum key, O(log n) otherwise
+        """
+        if self.length == 0 or not self.keys[1] > self.key(element):
+            return element
+        return self.replace_max(element)
+
+    def update(self, element: T) -> None:
+        """ Recomputes the key of element and restores the heap property.
+            :raises KeyError: if element is not in the heap
+            :complexity: O(log n)
+        """
+        k = self.index_of(element)
+        self.keys[k] = self.key(element)
+        self.rise(k)
+        self.sink(self.position[self.identity(element)])
+
+    def remove(self, element: T) -> None:
+        """ Removes element from the heap.
+            :raises KeyError: if element is not in the heap
+            :complexity: O(log n)
+        """
+        k = self.index_of(element)
+        del self.position[self.identity(element)]
+        last, last_key = self.the_array[self.length], self.keys[self.length]
+        self.the_array[self.length] = self.no_element
+        self.keys[self.length] = self.no_key
+        self.length -= 1
+        if k <= self.length:
+            self.the_array[k] = last
+            self.keys[k] = last_key
+            self.rise(k)
+            self.sink(self.position[self.identity(last)])
+        self._maybe_shrink()
+
+    def rebuild(self) -> None:
+        """ Recomputes the key of every element and restores the heap property.
+            :complexity: O(n)
+        """
+        self.keys[1:self.length + 1] = map(self.key, self)
+        IndexedMaxHeap.rebuild(self)
+
+    def clear(self) -> None:
+        self.keys[1:self.length + 1] = [self.no_key] * self.length
+        IndexedMaxHeap.clear(self)
+
+    def heapify(self, an_array: list) -> None:
+        """ Bottom-up heap construction, computing the key of every element once.
+            :complexity: O(n)
+        """
+        self.ensure_capacity(self.length)
+        self.the_array[1:self.length + 1] = an_array[:self.length]
+        self.keys[1:self.length + 1] = map(self.key, an_array[:self.length])
+
+        for i in range(self.parent_index(self.length), 0, -1):
             self.sink(i)
+        self.position = self.new_position()
+        self.position.update((self.identity(self.the_array[i]), i) for i in range(1, self.length + 1))
+
+
+class RowPositions:
+    """
+    Map from non-negative integers (rows) to positive indices, kept in a growable array of 64-bit integers
+    instead of a dict, so each row costs 8 bytes. Index 0 means the row is not in the map.
+    """
+
+    def __init__(self, max_row: int = 0) -> None:
+        """ :complexity: O(max_row) """
+        self.slots = TypedArrayR(max(1, max_row + 1), c_int64)
+
+    def __contains__(self, row: int) -> bool:
+        return 0 <= row < len(self.slots) and self.slots[row] != 0
+
+    def __getitem__(self, row: int) -> int:
+        """ :raises KeyError: if row is not in the map """
+        if row not in self:
+            raise KeyError(row)
+        return self.slots[row]
+
+    def __setitem__(self, row: int, k: int) -> None:
+        """ :complexity: O(1), O(row) when the array has to grow """
+        if row >= len(self.slots):
+            new_length = len(self.slots)
+            while new_length <= row:
+                new_length *= 2
+            new_slots = TypedArrayR(new_length, c_int64)
+            self.slots.copy_into(new_slots, 0, 0, len(self.slots))
+            self.slots = new_slots
+        self.slots[row] = k
+
+    def __delitem__(self, row: int) -> None:
+        self.slots[row] = 0
+
+    def update(self, pairs: Iterable[tuple[int, int]]) -> None:
+        for row, k in pairs:
+            self[row] = k
+
+
+class RowMaxHeap(KeyedMaxHeap[int]):
+    """
+    Keyed max heap of row indices (non-negative integers) of some table, e.g. the rows of a BeehiveStore.
+    The rows and their keys are kept in arrays of 64-bit integers and the position of every row in a RowPositions,
+    so no Python object is kept per element: each row costs 24 bytes plus its share of the spare capacity.
+    """
+
+    no_element = 0
+
+    def __init__(self, max_size: int, key: Callable[[int], int], growable: bool = False, shrinkable: bool = False,
+                 arity: int = 2) -> None:
+        KeyedMaxHeap.__init__(self, max_size, key, growable, shrinkable, arity, identity=int, key_ctype=c_int64)
+
+    def new_array(self, length: int) -> ArrayR[int]:
+        return TypedArrayR(length, c_int64)
+
+    def new_position(self) -> RowPositions:
+        return RowPositions(self.capacity())
+
 
 if __name__ == '__main__':
     items = [ int(x) for x in input('Enter a list of numbers: ').strip().split() ]
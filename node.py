@@ -11,9 +11,9 @@ __author__ = 'Maria Garcia de la Banda and Brendon Taylor. Modified by Alexey Ig
 __docformat__ = 'reStructuredText'
 
 
-@dataclass
+@dataclass(slots=True)
 class TreeNode(Generic[K, I]):
-    """ Node class represent BST nodes. """
+    """ Node class represent BST nodes. Slotted, so nodes carry no per-instance __dict__. """
 
     key: K
     item: I = None
@@ -33,3 +33,54 @@ class TreeNode(Generic[K, I]):
         key = str(self.key) if type(self.key) != str else "'{0}'".format(self.key)
         item = str(self.item) if type(self.item) != str else "'{0}'".format(self.item)
         return '({0}, {1}, [{2}])'.format(key, item, self.subtree_size)
+
+
+@dataclass(slots=True)
+class AVLTreeNode(TreeNode[K, I]):
+    """ BST node which also records the height of its subtree, for AVL balancing. """
+
+    height: int = 1
+
+
+class KeyTreeNode(Generic[K]):
+    """
+        BST node without an item, for trees used as sets of keys (e.g. Percentiles), where the item is
+        always the key itself. Saves one slot per node compared to a TreeNode.
+    """
+    __slots__ = ('key', 'left', 'right', 'subtree_size')
+
+    def __init__(self, key: K, item: K = None, left: KeyTreeNode | None = None, right: KeyTreeNode | None = None,
+                 subtree_size: int = 1) -> None:
+        """ :raises ValueError: if item is given and is not the key, since it is not stored """
+        if item is not None and item is not key and item != key:
+            raise ValueError('The item of a key node is its key')
+        self.key = key
+        self.left = left
+        self.right = right
+        self.subtree_size = subtree_size
+
+    @property
+    def item(self) -> K:
+        return self.key
+
+    @item.setter
+    def item(self, item: K) -> None:
+        """ Only accepts the key itself, as when a node takes over the key and item of another one. """
+        if item is not self.key and item != self.key:
+            raise ValueError('The item of a key node is its key')
+
+    def set_subtree_size(self, subtree_size: int) -> None:
+        self.subtree_size = subtree_size
+
+    def __str__(self):
+        return TreeNode.__str__(self)
+
+
+class AVLKeyTreeNode(KeyTreeNode[K]):
+    """ Key node which also records the height of its subtree, for AVL balancing. """
+    __slots__ = ('height',)
+
+    def __init__(self, key: K, item: K = None, left: AVLKeyTreeNode | None = None,
+                 right: AVLKeyTreeNode | None = None, subtree_size: int = 1, height: int = 1) -> None:
+        KeyTreeNode.__init__(self, key, item, left, right, subtree_size)
+        self.height = height
@@ -0,0 +1,260 @@
+"""Max Pairing Heap implemented with linked nodes"""
+from __future__ import annotations
+__docformat__ = 'reStructuredText'
+
+from dataclasses import dataclass
+from typing import Callable, Generic, Hashable, Iterable, Iterator, TypeVar
+from heap import KeyedMaxHeap
+
+T = TypeVar('T')
+
+
+@dataclass
+class PairingNode(Generic[T]):
+    """ Node of a pairing heap: children form a linked list through sibling, prev is the left sibling or the parent. """
+
+    item: T
+    key: object
+    child: PairingNode | None = None
+    sibling: PairingNode | None = None
+    prev: PairingNode | None = None
+
+
+class PairingHeap(Generic[T]):
+    """
+    Max heap made of a tree of linked nodes, supporting the MaxHeap interface plus merging two heaps in O(1).
+    Elements are ordered by key(element), or by the elements themselves if no key is given. As in
+    IndexedMaxHeap, elements are tracked by identity(element) so they can be updated or removed.
+    """
+
+    def __init__(self, key: Callable[[T], object] | None = None, identity: Callable[[T], Hashable] = id) -> None:
+        self.key = key
+        self.identity = identity
+        self.root = None
+        self.length = 0
+        self.nodes = {}
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator[T]:
+        """ Iterates over all elements in no particular order. """
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            yield node.item
+            if node.sibling is not None:
+                stack.append(node.sibling)
+            if node.child is not None:
+                stack.append(node.child)
+
+    def __contains__(self, element: T) -> bool:
+        return self.contains(element)
+
+    def contains(self, element: T) -> bool:
+        """ Checks whether element is in the heap, comparing by identity(element).
+            :complexity: O(1)
+        """
+        return self.identity(element) in self.nodes
+
+    def key_of(self, element: T) -> object:
+        return element if self.key is None else self.key(element)
+
+    def node_of(self, element: T) -> PairingNode:
+        """ Returns the node holding element.
+            :raises KeyError: if element is not in the heap
+        """
+        if self.identity(element) not in self.nodes:
+            raise KeyError(element)
+        return self.nodes[self.identity(element)]
+
+    @staticmethod
+    def meld(a: PairingNode | None, b: PairingNode | None) -> PairingNode | None:
+        """ Links two detached trees, making the one with the smaller root the first child of the other.
+            :complexity: O(1)
+        """
+        if a is None:
+            return b
+        if b is None:
+            return a
+        if b.key > a.key:
+            a, b = b, a
+        b.prev = a
+        b.sibling = a.child
+        if a.child is not None:
+            a.child.prev = b
+        a.child = b
+        return a
+
+    def merge_pairs(self, first: PairingNode | None) -> PairingNode | None:
+        """ Melds a list of sibling trees into one using the two-pass pairing scheme.
+            :complexity: O(log n) amortised
+        """
+        pairs = []
+        node = first
+        while node is not None:
+            a, b = node, node.sibling
+            node = b.sibling if b is not None else None
+            a.sibling = a.prev = None
+            if b is not None:
+                b.sibling = b.prev = None
+            pairs.append(self.meld(a, b))
+        result = pairs.pop() if pairs else None
+        while pairs:
+            result = self.meld(pairs.pop(), result)
+        return result
+
+    def cut(self, node: PairingNode) -> None:
+        """ Detaches the subtree rooted at node (not the root) from its parent. """
+        if node.prev.child is node:
+            node.prev.child = node.sibling
+        else:
+            node.prev.sibling = node.sibling
+        if node.sibling is not None:
+            node.sibling.prev = node.prev
+        node.prev = node.sibling = None
+
+    def add(self, element: T) -> None:
+        """
+        :raises ValueError: if element is already in the heap
+        :complexity: O(1)
+        """
+        if self.identity(element) in self.nodes:
+            raise ValueError('Adding an element already in the heap')
+        node = PairingNode(element, self.key_of(element))
+        self.nodes[self.identity(element)] = node
+        self.root = self.meld(self.root, node)
+        self.length += 1
+
+    def extend(self, elements: Iterable[T]) -> None:
+        """ Adds all elements (any iterable) to the heap.
+            :complexity: O(m) for m new elements
+        """
+        for element in elements:
+            self.add(element)
+
+    def peek_max(self) -> T:
+        """ Return the maximum element without removing it. """
+        if self.length == 0:
+            raise IndexError
+        return self.root.item
+
+    def get_max(self) -> T:
+        """ Remove (and return) the maximum element from the heap.
+            :complexity: O(log n) amortised
+        """
+        if self.length == 0:
+            raise IndexError
+        node = self.root
+        del self.nodes[self.identity(node.item)]
+        self.root = self.merge_pairs(node.child)
+        node.child = None
+        self.length -= 1
+        return node.item
+
+    def replace_max(self, element: T) -> T:
+        """ Remove and return the maximum element, then add element.
+            :complexity: O(log n) amortised
+        """
+        max_elt = self.peek_max()
+        if self.identity(element) == self.identity(max_elt):
+            self.update(element)
+        else:
+            self.get_max()
+            self.add(element)
+        return max_elt
+
+    def push_pop(self, element: T) -> T:
+        """ Add element, then remove and return the maximum element.
+            :complexity: O(1) if element is at least the maximum, O(log n) amortised otherwise
+        """
+        if self.length == 0 or not self.root.key > self.key_of(element):
+            return element
+        return self.replace_max(element)
+
+    def update(self, element: T) -> None:
+        """ Recomputes the key of element and restores the heap property.
+            :raises KeyError: if element is not in the heap
+            :complexity: O(1) if the key did not decrease, O(log n) amortised otherwise
+        """
+        node = self.node_of(element)
+        new_key = self.key_of(element)
+        decreased = node.key > new_key
+        if node is self.root:
+            if decreased:
+                rest = self.merge_pairs(node.child)
+                node.child = None
+                node.key = new_key
+                self.root = self.meld(rest, node)
+            else:
+                node.key = new_key
+            return
+        self.cut(node)
+        if decreased:
+            rest = self.merge_pairs(node.child)
+            node.child = None
+            node.key = new_key
+            self.root = self.meld(self.root, self.meld(rest, node))
+        else:
+            node.key = new_key
+            self.root = self.meld(self.root, node)
+
+    def remove(self, element: T) -> None:
+        """ Removes element from the heap.
+            :raises KeyError: if element is not in the heap
+            :complexity: O(log n) amortised
+        """
+        node = self.node_of(element)
+        if node is self.root:
+            self.get_max()
+            return
+        del self.nodes[self.identity(element)]
+        self.cut(node)
+        self.root = self.meld(self.root, self.merge_pairs(node.child))
+        node.child = None
+        self.length -= 1
+
+    def merge(self, other: PairingHeap[T]) -> None:
+        """ Moves all elements of other into this heap, leaving other empty.
+            Only the roots are linked; the smaller identity map is copied into the larger one.
+            :pre: no element is in both heaps
+            :complexity: O(1) for the heap itself, O(min(n, m)) for the identity maps
+        """
+        if len(self.nodes) < len(other.nodes):
+            self.nodes, other.nodes = other.nodes, self.nodes
+        self.nodes.update(other.nodes)
+        self.root = self.meld(self.root, other.root)
+        self.length += other.length
+        other.clear()
+
+    def clear(self) -> None:
+        """ Removes all elements. """
+        self.root = None
+        self.length = 0
+        self.nodes = {}
+
+    def rebuild(self) -> None:
+        """ Recomputes the key of every element and rebuilds the heap, after priorities were changed in place.
+            :complexity: O(n)
+        """
+        items = list(self)
+        self.clear()
+        self.extend(items)
+
+    def peek_top_k(self, k: int) -> list[T]:
+        """ Returns the k largest elements in descending order without changing the heap.
+            :complexity: O(k * c * log(k * c)), c being the largest number of children of the returned nodes
+        """
+        result = []
+        if k <= 0 or self.root is None:
+            return result
+        frontier = KeyedMaxHeap(k, lambda node: node.key, growable=True)
+        frontier.add(self.root)
+        while len(result) < k and len(frontier) > 0:
+            node = frontier.get_max()
+            result.append(node.item)
+            child = node.child
+            while child is not None:
+                frontier.add(child)
+                child = child.sibling
+        return result
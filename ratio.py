@@ -1,16 +1,40 @@
 from __future__ import annotations
-from typing import Generic, TypeVar
+from typing import Generic, Iterable, Iterator, TypeVar
 from math import ceil
 from bst import BinarySearchTree
+from avl import AVLTree
+from btree import BTree
 
 T = TypeVar("T")
 I = TypeVar("I")
 
+def make_search_tree(backend: str) -> BinarySearchTree | BTree:
+    """
+    Creates the tree used by Percentiles, in set mode since every point is its own item.
+
+    Args:
+        backend : 'avl' for an AVLTree, which stays balanced whatever the order of the points,
+                  'bst' for a plain BinarySearchTree, which becomes a linked list when the points are added in sorted order,
+                  'btree' for a BTree, whose wide nodes make it several times shallower than the binary trees
+
+    Raises:
+        ValueError : when backend is not one of the above
+    """
+    if backend == 'avl':
+        return AVLTree(set_mode=True)
+    elif backend == 'bst':
+        return BinarySearchTree(set_mode=True)
+    elif backend == 'btree':
+        return BTree(set_mode=True)
+    raise ValueError('Unknown tree backend: {0}'.format(backend))
+
+
 class Percentiles(Generic[T]):
 
-    def __init__(self) -> None:
+    def __init__(self, backend: str = 'avl') -> None:
         """
         Args :
+            backend : The kind of tree used to store the points, see make_search_tree()
             self.bsearch : Initialised with a BST which is used to stored the nodes to be added
 
         Returns :
@@ -20,9 +44,34 @@ class Percentiles(Generic[T]):
             Best Case = Worst Case : O(1)
 
         Explanation :
-            At here, we just initialised self.bsearch as a BST ( Time Complexity : O(1) )
+            At here, we just initialised self.bsearch as a BST, balanced by default ( Time Complexity : O(1) )
         """
-        self.bsearch = BinarySearchTree()
+        self.bsearch = make_search_tree(backend)
+
+    @classmethod
+    def from_points(cls, points: Iterable[T], backend: str = 'avl') -> Percentiles[T]:
+        """
+        Args :
+            points : Points to be stored, in any order
+            backend : The kind of tree used to store the points, see make_search_tree()
+
+        Returns :
+            A Percentiles holding all the points, whose tree is built balanced in one go instead of by add_point()
+
+        Raises :
+            ValueError : when a point is repeated, as add_point() would
+
+        Complexity :
+            Best Case = Worst Case : O(nlog(n)*CompK), n as the number of points, to sort them
+
+        Explanation :
+            The points are sorted once, then BinarySearchTree.from_sorted builds the tree in O(n)
+            with the middle point as the root of every subtree, so no point has to walk down the tree.
+        """
+        percentiles = cls(backend)
+        percentiles.bsearch = type(percentiles.bsearch).from_iterable(((point, point) for point in points), set_mode=True)
+        return percentiles
+
     def add_point(self, item: T) -> None:
         """
         Args :
@@ -35,7 +84,7 @@ class Percentiles(Generic[T]):
             Best Case = O(CompK), where item to be added at the root , CompK is the complexity of comparing 2 keys
             Worst Case = O(log(n)*CompK), where the item to be added is at the bottom of BST, n as the number of elements in BST,
                                         CompK as the complexity of comparing 2 keys
-            To achieve worst case above, we need to assume that is a balanced tree.
+            To achieve worst case above, we need to assume that is a balanced tree, which the default 'avl' backend guarantees.
 
         Explanation :
             At here, we just use _set_item_ method of BST ( from bst.py ) to insert item into BST
@@ -55,7 +104,7 @@ class Percentiles(Generic[T]):
             Best Case = O(CompK), where item to be deleted at the root , CompK is the complexity of comparing 2 keys
             Worst Case = O(log(n)*CompK), where the item to be deleted is at the bottom of BST, n as the number of elements in BST,
                                           CompK as the complexity of comparing 2 keys
-            To achieve worst case above, we need to assume the tree is a balanced tree
+            To achieve worst case above, we need to assume the tree is a balanced tree, which the default 'avl' backend guarantees
 
         Explanation :
             At here, we just use _del_item_ method of BST ( from bst.py ) to delete item from BST
@@ -90,70 +139,91 @@ class Percentiles(Generic[T]):
             ( Time Complexity : O(log(n)) )
             upper_bound is then initialised with key of the largest node which meets the requirement above by using kth_smallest
             ( Time Complexity : O(log(n)) )
-            Then ratio_aux function is called to return append elements into ans in inorder
-            ( Time Complexity : O(O) )
-            And finally ans which stores a list of elements which are added in ascending order ( Time Complexity : O(1) )
+            Then the keys of the tree from lower_bound to upper_bound are walked in order by self.bsearch.keys(), which works
+            for every backend, and collected into ans ( Time Complexity : O(O) )
+            All of this is done by ratio_iter(), so ans is just the list of what it produces ( Time Complexity : O(O) )
+        """
+        ans = list(self.ratio_iter(x, y))
+        return ans
+
+    def ratio_iter(self, x: float, y: float) -> Iterator[T]:
+        """
+        Args :
+            x, y : The same percentages as for ratio()
+
+        Returns :
+            An iterator over the elements ratio(x, y) would return, in ascending order, produced one at a time
+
+        Complexity :
+            Best Case = Worst Case : O(log(n)) to find the bounds, then O(1) amortised per element,
+            assuming that it is a balanced tree, with only O(log(n)) memory however many elements are produced
+
+        Explanation :
+            The bounds are found with kth_smallest as in ratio(), then BinarySearchTree.keys() walks the tree
+            in order between them with an explicit stack, so nothing is computed for the elements not consumed.
         """
-        ans = []
         lower_bound_value = ceil(self.bsearch.length*x/100) + 1
         upper_bound_value = self.bsearch.length - ceil(self.bsearch.length*y/100)
+        if lower_bound_value > upper_bound_value:
+            return iter(())
         lower_bound = self.bsearch.kth_smallest(lower_bound_value, self.bsearch.root).key
         upper_bound = self.bsearch.kth_smallest(upper_bound_value, self.bsearch.root).key
-        self.ratio_aux(self.bsearch.root, lower_bound, upper_bound,ans)
-        return ans
+        return self.bsearch.keys(lower_bound, upper_bound)
 
-    def ratio_aux(self, current: TreeNode, lb: int, ub: int,lst:list) -> None:
+    def ratio_count(self, x: float, y: float) -> int:
         """
         Args :
-            current : A treenode and is the root node where user want to compute the list from
-            lb : The key value of the minimum boundary node
-            ub : The key value of the maximum boundary node
-            lst : A list of elements which is arranged in ascending order due to inorder traversal
+            x, y : The same percentages as for ratio()
 
         Returns :
-            None
+            The number of elements ratio(x, y) would return, without building the list
+
+        Complexity :
+            Best Case = Worst Case : O(1)
+
+        Explanation :
+            ratio() returns the elements from the lower_bound_value-th smallest to the upper_bound_value-th smallest,
+            so their number follows from the two positions alone.
+        """
+        lower_bound_value = ceil(self.bsearch.length*x/100) + 1
+        upper_bound_value = self.bsearch.length - ceil(self.bsearch.length*y/100)
+        return max(0, upper_bound_value - lower_bound_value + 1)
+
+    def remove_range(self, lo: T, hi: T) -> int:
+        """
+        Args :
+            lo : The smallest value removed
+            hi : The largest value removed
+
+        Returns :
+            The number of points p with lo <= p <= hi, which are all removed
 
         Complexity :
-            Best Case = Worst Case : O(O), where O is the number of elements appended into lst
+            Best Case = Worst Case : O(log(n)*CompK) with the default 'avl' backend, O(D*CompK) with 'bst',
+                                     D as the depth of the tree, and O(m*log(n)*CompK) with 'btree', m as the number of points removed
 
         Explanation :
-            First we will check whether current is None. ( Time Complexity : O(1) )
-            If current is None, return ( Time Complexity : O(1) )
-            Else, add elements into lst.
-            If current.key is smaller than ub and larger than lb, call itself with left subtree of current and lb, ub,lst as parameters
-            ( Assume Time Complexity of comparing as O(1) )
-            lst will then append current's key ( Time Complexity : O(1) )
-            Then it will call itself with right subtree of current and lb, ub, lst as parameters
-            ( Assume Time Complexity of comparing as O(1) )
-            Else if current.key is larger than ub and larger than lb, call itself with left subtree of current and lb,ub,lst as paramters
-            ( Assume Time Complexity of comparing as O(1) )
-            Else if current.key is smaller than or equal to lb, check if current.key is equal to lb.
-            If current.key is equal to lb, lst append current.key ( Time Complexity : O(1) )
-            If current.key is smaller than lb, call itself with right subtree of current and lb,ub,lst as parameters
-            ( Assume Time Complexity of comparing as O(1) )
-            Else if current.key is equal to ub, call itsellf with left subtree of current and lb,ub,ls as parameters
-            ( Assume Tim Complexity of comparing as O(1) )
-            lst will then append current.key ( Time Complexity : O(1) )
-
-            The recursion depth will be as long as O, where O is the number of points appended into lst, so the complexity
-            of the operation will always be O(O)
-
-        """
-        if current is not None:
-            if lb < current.key < ub:
-                self.ratio_aux(current.left,lb,ub,lst)
-                lst.append(current.key)
-                self.ratio_aux(current.right,lb,ub,lst)
-            elif lb < current.key > ub:
-                self.ratio_aux(current.left,lb,ub,lst)
-            elif current.key <= lb:
-                if current.key == lb:
-                    lst.append(current.key)
-                self.ratio_aux(current.right,lb,ub,lst)
-            elif current.key == ub:
-                self.ratio_aux(current.left,lb,ub,lst)
-                lst.append(current.key)
-        return
+            BinarySearchTree.delete_range splits the tree at lo and hi and joins the two outer parts back,
+            instead of calling remove_point() once per point
+        """
+        return self.bsearch.delete_range(lo, hi)
+
+    def count_in_range(self, lo: T, hi: T) -> int:
+        """
+        Args :
+            lo : The smallest value counted
+            hi : The largest value counted
+
+        Returns :
+            The number of points p with lo <= p <= hi
+
+        Complexity :
+            Best Case = Worst Case : O(D*CompK), D as the depth of the tree, O(log(n)*CompK) with the default 'avl' backend
+
+        Explanation :
+            BinarySearchTree.count_in_range ranks lo and hi using the subtree sizes, without visiting the points in between
+        """
+        return self.bsearch.count_in_range(lo, hi)
 
 if __name__ == "__main__":
     points = list(range(50))
@@ -12,17 +12,36 @@ space to hold the references.
 Note that while I do check the precondition in __init__ (noone else
 would), I do not check that of getitem or setitem, since that is already
 checked by self.array[index].
+
+Bulk operations (slices, from_iterable, copy_into) work on the whole ctypes
+buffer at once instead of one element at a time. Note that a ctypes py_object
+array does not own references through its buffer: it keeps the objects alive
+in its _objects dictionary, keyed by the index written in hexadecimal. copy_into moves
+the raw pointers with memmove and then records the copied objects under their
+new indices, which also releases the overwritten ones.
+window() returns an ArrayWindow, a view of part of an array without copying.
+
+ArrayR.of_int64 and ArrayR.of_float64 create a TypedArrayR instead, which
+holds raw 64-bit numbers (ctypes c_int64/c_double) rather than references.
+These need no reference bookkeeping, and memoryview() exposes their memory
+through the buffer protocol so that array.array, struct or numpy can read it
+without copying.
 """
+from __future__ import annotations
 __author__ = "Julian Garcia for the __init__ code, Maria Garcia de la Banda for the rest"
 __docformat__ = 'reStructuredText'
 
-from ctypes import py_object
-from typing import TypeVar, Generic
+from ctypes import addressof, c_double, c_int64, memmove, py_object, sizeof
+from typing import Generic, Iterable, Iterator, TypeVar
 
 T = TypeVar('T')
 
+FORMATS = {c_int64: 'q', c_double: 'd'}  # struct format of each supported typed array
+
 
 class ArrayR(Generic[T]):
+    ctype = py_object
+
     def __init__(self, length: int) -> None:
         """ Creates an array of references to objects of the given length
         :complexity: O(length) for best/worst case to initialise to None
@@ -31,7 +50,101 @@ class ArrayR(Generic[T]):
         if length <= 0:
             raise ValueError("Array length should be larger than 0.")
         self.array = (length * py_object)() # initialises the space
-        self.array[:] =  [None for _ in range(length)]
+        self.array[:] = [None] * length
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[T]) -> ArrayR[T]:
+        """ Creates an array holding the given values, filled in one bulk assignment
+        :complexity: O(n) for n values
+        :pre: there is at least one value
+        """
+        values = list(values)
+        array = cls(len(values))
+        array.array[:] = values
+        return array
+
+    @staticmethod
+    def of_int64(length: int) -> TypedArrayR[int]:
+        """ Creates an array of length 64-bit integers, initialised to 0
+        :complexity: O(length)
+        """
+        return TypedArrayR(length, c_int64)
+
+    @staticmethod
+    def of_float64(length: int) -> TypedArrayR[float]:
+        """ Creates an array of length 64-bit floats, initialised to 0.0
+        :complexity: O(length)
+        """
+        return TypedArrayR(length, c_double)
+
+    def like(self, values: Iterable[T]) -> ArrayR[T]:
+        """ Creates a new array of the same type as this one holding the given values, possibly none
+        :complexity: O(n) for n values
+        """
+        values = list(values)
+        if len(values) == 0:
+            return self.empty_like()
+        if self.ctype is py_object:
+            return ArrayR.from_iterable(values)
+        return TypedArrayR.from_iterable(values, self.ctype)
+
+    def empty_like(self) -> ArrayR[T]:
+        """ Creates an array of the same type as this one with no positions, e.g. for an empty slice.
+        The constructors do not allow length 0, so the ctypes array is made directly.
+        :complexity: O(1)
+        """
+        array = ArrayR.__new__(ArrayR if self.ctype is py_object else TypedArrayR)
+        array.ctype = self.ctype
+        array.array = (0 * self.ctype)()
+        return array
+
+    def memoryview(self) -> memoryview:
+        """ Returns a memoryview of the values of a typed array, sharing its memory.
+        :complexity: O(1)
+        :raises TypeError: if the array holds references, which cannot be shared as raw memory
+        """
+        if self.ctype is py_object:
+            raise TypeError("Only typed arrays can be viewed as memory.")
+        array, offset = self.buffer()
+        view = memoryview(array).cast('B').cast(FORMATS[self.ctype])
+        return view[offset:offset + len(self)]
+
+    def buffer(self) -> tuple:
+        """ Returns the ctypes array holding the objects and the position of index 0 in it. """
+        return self.array, 0
+
+    def window(self, start: int, stop: int) -> ArrayWindow[T]:
+        """ Returns a view of positions start to stop - 1 of this array, without copying.
+        Writes to either one are seen by the other.
+        :complexity: O(1)
+        :pre: 0 <= start < stop <= len(self)
+        """
+        return ArrayWindow(self, start, stop)
+
+    def copy_into(self, other: ArrayR[T], src: int, dst: int, n: int) -> None:
+        """ Copies positions src to src + n - 1 of this array into positions dst to dst + n - 1 of other
+        (which may be this array, with overlapping ranges) by moving the references with memmove.
+        :complexity: O(n)
+        :pre: both ranges are within their arrays
+        """
+        if n < 0 or src < 0 or dst < 0 or src + n > len(self) or dst + n > len(other):
+            raise IndexError("Copy of {0} elements from {1} to {2} out of range.".format(n, src, dst))
+        if self.ctype is not other.ctype:
+            raise TypeError("Cannot copy between arrays of different types.")
+        if n == 0:
+            return
+        source, src_offset = self.buffer()
+        target, dst_offset = other.buffer()
+        src, dst = src + src_offset, dst + dst_offset
+        size = sizeof(self.ctype)
+        if self.ctype is not py_object:  # plain numbers, nothing to keep alive
+            memmove(addressof(target) + dst * size, addressof(source) + src * size, n * size)
+            return
+        copied = source[src:src + n]
+        if target._objects is None:
+            target[dst] = copied  # makes ctypes create the dictionary of kept objects
+        memmove(addressof(target) + dst * size, addressof(source) + src * size, n * size)
+        target._objects.update(zip(map('{0:x}'.format, range(dst, dst + n)), copied))
 
     def __len__(self) -> int:
         """ Returns the length of the array
@@ -39,16 +152,96 @@ class ArrayR(Generic[T]):
         """
         return len(self.array)
 
-    def __getitem__(self, index: int) -> T:
-        """ Returns the object in position index.
-        :complexity: O(1)
+    def __iter__(self) -> Iterator[T]:
+        """ Iterates over the objects in order
+        :complexity: O(1) per object
+        """
+        return iter(self.array)
+
+    def __getitem__(self, index: int | slice) -> T | ArrayR[T]:
+        """ Returns the object in position index, or a new array holding a copy of a slice.
+        :complexity: O(1), O(k) for a slice of k objects
         :pre: index in between 0 and length - self.array[] checks it
         """
+        if isinstance(index, slice):
+            return self.like(self.array[index])
         return self.array[index]
 
-    def __setitem__(self, index: int, value: T) -> None:
-        """ Sets the object in position index to value
+    def __setitem__(self, index: int | slice, value: T | Iterable[T]) -> None:
+        """ Sets the object in position index to value, or the positions of a slice to the values given
+        :complexity: O(1), O(k) for a slice of k objects
+        :pre: index in between 0 and length - self.array[] checks it; a slice gets as many values as positions
+        """
+        if isinstance(index, slice):
+            self.array[index] = list(value)
+        else:
+            self.array[index] = value
+
+
+class ArrayWindow(ArrayR[T]):
+    """ View of the positions start to stop - 1 of an ArrayR, indexed from 0, sharing its memory. """
+
+    def __init__(self, base: ArrayR[T], start: int, stop: int) -> None:
+        """
         :complexity: O(1)
-        :pre: index in between 0 and length - self.array[] checks it
+        :pre: 0 <= start < stop <= len(base)
+        """
+        if not 0 <= start < stop <= len(base):
+            raise IndexError("Window [{0}, {1}) out of range.".format(start, stop))
+        self.array, offset = base.buffer()
+        self.ctype = base.ctype
+        self.start = start + offset
+        self.stop = stop + offset
+
+    def buffer(self) -> tuple:
+        return self.array, self.start
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.array[self.start:self.stop])
+
+    def position(self, index: int | slice) -> int | slice:
+        """ Translates an index or slice of the window into one of the underlying array. """
+        if isinstance(index, slice):
+            positions = range(*index.indices(len(self)))
+            stop = positions.stop + self.start
+            # a reversed slice reaching position 0 of the underlying array stops before it, not at index -1
+            return slice(positions.start + self.start, stop if stop >= 0 else None, positions.step)
+        if not -len(self) <= index < len(self):
+            raise IndexError("Index {0} out of range.".format(index))
+        return self.start + index % len(self)
+
+    def __getitem__(self, index: int | slice) -> T | ArrayR[T]:
+        return ArrayR.__getitem__(self, self.position(index))
+
+    def __setitem__(self, index: int | slice, value: T | Iterable[T]) -> None:
+        ArrayR.__setitem__(self, self.position(index), value)
+
+
+class TypedArrayR(ArrayR[T]):
+    """ Array of raw 64-bit numbers (c_int64 or c_double) instead of references to objects. """
+
+    def __init__(self, length: int, ctype: type = c_int64) -> None:
+        """ Creates an array of the given length and ctypes type, initialised to 0
+        :complexity: O(length)
+        :pre: length > 0 and ctype is c_int64 or c_double
+        """
+        if length <= 0:
+            raise ValueError("Array length should be larger than 0.")
+        if ctype not in FORMATS:
+            raise ValueError("Unsupported array type {0}.".format(ctype.__name__))
+        self.ctype = ctype
+        self.array = (length * ctype)()  # ctypes zero-fills the space
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[T], ctype: type = c_int64) -> TypedArrayR[T]:
+        """ Creates a typed array holding the given values
+        :complexity: O(n) for n values
+        :pre: there is at least one value
         """
-        self.array[index] = value
+        values = list(values)
+        array = cls(len(values), ctype)
+        array.array[:] = values
+        return array
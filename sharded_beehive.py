@@ -0,0 +1,248 @@
+""" A BeehiveSelector whose beehives are split across worker processes.
+
+Each worker process owns a BeehiveSelector holding the beehives of some regions
+of space. The coordinating ShardedBeehiveSelector keeps a small tournament heap
+holding, for every shard, the emerald of its best beehive, so harvesting still
+picks the best beehive over all shards.
+"""
+from __future__ import annotations
+__docformat__ = 'reStructuredText'
+
+import multiprocessing
+from typing import Callable, Iterable, NamedTuple
+
+from beehive import Beehive, BeehiveSelector
+from heap import KeyedMaxHeap
+
+NO_BEEHIVE = -1
+
+
+class ShardFailure(NamedTuple):
+    """ Answer of a worker whose command failed: the exception, and the best emerald and size of the shard afterwards. """
+    error: Exception
+    top: int
+    size: int
+
+
+def shard_worker(conn, arity: int) -> None:
+    """
+    Main loop of a worker process: receives (command, argument) pairs from conn and answers each one.
+    Every answer that may change the best beehive of the shard is sent together with the new best emerald.
+    A command that fails is answered with a ShardFailure instead, which the coordinator raises again.
+    The selector of the shard is growable, since how many beehives a region gets is not known in advance.
+    """
+    selector = BeehiveSelector(1, growable=True, arity=arity)
+
+    def top() -> int:
+        return selector.honey_store.peek_max().money() if len(selector.honey_store) > 0 else NO_BEEHIVE
+
+    while True:
+        command, argument = conn.recv()
+        if command == 'close':
+            conn.close()
+            return
+        try:
+            if command == 'add':
+                selector.set_all_beehives(argument)
+                conn.send((top(), len(selector.honey_store)))
+            elif command == 'harvest':
+                conn.send((selector.harvest_best_beehive(), top()))
+            elif command == 'harvest_many':
+                conn.send((selector.harvest_many(argument), top()))
+            elif command == 'next_harvests':
+                conn.send(selector.next_harvests(argument))
+            elif command == 'beehives':
+                conn.send(list(selector.honey_store))
+            else:
+                raise ValueError("Unknown command {0}.".format(command))
+        except Exception as error:
+            conn.send(ShardFailure(error, top(), len(selector.honey_store)))
+
+
+class ShardedBeehiveSelector:
+    """
+    Selector splitting its beehives over num_shards worker processes by region: a beehive goes to the shard of the
+    region_size cube containing it. Beehives are copied into the workers, so harvesting does not change the Beehive
+    objects given to add_beehive(); beehives() fetches the current copies back.
+    The emerald returned by every harvest is the same as with a single BeehiveSelector holding the same beehives, although
+    among beehives tied on emerald a different one may be harvested.
+
+    Use as a context manager, or call close(), to stop the worker processes.
+    """
+
+    def __init__(self, num_shards: int, region_size: int = 100, arity: int = 2) -> None:
+        """
+        Args:
+            num_shards : The number of worker processes
+            region_size : The side of the cubes of space whose beehives are kept in the same shard
+            arity : Passed to the BeehiveSelector of every shard, which is always growable
+            self.tops : The emerald of the best beehive of every shard, NO_BEEHIVE if the shard is empty
+            self.sizes : The number of beehives in every shard
+            self.tournament : A KeyedMaxHeap of shard numbers keyed by self.tops
+
+        Complexity:
+            Best Case = Worst Case : O(num_shards) plus starting the processes
+        """
+        if num_shards < 1:
+            raise ValueError("There should be at least one shard.")
+        self.num_shards = num_shards
+        self.region_size = region_size
+        self.connections = []
+        self.processes = []
+        for _ in range(num_shards):
+            parent_conn, child_conn = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=shard_worker, args=(child_conn, arity), daemon=True)
+            process.start()
+            child_conn.close()
+            self.connections.append(parent_conn)
+            self.processes.append(process)
+
+        self.tops = [NO_BEEHIVE] * num_shards
+        self.tournament = KeyedMaxHeap(num_shards, self.tops.__getitem__, identity=int)
+        self.tournament.extend(range(num_shards))
+        self.sizes = [0] * num_shards
+        self.length = 0
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __enter__(self) -> ShardedBeehiveSelector:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def shard_of(self, hive: Beehive) -> int:
+        """ Returns the shard holding the region of hive. """
+        size = self.region_size
+        return hash((hive.x // size, hive.y // size, hive.z // size)) % self.num_shards
+
+    def receive(self, shard: int):
+        """ Returns the next answer of shard.
+            :raises Exception: the exception raised in the worker, if the command failed there, after taking in the
+                               best emerald and size the shard was left with
+        """
+        answer = self.connections[shard].recv()
+        if isinstance(answer, ShardFailure):
+            self.set_size(shard, answer.size)
+            self.set_top(shard, answer.top)
+            raise answer.error
+        return answer
+
+    def receive_all(self, shards: Iterable[int], handle: Callable) -> None:
+        """ Reads the next answer of every shard, calling handle(shard, answer) on each, before raising the first
+            exception of a failed command, so that no answer is left behind to be read by a later command.
+        """
+        failure = None
+        for shard in shards:
+            try:
+                handle(shard, self.receive(shard))
+            except Exception as error:
+                if failure is None:
+                    failure = error
+        if failure is not None:
+            raise failure
+
+    def set_size(self, shard: int, size: int) -> None:
+        self.length += size - self.sizes[shard]
+        self.sizes[shard] = size
+
+    def set_top(self, shard: int, emerald: int) -> None:
+        self.tops[shard] = emerald
+        self.tournament.update(shard)
+
+    def set_all_beehives(self, hive_list: Iterable[Beehive]) -> None:
+        """
+        Args:
+            hive_list : Any iterable of Beehive, each copied into the shard of its region
+
+        Raises:
+            ValueError : if a shard is given a Beehive it already holds, after every shard has answered. The Beehives added
+                         before it stay in the shard and are counted in len().
+
+        Complexity:
+            Best Case = Worst Case : O(k) for k beehives, the shards heapifying in parallel
+        """
+        parts = [[] for _ in range(self.num_shards)]
+        for hive in hive_list:
+            parts[self.shard_of(hive)].append(hive)
+        sent = [shard for shard in range(self.num_shards) if parts[shard]]
+        for shard in sent:
+            self.connections[shard].send(('add', parts[shard]))
+        def added(shard: int, answer: tuple) -> None:
+            top, size = answer
+            self.set_size(shard, size)
+            self.set_top(shard, top)
+
+        self.receive_all(sent, added)
+
+    def add_beehive(self, hive: Beehive) -> None:
+        self.set_all_beehives([hive])
+
+    def harvest_best_beehive(self) -> float:
+        """
+        Harvests the best beehive over all shards, returning the emerald obtained.
+
+        Raises:
+            IndexError : when there are no beehives
+
+        Complexity:
+            Best Case = Worst Case : O(log(n) + log(s)) plus one round trip to a worker, n beehives in the shard, s shards
+        """
+        if self.length == 0:
+            raise IndexError
+        shard = self.tournament.peek_max()
+        self.connections[shard].send(('harvest', None))
+        emerald, top = self.receive(shard)
+        self.set_top(shard, top)
+        return emerald
+
+    def harvest_many(self, k: int) -> list[float]:
+        """
+        Performs k harvests, returning the emerald obtained from each, the same as calling harvest_best_beehive() k times.
+
+        Complexity:
+            Best Case = Worst Case : O(s*k*log(s*k)) in the coordinator, s shards, plus two rounds of messages
+
+        Explanation:
+            Every shard holding beehives first tells the emerald of its next k harvests ( next_harvests(), in parallel ). Since these
+            never increase, the k best over all shards are the k harvests to perform, so each shard is then told how many of them are
+            its own and harvests them in parallel. Empty shards are left out, as they have nothing to harvest.
+        """
+        if k <= 0:
+            return []
+        if self.length == 0:
+            raise IndexError
+        shards = [shard for shard in range(self.num_shards) if self.sizes[shard] > 0]
+        for shard in shards:
+            self.connections[shard].send(('next_harvests', k))
+        candidates = []
+        self.receive_all(shards, lambda shard, harvests: candidates.extend((emerald, shard) for emerald in harvests))
+        candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+
+        counts = [0] * self.num_shards
+        for emerald, shard in candidates[:k]:
+            counts[shard] += 1
+        sent = [shard for shard in range(self.num_shards) if counts[shard] > 0]
+        for shard in sent:
+            self.connections[shard].send(('harvest_many', counts[shard]))
+        self.receive_all(sent, lambda shard, answer: self.set_top(shard, answer[1]))
+        return [emerald for emerald, shard in candidates[:k]]
+
+    def beehives(self) -> list[Beehive]:
+        """ Returns copies of all beehives with their current volumes, shard by shard. """
+        for conn in self.connections:
+            conn.send(('beehives', None))
+        result = []
+        self.receive_all(range(self.num_shards), lambda shard, hives: result.extend(hives))
+        return result
+
+    def close(self) -> None:
+        """ Stops all worker processes. """
+        for conn, process in zip(self.connections, self.processes):
+            if process.is_alive():
+                conn.send(('close', None))
+                process.join()
+            conn.close()
+        self.connections = []
+        self.processes = []
@@ -0,0 +1,50 @@
+import random
+import unittest
+from ed_utils.decorators import number, visibility
+from ed_utils.timeout import timeout
+
+from array_list import ArrayList
+
+class TestArrayList(unittest.TestCase):
+
+    @timeout()
+    @number("9.1")
+    def test_append_pop_extend(self):
+        array_list = ArrayList()
+        for i in range(100):
+            array_list.append(i)
+        self.assertEqual(list(array_list), list(range(100)))
+        self.assertEqual(array_list.capacity(), 128)
+        array_list.extend(str(i) for i in range(3))
+        self.assertEqual(array_list[-1], '2')
+        self.assertEqual(array_list.pop(), '2')
+        self.assertEqual(array_list.pop(0), 0)
+        while len(array_list) > 10:
+            array_list.pop()
+        self.assertEqual(list(array_list), list(range(1, 11)))
+        self.assertLessEqual(array_list.capacity(), 4 * len(array_list))
+        array_list.clear()
+        self.assertTrue(array_list.is_empty())
+        self.assertRaises(IndexError, array_list.pop)
+        self.assertRaises(IndexError, array_list.__getitem__, 0)
+
+    @timeout()
+    @number("9.2")
+    def test_insert_delete(self):
+        random.seed(1616)
+        array_list, expected = ArrayList(), []
+        for _ in range(2000):
+            if expected and random.random() < 0.4:
+                index = random.randrange(-len(expected), len(expected))
+                self.assertEqual(array_list.delete_at_index(index), expected.pop(index))
+            else:
+                index, item = random.randint(-5, len(expected) + 5), random.randint(0, 50)
+                array_list.insert(index, item)
+                expected.insert(index, item)
+        self.assertEqual(list(array_list), expected)
+        array_list.remove(expected[3])
+        expected.remove(expected[3])
+        self.assertEqual(list(array_list), expected)
+        self.assertRaises(ValueError, array_list.remove, -1)
+        self.assertEqual(list(ArrayList.from_iterable(range(5))), [0, 1, 2, 3, 4])
+        self.assertEqual(ArrayList.from_iterable(range(5)).capacity(), 5)
@@ -0,0 +1,77 @@
+import random
+import unittest
+from ed_utils.decorators import number, visibility
+from ed_utils.timeout import timeout
+
+from avl import AVLTree
+
+class AVLTest(unittest.TestCase):
+
+    def check_node(self, current) -> int:
+        """ Checks the balance, height and subtree_size of every node, returning the height. """
+        if current is None:
+            return 0
+        left, right = self.check_node(current.left), self.check_node(current.right)
+        self.assertLessEqual(abs(left - right), 1)
+        self.assertEqual(current.height, 1 + max(left, right))
+        left_size = 0 if current.left is None else current.left.subtree_size
+        right_size = 0 if current.right is None else current.right.subtree_size
+        self.assertEqual(current.subtree_size, 1 + left_size + right_size)
+        return current.height
+
+    @timeout()
+    @number("10.1")
+    def test_sorted_insertions(self):
+        tree = AVLTree()
+        for i in range(1024):
+            tree[i] = -i
+        self.assertEqual(self.check_node(tree.root), 11)
+        self.assertEqual(tree.root.subtree_size, 1024)
+        self.assertEqual(tree[700], -700)
+        self.assertEqual(tree.kth_smallest(300, tree.root).key, 299)
+        self.assertRaises(ValueError, tree.__setitem__, 5, 0)
+        self.assertEqual(tree.root.subtree_size, 1024)
+
+    @timeout()
+    @number("10.2")
+    def test_random_operations(self):
+        random.seed(1818)
+        tree, keys = AVLTree(), set()
+        for _ in range(1500):
+            key = random.randint(0, 300)
+            if key in keys and random.random() < 0.7:
+                del tree[key]
+                keys.remove(key)
+            elif key not in keys:
+                tree[key] = str(key)
+                keys.add(key)
+        self.check_node(tree.root)
+        self.assertEqual(len(tree), len(keys))
+        for k, key in enumerate(sorted(keys), start=1):
+            self.assertEqual(tree.kth_smallest(k, tree.root).key, key)
+        self.assertRaises(ValueError, tree.__delitem__, -1)
+
+    @timeout()
+    @number("10.3")
+    def test_delete_range(self):
+        random.seed(2424)
+        tree = AVLTree()
+        for key in range(3000):
+            tree[key] = key
+        self.assertEqual(tree.delete_range(100, 2899), 2800)
+        self.check_node(tree.root)
+        self.assertEqual(list(tree), list(range(100)) + list(range(2900, 3000)))
+
+        left, right = tree.split(50, inclusive=True)
+        self.check_node(left.root)
+        self.check_node(right.root)
+        self.assertEqual((len(left), len(right)), (51, 149))
+        joined = AVLTree.join(right, AVLTree.from_sorted((key, key) for key in range(5000, 6000)))
+        self.check_node(joined.root)
+        self.assertEqual(len(joined), 1149)
+        self.assertEqual(joined.kth_smallest(150, joined.root).key, 5000)
+
+        smallest, rest = joined.detach_min(joined.root)
+        self.assertEqual(smallest.key, 51)
+        self.check_node(rest)
+        self.assertEqual((rest.subtree_size, len(joined)), (1148, 1149))
@@ -1,8 +1,11 @@
+import os
+import tempfile
+import random
 import unittest
 from ed_utils.decorators import number, visibility
 from ed_utils.timeout import timeout
 
-from beehive import BeehiveSelector, Beehive
+from beehive import BeehiveSelector, Beehive, ColumnarBeehiveSelector
 
 class TestBeehiveSelector(unittest.TestCase):
 
@@ -48,3 +51,173 @@ class TestBeehiveSelector(unittest.TestCase):
             self.assertAlmostEqual(actual, ex, 0)
 
         
+
+    @timeout()
+    @number("5.2")
+    def test_harvest_many(self):
+        hives = [
+            Beehive(15, 12, 13, capacity=40, nutrient_factor=5, volume=15),
+            Beehive(25, 22, 23, capacity=15, nutrient_factor=8, volume=40),
+            Beehive(35, 32, 33, capacity=40, nutrient_factor=3, volume=40),
+            Beehive(45, 42, 43, capacity=1, nutrient_factor=85, volume=10),
+            Beehive(55, 52, 53, capacity=400, nutrient_factor=5000, volume=0),
+        ]
+        s = BeehiveSelector(5)
+        s.set_all_beehives(hives)
+        self.assertEqual(s.harvest_many(3), [120, 120, 120])
+        self.assertEqual(s.harvest_many(12), [85] * 10 + [80, 75])
+        self.assertEqual(s.harvest_many(2), [0, 0])
+
+    @timeout()
+    @number("5.3")
+    def test_harvest_total(self):
+        random.seed(1008)
+        for days in [0, 1, 7, 50, 400, 2000]:
+            hives = [Beehive(i, i, i, capacity=random.randint(1, 20), nutrient_factor=random.randint(1, 10),
+                             volume=random.randint(0, 100)) for i in range(40)]
+            copies = [Beehive(h.x, h.y, h.z, h.capacity, h.nutrient_factor, h.volume) for h in hives]
+            fast, slow = BeehiveSelector(40), BeehiveSelector(40)
+            fast.set_all_beehives(hives)
+            slow.set_all_beehives(copies)
+
+            original = [(h.capacity, h.nutrient_factor, h.volume) for h in hives]
+            harvests = slow.harvest_many(days)
+            self.assertEqual(fast.harvest_total(days), sum(harvests))
+            # Only hives tying on the emerald of the last harvest may split those harvests differently
+            last = harvests[-1] if harvests else 0
+            tied = [last > 0 and last in (capacity * factor if volume >= capacity else 0, volume % capacity * factor)
+                    for capacity, factor, volume in original]
+            for hive, copy, is_tied in zip(hives, copies, tied):
+                if not is_tied:
+                    self.assertEqual(hive.volume, copy.volume)
+            self.assertEqual(sum(h.volume for h, t in zip(hives, tied) if t), sum(h.volume for h, t in zip(copies, tied) if t))
+            self.assertEqual(fast.harvest_many(5), slow.harvest_many(5))
+
+        # Harvests worth no emerald still drain the volume of the root, as harvest_best_beehive() does
+        for days in [1, 3, 10]:
+            hives = [Beehive(1, 1, 1, capacity=5, nutrient_factor=0, volume=20)]
+            copies = [Beehive(1, 1, 1, capacity=5, nutrient_factor=0, volume=20)]
+            fast, slow = BeehiveSelector(1), BeehiveSelector(1)
+            fast.set_all_beehives(hives)
+            slow.set_all_beehives(copies)
+            self.assertEqual(fast.harvest_total(days), sum(slow.harvest_many(days)))
+            self.assertEqual(hives[0].volume, copies[0].volume)
+
+        self.assertEqual(fast.harvest_total(-3), 0)
+        self.assertEqual(hives[0].volume, copies[0].volume)
+
+    @timeout()
+    @number("5.4")
+    def test_update_remove(self):
+        b1, b2, b3 = (
+            Beehive(15, 12, 13, capacity=40, nutrient_factor=5, volume=15),
+            Beehive(25, 22, 23, capacity=15, nutrient_factor=8, volume=40),
+            Beehive(35, 32, 33, capacity=40, nutrient_factor=3, volume=40),
+        )
+        s = BeehiveSelector(3)
+        s.set_all_beehives([b1, b2, b3])
+        b1.volume = 100
+        s.update_beehive(b1)
+        s.remove_beehive(b3)
+        self.assertEqual(s.harvest_many(3), [200, 200, 120])
+        self.assertRaises(KeyError, s.remove_beehive, b3)
+
+    @timeout()
+    @number("5.5")
+    def test_set_all_appends(self):
+        s = BeehiveSelector(1, growable=True)
+        s.add_beehive(Beehive(15, 12, 13, capacity=40, nutrient_factor=5, volume=15))
+        s.set_all_beehives(Beehive(i, i, i, capacity=1, nutrient_factor=i, volume=1) for i in range(10))
+        s.set_all_beehives([Beehive(25, 22, 23, capacity=15, nutrient_factor=8, volume=40)])
+        self.assertEqual(s.harvest_many(5), [120, 120, 80, 75, 9])
+
+    @timeout()
+    @number("5.6")
+    def test_columnar(self):
+        random.seed(6060)
+        hives = [Beehive(i, i + 1, i + 2, capacity=random.randint(1, 20), nutrient_factor=random.randint(1, 10),
+                         volume=random.randint(0, 100)) for i in range(60)]
+        copies = [Beehive(h.x, h.y, h.z, h.capacity, h.nutrient_factor, h.volume) for h in hives]
+        s, c = BeehiveSelector(60), ColumnarBeehiveSelector(60)
+        s.set_all_beehives(hives)
+        c.set_all_beehives(copies[:30])
+        for hive in copies[30:]:
+            c.add_beehive(hive)
+        self.assertEqual(c.store[5], hives[5])
+        self.assertEqual(list(c.store.money_all()), [hive.money() for hive in hives])
+
+        self.assertEqual(c.harvest_many(100), s.harvest_many(100))
+        self.assertEqual(c.harvest_total(300), s.harvest_total(300))
+        self.assertEqual(sorted(c.store.volume), sorted(hive.volume for hive in hives))
+
+        c.store.volume[7] += 1000
+        c.store.nutrient_factor[7] = 1000
+        c.update_beehive(7)
+        self.assertEqual(c.harvest_best_beehive(), c.store.capacity[7] * c.store.nutrient_factor[7])
+        c.remove_beehive(7)
+        self.assertFalse(7 in c.honey_store)
+
+        before = [c.store.money(row) for row in range(60)]
+        self.assertEqual(list(c.harvest_all()), before)
+        self.assertEqual(c.harvest_best_beehive(), max(c.store.money(row) for row in c.honey_store))
+        self.assertRaises(ValueError, c.merge, ColumnarBeehiveSelector(5))
+
+        c = ColumnarBeehiveSelector(2)
+        c.set_all_beehives([Beehive(0, 0, 0, capacity=10, nutrient_factor=5, volume=10),
+                            Beehive(1, 1, 1, capacity=5, nutrient_factor=4, volume=100)])
+        c.harvest_all()
+        self.assertEqual(c.harvest_best_beehive(), 20)
+
+    @timeout()
+    @number("5.7")
+    def test_peek_top_k(self):
+        hives = [Beehive(i, i, i, capacity=10, nutrient_factor=i, volume=5) for i in range(20)]
+        s, c = BeehiveSelector(20), ColumnarBeehiveSelector(20)
+        s.set_all_beehives(hives)
+        c.set_all_beehives(hives)
+        self.assertEqual(s.peek_top_k(3), [hives[19], hives[18], hives[17]])
+        self.assertEqual(c.peek_top_k(3), [hives[19], hives[18], hives[17]])
+        self.assertEqual(s.harvest_best_beehive(), 95)
+
+    @timeout()
+    @number("5.8")
+    def test_pairing_backend(self):
+        random.seed(8080)
+        hives = [Beehive(i, i, i, capacity=random.randint(1, 20), nutrient_factor=random.randint(1, 10),
+                         volume=random.randint(0, 100)) for i in range(50)]
+        copies = [Beehive(h.x, h.y, h.z, h.capacity, h.nutrient_factor, h.volume) for h in hives]
+        s = BeehiveSelector(50)
+        s.set_all_beehives(hives)
+        north, south = BeehiveSelector(0, backend='pairing'), BeehiveSelector(0, backend='pairing')
+        north.set_all_beehives(copies[:25])
+        south.set_all_beehives(copies[25:])
+        north.merge(south)
+        self.assertEqual(north.harvest_many(100), s.harvest_many(100))
+        self.assertEqual(north.harvest_total(200), s.harvest_total(200))
+        self.assertRaises(ValueError, BeehiveSelector, 5, backend='fibonacci')
+
+    @timeout()
+    @number("5.10")
+    def test_save_load(self):
+        random.seed(1212)
+        hives = [Beehive(i, -i, 2 * i, capacity=random.randint(1, 20), nutrient_factor=random.randint(1, 10),
+                         volume=random.randint(0, 100)) for i in range(80)]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'hives.bin')
+            for selector_class in [BeehiveSelector, ColumnarBeehiveSelector]:
+                for backend in ['array', 'pairing']:
+                    original = selector_class(80, arity=3, backend=backend)
+                    original.set_all_beehives(Beehive(h.x, h.y, h.z, h.capacity, h.nutrient_factor, h.volume) for h in hives)
+                    original.harvest_many(20)
+                    original.save(path)
+
+                    loaded = selector_class.load(path)
+                    self.assertEqual(len(loaded.honey_store), 80)
+                    if backend == 'array':
+                        self.assertEqual(loaded.honey_store.arity, 3)
+                        self.assertEqual(list(loaded.peek_top_k(80)), list(original.peek_top_k(80)))
+                    self.assertEqual(loaded.harvest_many(300), original.harvest_many(300))
+
+            with open(path, 'wb') as f:
+                f.write(b'not a snapshot')
+            self.assertRaises(ValueError, BeehiveSelector.load, path)
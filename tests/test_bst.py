@@ -77,3 +77,158 @@ class BSTTest(unittest.TestCase):
         kth = BST.kth_smallest(5, BST.root)
         self.assertEqual(kth.key, 95)
         self.assertEqual(kth.item, 1)
+
+    @timeout()
+    @number("1.4")
+    def test_deep_tree(self):
+        BST = BinarySearchTree()
+        n = 1500  # deeper than the default recursion limit
+        for i in range(n):
+            BST[i] = -i
+        self.assertEqual(BST.root.subtree_size, n)
+        self.assertRaises(ValueError, BST.__setitem__, 10, 0)
+        self.assertEqual(BST.root.subtree_size, n)
+        self.assertEqual(BST[n - 1], 1 - n)
+        self.assertEqual(BST.kth_smallest(n - 10, BST.root).key, n - 11)
+
+        del BST[0]
+        del BST[n - 1]
+        del BST[700]
+        self.assertRaises(ValueError, BST.__delitem__, 700)
+        self.assertEqual(len(BST), n - 3)
+        self.assertEqual(BST.root.subtree_size, n - 3)
+        self.assertEqual(BST.get_minimal(BST.root).key, 1)
+        self.assertEqual(BST.kth_smallest(700, BST.root).key, 701)
+        self.assertNotIn(700, BST)
+
+    @timeout()
+    @number("1.5")
+    def test_from_sorted(self):
+        BST = BinarySearchTree.from_sorted((key, str(key)) for key in range(1, 16))
+        self.assertEqual(len(BST), 15)
+        self.assertEqual(BST.root.key, 8)
+        self.assertEqual(BST.root.subtree_size, 15)
+        self.assertEqual(BST.root.left.key, 4)
+        self.assertEqual(BST.root.right.right.key, 14)
+        self.assertEqual(BST.root.right.right.right.subtree_size, 1)
+        self.assertEqual(BST.kth_smallest(11, BST.root).item, '11')
+        BST[16] = '16'
+        self.assertEqual(BST.root.subtree_size, 16)
+
+        BST = BinarySearchTree.from_iterable([(3, 'c'), (1, 'a'), (2, 'b')])
+        self.assertEqual((BST.root.key, BST.root.left.key, BST.root.right.key), (2, 1, 3))
+        self.assertTrue(BinarySearchTree.from_sorted([]).is_empty())
+        self.assertRaises(ValueError, BinarySearchTree.from_sorted, [(2, 'b'), (1, 'a')])
+        self.assertRaises(ValueError, BinarySearchTree.from_iterable, [(1, 'a'), (1, 'b')])
+
+    @timeout()
+    @number("1.6")
+    def test_order_statistics(self):
+        BST = BinarySearchTree()
+        for key in [95, 73, 99, 50, 85, 80]:
+            BST[key] = str(key)
+        self.assertEqual(BST.rank(50), 0)
+        self.assertEqual(BST.rank(85), 3)
+        self.assertEqual(BST.rank(85, inclusive=True), 4)
+        self.assertEqual(BST.rank(90), 4)
+        self.assertEqual(BST.rank(100), 6)
+        self.assertEqual(BST.count_in_range(73, 95), 4)
+        self.assertEqual(BST.count_in_range(74, 94), 2)
+        self.assertEqual(BST.count_in_range(95, 73), 0)
+        self.assertEqual([BST.select(i).key for i in range(6)], [50, 73, 80, 85, 95, 99])
+        self.assertRaises(IndexError, BST.select, 6)
+
+        self.assertEqual(BST.floor(84).key, 80)
+        self.assertEqual(BST.floor(85).key, 85)
+        self.assertIsNone(BST.floor(49))
+        self.assertEqual(BST.ceiling(81).key, 85)
+        self.assertEqual(BST.ceiling(99).key, 99)
+        self.assertIsNone(BST.ceiling(100))
+        self.assertEqual(BST.predecessor(85).key, 80)
+        self.assertIsNone(BST.predecessor(50))
+        self.assertEqual(BST.successor(85).key, 95)
+        self.assertEqual(BST.successor(0).key, 50)
+        self.assertIsNone(BST.successor(99))
+
+    @timeout()
+    @number("1.7")
+    def test_iteration(self):
+        BST = BinarySearchTree()
+        for key in [95, 73, 99, 50, 85, 80]:
+            BST[key] = str(key)
+        self.assertEqual(list(BST), [50, 73, 80, 85, 95, 99])
+        self.assertEqual(list(reversed(BST)), [99, 95, 85, 80, 73, 50])
+        self.assertEqual(list(BST.keys(74, 95)), [80, 85, 95])
+        self.assertEqual(list(BST.keys(hi=79)), [50, 73])
+        self.assertEqual(list(BST.items(80, reverse=True)), [(99, '99'), (95, '95'), (85, '85'), (80, '80')])
+        self.assertEqual(list(BST.keys(96, 98)), [])
+
+        deep = BinarySearchTree()
+        for key in range(1500):
+            deep[key] = key
+        iterator = deep.keys(lo=10)
+        self.assertEqual([next(iterator) for _ in range(3)], [10, 11, 12])
+        self.assertEqual(sum(1 for _ in reversed(deep)), 1500)
+
+    @timeout()
+    @number("1.8")
+    def test_set_mode(self):
+        BST = BinarySearchTree(set_mode=True)
+        for key in [95, 73, 99, 50, 85, 80]:
+            BST[key] = key
+        self.assertFalse(hasattr(BST.root, '__dict__'))
+        self.assertNotIn('item', type(BST.root).__slots__)
+        self.assertEqual(BST[85], 85)
+        self.assertEqual(list(BST.items(80, 95)), [(80, 80), (85, 85), (95, 95)])
+        self.assertRaises(ValueError, BST.__setitem__, 10, 'ten')
+        del BST[73]
+        self.assertEqual(BST.root.left.key, 80)
+        self.assertEqual(BST.root.left.item, 80)
+        self.assertEqual(BST.root.subtree_size, 5)
+        self.assertEqual(BST.kth_smallest(2, BST.root).key, 80)
+        self.assertFalse(hasattr(BinarySearchTree().node_class(1, 2), '__dict__'))
+
+    @timeout()
+    @number("1.9")
+    def test_split_join(self):
+        BST = BinarySearchTree()
+        for key in [95, 73, 99, 50, 85, 80, 60, 97]:
+            BST[key] = str(key)
+        left, right = BST.split(85)
+        self.assertTrue(BST.is_empty())
+        self.assertEqual(list(left), [50, 60, 73, 80])
+        self.assertEqual(list(right), [85, 95, 97, 99])
+        self.assertEqual((len(left), left.root.subtree_size, len(right), right.root.subtree_size), (4, 4, 4, 4))
+        self.assertEqual(right[85], '85')
+
+        joined = BinarySearchTree.join(left, right)
+        self.assertEqual(list(joined.items(80, 85)), [(80, '80'), (85, '85')])
+        self.assertEqual(joined.root.subtree_size, 8)
+        self.assertTrue(left.is_empty())
+
+        self.assertEqual(joined.delete_range(61, 95), 4)
+        self.assertEqual(list(joined), [50, 60, 97, 99])
+        self.assertEqual(len(joined), 4)
+        self.assertEqual(joined.root.subtree_size, 4)
+        self.assertEqual(joined.kth_smallest(3, joined.root).key, 97)
+        self.assertEqual(joined.delete_range(100, 200), 0)
+
+    @timeout()
+    @number("1.10")
+    def test_get_contains(self):
+        BST = BinarySearchTree()
+        for key in [95, 73, 99, 50, 85, 80]:
+            BST[key] = str(key)
+        self.assertEqual(BST.get(85), '85')
+        self.assertIsNone(BST.get(86))
+        self.assertEqual(BST.get(86, 'missing'), 'missing')
+        self.assertTrue(BST.contains(50))
+        self.assertFalse(BST.contains(51))
+        self.assertNotIn(100, BST)
+
+        del BST[73]  # two children: replaced by its successor 80
+        self.assertEqual((BST.root.left.key, BST.root.left.item), (80, '80'))
+        self.assertEqual(BST.root.left.subtree_size, 3)
+        self.assertEqual(BST.root.subtree_size, 5)
+        self.assertRaises(ValueError, BST.__delitem__, 73)
+        self.assertEqual(BST.root.subtree_size, 5)
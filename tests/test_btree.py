@@ -0,0 +1,78 @@
+import random
+import unittest
+from ed_utils.decorators import number, visibility
+from ed_utils.timeout import timeout
+
+from btree import BTree
+
+class BTreeTest(unittest.TestCase):
+
+    def check_node(self, tree, current, is_root=True) -> tuple[int, int]:
+        """ Checks the number of keys, order and subtree_size of every node, returning (size, height). """
+        if not is_root:
+            self.assertGreaterEqual(len(current.keys), tree.t - 1)
+        self.assertLessEqual(len(current.keys), 2 * tree.t - 1)
+        self.assertEqual(current.keys, sorted(current.keys))
+        size, heights = len(current.keys), set()
+        for child in current.children:
+            child_size, child_height = self.check_node(tree, child, False)
+            size += child_size
+            heights.add(child_height)
+        self.assertLessEqual(len(heights), 1)
+        self.assertEqual(current.subtree_size, size)
+        return size, 1 + max(heights, default=0)
+
+    @timeout()
+    @number("11.1")
+    def test_map_operations(self):
+        random.seed(2323)
+        for t in [2, 3, 16]:
+            tree, expected = BTree(t=t), {}
+            for _ in range(1500):
+                key = random.randint(0, 400)
+                if key in expected and random.random() < 0.6:
+                    del tree[key]
+                    del expected[key]
+                elif key not in expected:
+                    tree[key] = str(key)
+                    expected[key] = str(key)
+            self.assertEqual(len(tree), len(expected))
+            self.check_node(tree, tree.root)
+            keys = sorted(expected)
+            self.assertEqual(list(tree), keys)
+            self.assertEqual(list(reversed(tree)), keys[::-1])
+            for k, key in enumerate(keys, start=1):
+                self.assertEqual(tree.kth_smallest(k, tree.root).key, key)
+                self.assertEqual(tree[key], expected[key])
+            self.assertEqual(list(tree.keys(100, 200)), [key for key in keys if 100 <= key <= 200])
+            self.assertEqual(tree.count_in_range(100, 200), len([key for key in keys if 100 <= key <= 200]))
+            self.assertEqual(tree.rank(250), len([key for key in keys if key < 250]))
+            self.assertRaises(KeyError, tree.__getitem__, 1000)
+            self.assertRaises(ValueError, tree.__delitem__, 1000)
+            self.assertRaises(ValueError, tree.__setitem__, keys[0], 'again')
+
+    @timeout()
+    @number("11.2")
+    def test_from_sorted(self):
+        tree = BTree.from_sorted(((key, -key) for key in range(10000)), t=8)
+        size, height = self.check_node(tree, tree.root)
+        self.assertEqual(size, 10000)
+        self.assertLessEqual(height, 5)
+        self.assertEqual(tree.kth_smallest(5000).item, -4999)
+        tree[10000] = -10000
+        del tree[0]
+        self.check_node(tree, tree.root)
+        self.assertEqual(tree.select(0).key, 1)
+        self.assertTrue(BTree.from_sorted([]).is_empty())
+        self.assertRaises(ValueError, BTree.from_sorted, [(2, 'b'), (1, 'a')])
+
+    @timeout()
+    @number("11.3")
+    def test_get_contains(self):
+        tree = BTree.from_sorted(((key, str(key)) for key in range(0, 200, 2)), t=3)
+        self.assertEqual(tree.get(100), '100')
+        self.assertEqual(tree.get(101, 'missing'), 'missing')
+        self.assertIsNone(tree.get(-2))
+        self.assertTrue(tree.contains(198))
+        self.assertFalse(tree.contains(199))
+        self.assertNotIn(1, tree)
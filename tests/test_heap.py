@@ -0,0 +1,200 @@
+import random
+from ctypes import c_int64
+import unittest
+from ed_utils.decorators import number, visibility
+from ed_utils.timeout import timeout
+
+from heap import MaxHeap, IndexedMaxHeap, KeyedMaxHeap, RowMaxHeap
+
+class TestMaxHeap(unittest.TestCase):
+
+    @timeout()
+    @number("6.1")
+    def test_growable(self):
+        random.seed(1008)
+        items = [random.randint(0, 1000) for _ in range(200)]
+
+        fixed = MaxHeap(2)
+        fixed.add(1)
+        fixed.add(2)
+        self.assertRaises(IndexError, fixed.add, 3)
+
+        heap = MaxHeap(1, growable=True, shrinkable=True)
+        for item in items:
+            heap.add(item)
+        self.assertEqual(len(heap), 200)
+        self.assertEqual(heap.capacity(), 256)
+
+        result = [heap.get_max() for _ in range(len(items))]
+        self.assertEqual(result, sorted(items, reverse=True))
+        self.assertEqual(heap.capacity(), MaxHeap.MIN_CAPACITY)
+
+    @timeout()
+    @number("6.2")
+    def test_replace_and_push_pop(self):
+        heap = MaxHeap(5)
+        for item in [5, 3, 8, 1]:
+            heap.add(item)
+        self.assertEqual(heap.peek_max(), 8)
+        self.assertEqual(heap.replace_max(2), 8)
+        self.assertEqual(heap.push_pop(9), 9)
+        self.assertEqual(heap.push_pop(4), 5)
+        self.assertEqual(len(heap), 4)
+        self.assertEqual([heap.get_max() for _ in range(4)], [4, 3, 2, 1])
+        self.assertRaises(IndexError, heap.replace_max, 1)
+
+    @timeout()
+    @number("6.3")
+    def test_indexed(self):
+        random.seed(2938)
+        heap = IndexedMaxHeap(4, growable=True)
+        boxes = [[random.randint(0, 100)] for _ in range(50)]
+        for box in boxes:
+            heap.add(box)
+        self.assertRaises(ValueError, heap.add, boxes[0])
+
+        for box in boxes[:10]:
+            box[0] = random.randint(0, 100)
+            heap.update(box)
+        for box in boxes[10:20]:
+            heap.remove(box)
+        self.assertFalse(heap.contains(boxes[15]))
+        self.assertTrue(boxes[25] in heap)
+        self.assertRaises(KeyError, heap.remove, boxes[15])
+
+        remaining = boxes[:10] + boxes[20:]
+        for k in range(1, len(heap) + 1):
+            self.assertEqual(heap.index_of(heap.the_array[k]), k)
+        result = [heap.get_max()[0] for _ in range(len(heap))]
+        self.assertEqual(result, sorted((box[0] for box in remaining), reverse=True))
+
+    @timeout()
+    @number("6.4")
+    def test_keyed(self):
+        random.seed(9182)
+        calls = []
+        def key(box):
+            calls.append(box)
+            return -box[0]
+
+        heap = KeyedMaxHeap(4, key, growable=True)
+        boxes = [[random.randint(0, 100)] for _ in range(30)]
+        heap.ensure_capacity(20)
+        heap.length = 20
+        heap.heapify(boxes[:20])
+        for box in boxes[20:]:
+            heap.add(box)
+        self.assertEqual(len(calls), 30)
+
+        boxes[3][0] = -1
+        heap.update(boxes[3])
+        heap.remove(boxes[4])
+        self.assertIs(heap.get_max(), boxes[3])
+        result = [heap.get_max()[0] for _ in range(len(heap))]
+        remaining = boxes[:3] + boxes[5:]
+        self.assertEqual(result, sorted(box[0] for box in remaining))
+
+    @timeout()
+    @number("6.5")
+    def test_arity(self):
+        random.seed(4242)
+        items = [random.randint(0, 50) for _ in range(300)]
+        for arity in [2, 3, 4, 8]:
+            heaps = [MaxHeap(300, arity=arity), IndexedMaxHeap(300, arity=arity),
+                     KeyedMaxHeap(300, lambda box: box[0], arity=arity)]
+            for heap in heaps:
+                heap.length = 150
+                heap.heapify([[item] for item in items[:150]])
+                for item in items[150:]:
+                    heap.add([item])
+                result = [heap.get_max()[0] for _ in range(len(items))]
+                self.assertEqual(result, sorted(items, reverse=True))
+        self.assertRaises(ValueError, MaxHeap, 5, arity=1)
+
+    @timeout()
+    @number("6.6")
+    def test_extend(self):
+        random.seed(5150)
+        for arity in [2, 4]:
+            for size in [0, 1, 5, 100]:
+                items = [random.randint(0, 1000) for _ in range(size)]
+                more = [random.randint(0, 1000) for _ in range(77)]
+                heaps = [MaxHeap(1, growable=True, arity=arity), IndexedMaxHeap(1, growable=True, arity=arity),
+                         KeyedMaxHeap(1, lambda box: box[0], growable=True, arity=arity)]
+                for heap in heaps:
+                    heap.extend([item] for item in items)
+                    heap.extend([item] for item in more)
+                    result = [heap.get_max()[0] for _ in range(len(heap))]
+                    self.assertEqual(result, sorted(items + more, reverse=True))
+
+        self.assertRaises(IndexError, MaxHeap(3).extend, [1, 2, 3, 4])
+
+        # A duplicate stops the extension, leaving the elements before it in a valid heap
+        boxes = [[3], [8], [5]]
+        heap = KeyedMaxHeap(5, lambda box: box[0])
+        self.assertRaises(ValueError, heap.extend, [boxes[0], boxes[1], boxes[0], boxes[2]])
+        self.assertEqual(len(heap), 2)
+        self.assertEqual([heap.get_max() for _ in range(2)], [[8], [3]])
+
+        # A key that cannot be computed leaves no trace of the element
+        values = [4]
+        heap = KeyedMaxHeap(2, values.__getitem__, identity=int)
+        self.assertRaises(IndexError, heap.extend, [5])
+        self.assertRaises(IndexError, heap.add, 5)
+        self.assertFalse(5 in heap)
+        heap.add(0)
+        self.assertEqual(len(heap), 1)
+
+    @timeout()
+    @number("6.7")
+    def test_peek_top_k(self):
+        random.seed(777)
+        items = [random.randint(0, 1000) for _ in range(200)]
+        for arity in [2, 3]:
+            heaps = [MaxHeap(200, arity=arity), KeyedMaxHeap(200, lambda box: box[0], arity=arity)]
+            for heap in heaps:
+                heap.extend([item] for item in items)
+                before = [heap.the_array[i] for i in range(1, len(heap) + 1)]
+                for k in [0, 1, 10, 200, 500]:
+                    top = [box[0] for box in heap.peek_top_k(k)]
+                    self.assertEqual(top, sorted(items, reverse=True)[:k])
+                self.assertEqual([heap.the_array[i] for i in range(1, len(heap) + 1)], before)
+
+    @timeout()
+    @number("6.8")
+    def test_typed_keys(self):
+        random.seed(808)
+        items = [[random.randint(-10 ** 12, 10 ** 12)] for _ in range(300)]
+        heap = KeyedMaxHeap(4, lambda box: box[0], growable=True, shrinkable=True, key_ctype=c_int64)
+        for item in items:
+            heap.add(item)
+        self.assertEqual(heap.keys.memoryview().format, 'q')
+        for item in items[:100]:
+            heap.remove(item)
+        items[100][0] = 10 ** 13
+        heap.update(items[100])
+        result = [heap.get_max()[0] for _ in range(len(heap))]
+        self.assertEqual(result, sorted((item[0] for item in items[100:]), reverse=True))
+
+    @timeout()
+    @number("6.9")
+    def test_row_heap(self):
+        random.seed(909)
+        values = [random.randint(-10 ** 12, 10 ** 12) for _ in range(500)]
+        heap = RowMaxHeap(4, values.__getitem__, growable=True, shrinkable=True, arity=3)
+        heap.extend(range(0, 500, 2))
+        for row in range(1, 500, 2):
+            heap.add(row)
+        self.assertEqual(heap.the_array.memoryview().format, 'q')
+        self.assertTrue(499 in heap)
+        self.assertRaises(ValueError, heap.add, 499)
+        for row in range(100):
+            heap.remove(row)
+        self.assertFalse(0 in heap)
+        self.assertRaises(KeyError, heap.remove, 0)
+        values[300] = 10 ** 13
+        heap.update(300)
+        self.assertEqual(heap.replace_max(300), 300)
+        self.assertEqual(heap.peek_max(), 300)
+        result = [values[heap.get_max()] for _ in range(len(heap))]
+        self.assertEqual(result, sorted(values[100:], reverse=True))
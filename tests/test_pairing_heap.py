@@ -0,0 +1,44 @@
+import random
+import unittest
+from ed_utils.decorators import number, visibility
+from ed_utils.timeout import timeout
+
+from pairing_heap import PairingHeap
+
+class TestPairingHeap(unittest.TestCase):
+
+    @timeout()
+    @number("7.1")
+    def test_add_get_max(self):
+        random.seed(1010)
+        items = [random.randint(0, 1000) for _ in range(300)]
+        heap = PairingHeap()
+        heap.extend([item] for item in items)
+        self.assertEqual(len(heap), 300)
+        self.assertEqual([box[0] for box in heap.peek_top_k(20)], sorted(items, reverse=True)[:20])
+        result = [heap.get_max()[0] for _ in range(len(items))]
+        self.assertEqual(result, sorted(items, reverse=True))
+        self.assertRaises(IndexError, heap.get_max)
+
+    @timeout()
+    @number("7.2")
+    def test_update_remove_merge(self):
+        random.seed(2020)
+        a, b = PairingHeap(key=lambda box: box[0]), PairingHeap(key=lambda box: box[0])
+        boxes = [[random.randint(0, 100)] for _ in range(100)]
+        a.extend(boxes[:60])
+        b.extend(boxes[60:])
+        for box in boxes[50:70]:
+            box[0] = random.randint(-50, 150)
+            (a if box in a else b).update(box)
+        a.remove(boxes[3])
+        b.remove(boxes[90])
+        self.assertRaises(KeyError, a.remove, boxes[3])
+        self.assertEqual(a.replace_max(a.peek_max()), a.peek_max())
+
+        a.merge(b)
+        self.assertEqual(len(b), 0)
+        self.assertEqual(len(a), 98)
+        remaining = [box for i, box in enumerate(boxes) if i not in (3, 90)]
+        result = [a.get_max()[0] for _ in range(len(a))]
+        self.assertEqual(result, sorted((box[0] for box in remaining), reverse=True))
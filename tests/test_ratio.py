@@ -39,4 +39,64 @@ class RatioTest(unittest.TestCase):
 
         p.remove_point(82)
         res = p.ratio(13, 10)
-        self.assertSetEqual(set(res), {14, 15, 16, 87, 91})
\ No newline at end of file
+        self.assertSetEqual(set(res), {14, 15, 16, 87, 91})
+
+    @timeout()
+    @number("2.3")
+    def test_sorted_points(self):
+        p = Percentiles()
+        for point in range(5000):
+            p.add_point(point)
+        self.assertLess(p.bsearch.root.height, 20)
+        self.assertEqual(p.ratio(10, 20), list(range(500, 4000)))
+        unbalanced = Percentiles('bst')
+        for point in [4, 9, 14, 15, 16, 82, 87, 91, 92, 99]:
+            unbalanced.add_point(point)
+        self.assertEqual(unbalanced.ratio(13, 10), [14, 15, 16, 82, 87, 91, 92])
+        self.assertRaises(ValueError, Percentiles, 'splay')
+
+    @timeout()
+    @number("2.4")
+    def test_counts(self):
+        p = Percentiles.from_points([4, 9, 14, 15, 16, 82, 87, 91, 92, 99])
+        for x, y in [(13, 10), (0, 42), (0, 0), (30, 30), (90, 0)]:
+            self.assertEqual(p.ratio_count(x, y), len(p.ratio(x, y)))
+        self.assertEqual(p.ratio_count(60, 60), 0)
+        self.assertEqual(p.count_in_range(10, 90), 5)
+        self.assertEqual(p.count_in_range(4, 99), 10)
+
+    @timeout()
+    @number("2.5")
+    def test_ratio_iter(self):
+        p = Percentiles.from_points(range(1000))
+        for x, y in [(13, 10), (0, 0), (30, 30), (90, 0), (60, 60)]:
+            self.assertEqual(list(p.ratio_iter(x, y)), p.ratio(x, y) if p.ratio_count(x, y) else [])
+        iterator = p.ratio_iter(25, 25)
+        self.assertEqual(next(iterator), 250)
+        self.assertEqual(next(iterator), 251)
+
+    @timeout()
+    @number("2.6")
+    def test_backends(self):
+        random.seed(98765)
+        points = random.sample(range(100000), 2000)
+        results = []
+        for backend in ['avl', 'bst', 'btree']:
+            p = Percentiles(backend)
+            for point in points:
+                p.add_point(point)
+            for point in points[:500]:
+                p.remove_point(point)
+            results.append((p.ratio(12.5, 30), p.ratio_count(12.5, 30), p.count_in_range(2000, 70000)))
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(results[0], results[2])
+        self.assertEqual(results[0][0], sorted(points[500:])[188:1050])
+
+    @timeout()
+    @number("2.7")
+    def test_remove_range(self):
+        for backend in ['avl', 'bst', 'btree']:
+            p = Percentiles.from_points(range(0, 1000, 2), backend)
+            self.assertEqual(p.remove_range(101, 499), 199)
+            self.assertEqual(p.count_in_range(0, 1000), 301)
+            self.assertEqual(p.ratio(0, 90), list(range(0, 60, 2)))
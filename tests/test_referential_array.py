@@ -0,0 +1,78 @@
+import sys
+import unittest
+from ed_utils.decorators import number, visibility
+from ed_utils.timeout import timeout
+
+from referential_array import ArrayR
+
+class TestArrayR(unittest.TestCase):
+
+    @timeout()
+    @number("8.1")
+    def test_slices_and_iteration(self):
+        array = ArrayR.from_iterable(range(10))
+        self.assertEqual(len(array), 10)
+        self.assertEqual(list(array), list(range(10)))
+        self.assertEqual(list(array[2:5]), [2, 3, 4])
+        array[0:3] = ['a', 'b', 'c']
+        self.assertEqual(list(array[:4]), ['a', 'b', 'c', 3])
+        self.assertRaises(ValueError, ArrayR.from_iterable, [])
+
+        window = array.window(3, 7)
+        self.assertEqual(list(window), [3, 4, 5, 6])
+        window[0] = 'w'
+        self.assertEqual(array[3], 'w')
+        array[6] = 'z'
+        self.assertEqual(window[3], 'z')
+        self.assertRaises(IndexError, array.window, 5, 11)
+
+        self.assertEqual(len(array[2:2]), 0)
+        self.assertEqual(list(array[5:2]), [])
+        self.assertEqual(list(array.window(0, 3)[::-1]), ['c', 'b', 'a'])
+        self.assertEqual(list(window[::-2]), ['z', 4])
+        self.assertEqual(list(window[1:1]), [])
+        self.assertEqual(list(ArrayR.of_int64(4)[3:1]), [])
+
+    @timeout()
+    @number("8.2")
+    def test_copy_into(self):
+        copied, overwritten = object(), object()
+        source = ArrayR.from_iterable([copied] * 4)
+        target = ArrayR.from_iterable([overwritten] * 6)
+        copied_refs, overwritten_refs = sys.getrefcount(copied), sys.getrefcount(overwritten)
+
+        source.copy_into(target, 1, 2, 3)
+        self.assertEqual([x is copied for x in target], [False, False, True, True, True, False])
+        self.assertEqual(sys.getrefcount(copied), copied_refs + 3)
+        self.assertEqual(sys.getrefcount(overwritten), overwritten_refs - 3)
+
+        numbers = ArrayR.from_iterable(range(8))
+        numbers.copy_into(numbers, 0, 2, 5)
+        self.assertEqual(list(numbers), [0, 1, 0, 1, 2, 3, 4, 7])
+        self.assertRaises(IndexError, numbers.copy_into, target, 5, 0, 4)
+
+    @timeout()
+    @number("8.3")
+    def test_typed_arrays(self):
+        integers = ArrayR.of_int64(6)
+        self.assertEqual(list(integers), [0] * 6)
+        integers[1:4] = [5, -7, 2 ** 62]
+        self.assertEqual(list(integers[1:4]), [5, -7, 2 ** 62])
+        self.assertEqual(integers[1:4].ctype, integers.ctype)
+
+        view = integers.memoryview()
+        self.assertEqual(view.format, 'q')
+        self.assertEqual(view.tolist(), [0, 5, -7, 2 ** 62, 0, 0])
+        view[5] = 9
+        self.assertEqual(integers[5], 9)
+        self.assertEqual(integers.window(2, 5).memoryview().tolist(), [-7, 2 ** 62, 0])
+
+        copy = ArrayR.of_int64(6)
+        integers.copy_into(copy, 1, 0, 5)
+        self.assertEqual(list(copy), [5, -7, 2 ** 62, 0, 9, 0])
+
+        floats = ArrayR.of_float64(3)
+        floats[2] = 0.5
+        self.assertEqual(floats.memoryview().tolist(), [0.0, 0.0, 0.5])
+        self.assertRaises(TypeError, integers.copy_into, floats, 0, 0, 1)
+        self.assertRaises(TypeError, ArrayR(3).memoryview)
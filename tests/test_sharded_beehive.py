@@ -0,0 +1,51 @@
+import random
+import unittest
+from ed_utils.decorators import number, visibility
+from ed_utils.timeout import timeout
+
+from beehive import BeehiveSelector, Beehive
+from sharded_beehive import ShardedBeehiveSelector
+
+class TestShardedBeehiveSelector(unittest.TestCase):
+
+    @timeout(10)
+    @number("5.9")
+    def test_same_as_single(self):
+        random.seed(9090)
+        hives = [Beehive(random.randint(0, 300), random.randint(0, 300), random.randint(0, 300),
+                         capacity=random.randint(1, 20), nutrient_factor=random.randint(1, 10),
+                         volume=random.randint(0, 100)) for _ in range(200)]
+        single = BeehiveSelector(200)
+        single.set_all_beehives([Beehive(h.x, h.y, h.z, h.capacity, h.nutrient_factor, h.volume) for h in hives])
+
+        with ShardedBeehiveSelector(3, region_size=100) as sharded:
+            sharded.set_all_beehives(hives[:150])
+            for hive in hives[150:]:
+                sharded.add_beehive(hive)
+            self.assertEqual(len(sharded), 200)
+
+            expected = [single.harvest_best_beehive() for _ in range(50)] + single.harvest_many(600)
+            actual = [sharded.harvest_best_beehive() for _ in range(50)] + sharded.harvest_many(600)
+            self.assertEqual(actual, expected)
+            self.assertEqual(len(sharded.beehives()), 200)
+            self.assertEqual(sharded.harvest_many(2000), single.harvest_many(2000))
+
+    @timeout(10)
+    @number("5.11")
+    def test_empty_shards(self):
+        with ShardedBeehiveSelector(4) as sharded:
+            sharded.add_beehive(Beehive(1, 1, 1, capacity=5, nutrient_factor=2, volume=10))
+            self.assertEqual(sharded.harvest_many(5), [10, 10, 0, 0, 0])
+            self.assertEqual(sharded.harvest_best_beehive(), 0)
+            self.assertEqual(len(sharded.beehives()), 1)
+
+    @timeout(10)
+    @number("5.12")
+    def test_failed_add(self):
+        with ShardedBeehiveSelector(2, region_size=1) as sharded:
+            hives = [Beehive(x, 0, 0, capacity=10, nutrient_factor=x, volume=10) for x in range(1, 6)]
+            twice = hives[0]
+            self.assertRaises(ValueError, sharded.set_all_beehives, [Beehive(1000, 0, 0, 10, 1000, 10)] + hives + [twice])
+            self.assertEqual(len(sharded), 6)
+            self.assertEqual(sharded.harvest_best_beehive(), 10000)
+            self.assertEqual(sharded.harvest_many(5), [50, 40, 30, 20, 10])